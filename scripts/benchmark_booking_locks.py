@@ -0,0 +1,59 @@
+"""
+Booking throughput with per-flight locks vs. a single global lock.
+
+Worker threads take seats on randomly chosen flights through `FlightOverlay.take_seats`, the step of `book_flights`
+that checks and decrements seat counters. Each run uses a fresh overlay whose fares have enough seats for every
+attempt, so all bookings succeed and only the locking differs. A global lock is a `FlightLocks` with one stripe.
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from airline_agent.inventory.locks import NUM_FLIGHT_LOCK_STRIPES, FlightLocks
+from airline_agent.inventory.overlay import FlightOverlay
+from airline_agent.types.booking import Fare
+
+
+def run(locks: FlightLocks, num_threads: int, bookings_per_thread: int, num_flights: int, legs: int) -> float:
+    """Bookings per second."""
+    overlay = FlightOverlay(locks)
+    fares = [(f"F{idx}", Fare(price_total=100.0, seats_available=10**9)) for idx in range(num_flights)]
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)  # noqa: S311
+        barrier.wait()
+        for _ in range(bookings_per_thread):
+            if not overlay.take_seats(rng.sample(fares, legs)):
+                msg = "booking failed"
+                raise RuntimeError(msg)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return num_threads * bookings_per_thread / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark booking throughput: per-flight vs. global lock")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16], help="worker thread counts")
+    parser.add_argument("--bookings", type=int, default=5000, help="bookings per thread")
+    parser.add_argument("--flights", type=int, default=64, help="number of flights booked")
+    parser.add_argument("--legs", type=int, default=2, help="flights per booking")
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'global (/s)':>14} {'per-flight (/s)':>16} {'ratio':>7}")
+    for num_threads in args.threads:
+        global_rate = run(FlightLocks(stripes=1), num_threads, args.bookings, args.flights, args.legs)
+        striped_rate = run(FlightLocks(NUM_FLIGHT_LOCK_STRIPES), num_threads, args.bookings, args.flights, args.legs)
+        print(f"{num_threads:>8} {global_rate:>14,.0f} {striped_rate:>16,.0f} {striped_rate / global_rate:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
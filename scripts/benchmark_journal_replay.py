@@ -0,0 +1,87 @@
+"""
+Restore time of the journaled reservation store after a busy day.
+
+A day of bookings is written to a `JournalReservationStore`: each booking is made, gets a checked bag and is checked
+in, and one in `--hold-every` starts as a hold that is then confirmed. The store is then reopened, which loads the
+latest snapshot and replays the journal after it, and the whole journal is replayed with `replay_journal` for
+comparison, as when reproducing the state at an earlier entry.
+"""
+
+import argparse
+import dataclasses
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from airline_agent.reservations.journal import JOURNAL_FILE, SNAPSHOT_INTERVAL, JournalReservationStore, replay_journal
+from airline_agent.reservations.records import AddOnRecord, BookingRecord
+from airline_agent.tools.booking import BookingTools
+
+
+def sample_booking() -> BookingRecord:
+    tools = BookingTools()
+    flight_ids = [
+        tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id,
+        tools.search_flights("JFK", "SFO", "2025-11-19").flights[0].id,
+    ]
+    return BookingRecord.from_model(tools.book_flights(flight_ids, "economy"))
+
+
+def write_day(store: JournalReservationStore, booking: BookingRecord, num_bookings: int, hold_every: int) -> None:
+    for idx in range(num_bookings):
+        session_id = f"session-{idx // 4}"
+        now = booking.created_at + timedelta(seconds=idx)
+        held = idx % hold_every == 0
+        record = dataclasses.replace(
+            booking,
+            booking_id=f"BK-{idx:08X}",
+            flights=[dataclasses.replace(flight_booking, add_ons=[]) for flight_booking in booking.flights],
+            status="pending" if held else "confirmed",
+            created_at=now,
+            updated_at=now,
+            hold_expires_at=now + timedelta(minutes=15) if held else None,
+        )
+        store.save(session_id, record)
+        if held:
+            record.status, record.hold_expires_at = "confirmed", None
+            store.save(session_id, record)
+        record.flights[0].add_ons.append(AddOnRecord("checked_bag", 35.0, "USD", now))
+        store.save(session_id, record)
+        record.flights[0].checked_in, record.flights[0].checked_in_at = True, now
+        record.flights[0].seat_assignment = "12C"
+        store.save(session_id, record)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure how long the reservation journal takes to restore")
+    parser.add_argument("--bookings", type=int, default=20000, help="bookings made during the day")
+    parser.add_argument("--hold-every", type=int, default=5, help="one booking in this many starts as a hold")
+    parser.add_argument("--snapshot-interval", type=int, default=SNAPSHOT_INTERVAL, help="entries between snapshots")
+    parser.add_argument("--dir", type=Path, default=None, help="parent directory for the journal (default: temporary)")
+    args = parser.parse_args()
+
+    booking = sample_booking()
+    with tempfile.TemporaryDirectory(dir=args.dir) as path:
+        store = JournalReservationStore(Path(path), args.snapshot_interval)
+        start = time.perf_counter()
+        write_day(store, booking, args.bookings, args.hold_every)
+        elapsed = time.perf_counter() - start
+        num_entries = store.seq
+        store.close()
+        size = (Path(path) / JOURNAL_FILE).stat().st_size
+        print(f"{args.bookings:,} bookings, {num_entries:,} journal entries, {size / 2**20:.1f} MiB")
+        print(f"{'writing the day':<34} {elapsed * 1e6 / num_entries:>8.1f} us/entry, {size / num_entries:.0f} B/entry")
+
+        start = time.perf_counter()
+        store = JournalReservationStore(Path(path), args.snapshot_interval)
+        print(f"{'open (snapshot + tail)':<34} {(time.perf_counter() - start) * 1e3:>8.1f} ms")
+        store.close()
+
+        start = time.perf_counter()
+        replay_journal(Path(path))
+        print(f"{'replay the whole journal':<34} {(time.perf_counter() - start) * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
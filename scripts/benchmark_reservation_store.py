@@ -0,0 +1,85 @@
+"""
+Load test for reservation stores: sustained booking writes per second.
+
+Worker threads save bookings as fast as they can, each into its own booking session, and the rate at which `save`
+calls return is reported. Every SQLite `save` only returns once its transaction is durable, so the rate is bounded by
+how many commits the disk can sync; group commit lets concurrent writers share a commit. Running the SQLite store with
+a group commit size of 1 shows the rate without it.
+"""
+
+import argparse
+import dataclasses
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from airline_agent.reservations.journal import JournalReservationStore
+from airline_agent.reservations.records import BookingRecord
+from airline_agent.reservations.sqlite import MAX_GROUP_COMMIT_SIZE, SqliteReservationStore
+from airline_agent.reservations.store import InMemoryReservationStore, ReservationStore
+from airline_agent.tools.booking import BookingTools
+
+STORES = ["memory", "sqlite (no group commit)", "sqlite (group commit)", "journal"]
+
+
+def sample_booking() -> BookingRecord:
+    tools = BookingTools()
+    flight_ids = [
+        tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id,
+        tools.search_flights("JFK", "SFO", "2025-11-19").flights[0].id,
+    ]
+    return BookingRecord.from_model(tools.book_flights(flight_ids, "economy"))
+
+
+def make_store(name: str, path: Path) -> ReservationStore:
+    if name == "memory":
+        return InMemoryReservationStore()
+    if name == "journal":
+        return JournalReservationStore(path)
+    group_commit_size = 1 if name == "sqlite (no group commit)" else MAX_GROUP_COMMIT_SIZE
+    return SqliteReservationStore(path, max_group_commit_size=group_commit_size)
+
+
+def run(store: ReservationStore, booking: BookingRecord, num_threads: int, writes_per_thread: int) -> float:
+    """Writes per second."""
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(thread_idx: int) -> None:
+        bookings = [dataclasses.replace(booking, booking_id=f"BK-{idx:08X}") for idx in range(writes_per_thread)]
+        barrier.wait()
+        for copy in bookings:
+            store.save(f"load-{thread_idx}", copy)
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return num_threads * writes_per_thread / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure sustained reservation writes per second")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32], help="writer thread counts")
+    parser.add_argument("--writes", type=int, default=200, help="bookings saved per thread")
+    parser.add_argument("--db-dir", type=Path, default=None, help="directory for the databases (default: temporary)")
+    args = parser.parse_args()
+
+    booking = sample_booking()
+    with tempfile.TemporaryDirectory(dir=args.db_dir) as db_dir:
+        print(f"{'store':<26} {'threads':>8} {'writes/s':>10}")
+        for name in STORES:
+            for num_threads in args.threads:
+                path = Path(db_dir) / f"{name.replace(' ', '-')}-{num_threads}.db"
+                store = make_store(name, path)
+                rate = run(store, booking, num_threads, args.writes)
+                if isinstance(store, SqliteReservationStore | JournalReservationStore):
+                    store.close()
+                print(f"{name:<26} {num_threads:>8} {rate:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Generation time and peak memory of flight inventories at several network sizes.
+
+The demo network is generated both ways: with the per-flight generator of the demo inventory (`generate_flight_records`,
+then `build_table`) and with the vectorized `generate_schedule`. Larger networks are synthetic route tables and only
+use `generate_schedule`. Peak memory is the peak of Python and NumPy allocations traced by `tracemalloc` while
+generating, including the finished table.
+"""
+
+import argparse
+import functools
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date
+
+from airline_agent.constants import FLIGHT_DATA_DATE, FLIGHT_DATA_NUM_DAYS
+from airline_agent.data_generation.generate_flights import generate_flight_records
+from airline_agent.data_generation.generate_schedule import demo_route_table, generate_schedule, synthetic_route_table
+from airline_agent.inventory.snapshot import FlightTable, build_table
+
+# (airports, routes per airport) of the synthetic networks
+NETWORKS = [(50, 10), (200, 10), (500, 10)]
+
+
+def measure(generate: Callable[[], FlightTable]) -> tuple[int, float, float]:
+    """Flights generated, seconds and peak MiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    table = generate()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(table), elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark flight inventory generation")
+    parser.add_argument("--days", type=int, default=365, help="days of flights in the synthetic networks")
+    parser.add_argument("--skip-legacy", action="store_true", help="skip the per-flight demo generator")
+    args = parser.parse_args()
+
+    start_date = FLIGHT_DATA_DATE
+    cases: list[tuple[str, Callable[[], FlightTable]]] = []
+    if not args.skip_legacy:
+        cases.append(("demo, per-flight", lambda: build_table(generate_flight_records())))
+    cases.append(("demo, vectorized", lambda: generate_schedule(demo_route_table(), start_date, FLIGHT_DATA_NUM_DAYS)))
+    for airports, routes_per_airport in NETWORKS:
+        routes = synthetic_route_table(airports, routes_per_airport)
+        generate_network = functools.partial(generate_schedule, routes, date(2025, 1, 1), args.days)
+        cases.append((f"{airports} airports, {len(routes)} routes", generate_network))
+
+    print(f"{'network':<30} {'flights':>10} {'seconds':>8} {'flights/s':>11} {'peak MiB':>9} {'B/flight':>9}")
+    for name, generate in cases:
+        flights, seconds, peak = measure(generate)
+        print(
+            f"{name:<30} {flights:>10,} {seconds:>8.2f} {flights / seconds:>11,.0f} {peak:>9,.0f} "
+            f"{peak * 2**20 / flights:>9,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
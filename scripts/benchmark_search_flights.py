@@ -0,0 +1,77 @@
+"""
+Micro-benchmark for `BookingTools.search_flights`: full inventory scan vs. route/date index.
+
+Larger inventories are simulated by repeating the generated flights; each copy is indexed under
+dates shifted by a multiple of the data window, so the index holds `scale` times as many keys and
+the scan walks `scale` times as many flights.
+"""
+
+import argparse
+import functools
+import statistics
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+
+from airline_agent.constants import FLIGHT_DATA_NUM_DAYS
+from airline_agent.data_generation.generate_flights import generate_flight_data
+from airline_agent.types.booking import Flight
+
+QUERY = ("SFO", "JFK", date(2025, 11, 12))
+
+
+def scan_search(flights: list[Flight], origin: str, destination: str, dep: date) -> list[Flight]:
+    """The pre-index implementation of `search_flights`."""
+    return [
+        fl
+        for fl in flights
+        if fl.origin == origin and fl.destination == destination and fl.departure.date().isoformat() == dep.isoformat()
+    ]
+
+
+def build_index(flights: list[Flight], scale: int) -> dict[tuple[str, str, date], list[str]]:
+    index: dict[tuple[str, str, date], list[str]] = {}
+    for copy in range(scale):
+        shift = timedelta(days=copy * FLIGHT_DATA_NUM_DAYS)
+        for fl in flights:
+            index.setdefault((fl.origin, fl.destination, fl.departure.date() + shift), []).append(fl.id)
+    return index
+
+
+def time_per_call(func: Callable[[], object], repeat: int) -> float:
+    """Median latency of `func` in microseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark flight search: full scan vs. route/date index")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="inventory size multipliers")
+    parser.add_argument("--repeat", type=int, default=5, help="timed calls per measurement")
+    args = parser.parse_args()
+
+    flights = list({fl.id: fl for fl in generate_flight_data()}.values())
+    origin, destination, dep = QUERY
+
+    print(f"{'scale':>6} {'flights':>10} {'scan (us)':>14} {'index (us)':>12} {'speedup':>10}")
+    for scale in args.scales:
+        inventory = flights * scale
+        index = build_index(flights, scale)
+        by_id = {fl.id: fl for fl in flights}
+
+        def indexed(
+            index: dict[tuple[str, str, date], list[str]] = index, by_id: dict[str, Flight] = by_id
+        ) -> list[Flight]:
+            return [by_id[flight_id] for flight_id in index.get((origin, destination, dep), [])]
+
+        scan_us = time_per_call(functools.partial(scan_search, inventory, origin, destination, dep), args.repeat)
+        index_us = time_per_call(indexed, args.repeat * 100)
+        print(f"{scale:>6} {len(inventory):>10} {scan_us:>14.1f} {index_us:>12.2f} {scan_us / index_us:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Resident memory of the full demo inventory, held in different forms.
+
+Each case runs in a fresh interpreter, since freed Python objects do not give their pages back to the OS and would
+inflate the cases measured after them. Resident memory is read from /proc (Linux only) once the inventory is built
+and garbage has been collected, and is reported as the increase over the interpreter with the modules imported;
+"peak" is the high-water mark while building, and "B/flight" the resident increase per flight held.
+
+- models: every flight as a `Flight` model with its own fares and add-ons, as `generate_flight_data` returns them
+- records: every flight as a `FlightRecord`, holding only its schedule and price vectors
+- table: the version-1 `FlightTable` generated in memory, as used when there is no snapshot
+- lazy: the version-2 inventory with every (route, day) bucket cached
+"""
+
+import argparse
+import gc
+import subprocess
+import sys
+import time
+from datetime import timedelta
+
+from airline_agent.constants import FLIGHT_DATA_DATE, FLIGHT_DATA_NUM_DAYS
+from airline_agent.data_generation.generate_flights import ROUTES, generate_flight_data, generate_flight_records
+from airline_agent.inventory.flights import LazyFlightInventory, build_flight_table
+
+CASES = ["models", "records", "table", "lazy"]
+
+
+def memory_mib() -> tuple[float, float]:
+    """Current and peak resident memory in MiB."""
+    with open("/proc/self/status") as f:
+        status = dict(line.split(":", 1) for line in f)
+    return int(status["VmRSS"].split()[0]) / 1024, int(status["VmHWM"].split()[0]) / 1024
+
+
+def build(case: str) -> tuple[object, int]:
+    """The inventory in the form of a case, and its number of flights."""
+    if case == "models":
+        flights = generate_flight_data()
+        return flights, len(flights)
+    if case == "records":
+        records = generate_flight_records()
+        return records, len(records)
+    if case == "table":
+        table = build_flight_table()
+        return table, len(table)
+    inventory = LazyFlightInventory(cache_size=len(ROUTES) * FLIGHT_DATA_NUM_DAYS)
+    num_flights = 0
+    for origin, destination in ROUTES:
+        for day in range(FLIGHT_DATA_NUM_DAYS):
+            num_flights += len(inventory.search(origin, destination, FLIGHT_DATA_DATE + timedelta(days=day)))
+    return inventory, num_flights
+
+
+def measure(case: str) -> None:
+    baseline, _ = memory_mib()
+    start = time.perf_counter()
+    inventory, num_flights = build(case)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    resident, peak = memory_mib()
+    print(
+        f"{case:<10} {resident - baseline:>12,.0f} {peak - baseline:>10,.0f} "
+        f"{(resident - baseline) * 2**20 / num_flights:>9,.0f} {elapsed:>8.1f}"
+    )
+    del inventory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the resident memory of the flight inventory")
+    parser.add_argument("--case", choices=CASES, help="measure one case in this process")
+    args = parser.parse_args()
+
+    if args.case is not None:
+        measure(args.case)
+        return
+
+    print(f"{FLIGHT_DATA_NUM_DAYS} days of flights")
+    print(f"{'case':<10} {'resident MiB':>12} {'peak MiB':>10} {'B/flight':>9} {'seconds':>8}")
+    for case in CASES:
+        subprocess.run([sys.executable, __file__, "--case", case], check=True)
+
+
+if __name__ == "__main__":
+    main()
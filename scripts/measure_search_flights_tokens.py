@@ -0,0 +1,49 @@
+"""
+Prompt cost of `search_flights` results: full `Flight` records vs. the compact summary projection.
+
+Each result is serialized the way it reaches the model, through `ToolReturnPart.model_response_str()`, and counted
+with the tokenizer of the agent model (`tiktoken`, which downloads the model's encoding on first use):
+
+    hatch run measure:search-flights-tokens
+"""
+
+import argparse
+
+import tiktoken
+from pydantic_ai.messages import ToolReturnPart
+
+from airline_agent.constants import AGENT_MODEL
+from airline_agent.tools.booking import MAX_SEARCH_LIMIT, BookingTools
+
+QUERIES = [
+    ("SFO", "JFK", "2025-11-12"),
+    ("OAK", "LGA", "2025-11-20"),
+    ("BAY", "NYC", "2025-11-12"),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure prompt tokens per search_flights tool result")
+    parser.add_argument("--model", default=AGENT_MODEL, help="model whose tokenizer is used")
+    args = parser.parse_args()
+
+    encoding = tiktoken.encoding_for_model(args.model)
+    tools = BookingTools()
+
+    def tokens(content: object) -> int:
+        part = ToolReturnPart(tool_name="search_flights", content=content, tool_call_id="measure")
+        return len(encoding.encode(part.model_response_str()))
+
+    print(f"{'query':<28} {'flights':>8} {'full':>8} {'summary':>8} {'saved':>7}")
+    for origin, destination, departure_date in QUERIES:
+        full = tools.search_flights(origin, destination, departure_date, limit=MAX_SEARCH_LIMIT, detail="full").flights
+        summary = tools.search_flights(origin, destination, departure_date, limit=MAX_SEARCH_LIMIT).flights
+        full_tokens, summary_tokens = tokens(full), tokens(summary)
+        query = f"{origin}->{destination} {departure_date}"
+        print(
+            f"{query:<28} {len(full):>8} {full_tokens:>8} {summary_tokens:>8} {1 - summary_tokens / full_tokens:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
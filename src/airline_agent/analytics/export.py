@@ -0,0 +1,256 @@
+"""
+Export of the flight inventory and stored reservations to columnar files for offline analysis.
+
+Flights are written one row per flight, with a price and a seat count column per fare bundle (`basic_price`,
+`basic_seats`, ...) and a price column per add-on (`checked_bag_price`, ...), so price distributions per route, spreads
+between fare bundles and seat availability are plain column queries. Booked flights are written one row per flight
+of a booking. Files are Parquet (one row group per chunk) or Arrow IPC, and are written chunk by chunk: the
+version-1 inventory is sliced from its memory-mapped snapshot, the version-2 inventory is generated one (route, day)
+bucket at a time, and bookings are read from the SQLite store as they are written, so memory use is bounded by the
+chunk size rather than the size of the data.
+
+Requires pyarrow, which the `analytics` environment provides:
+
+    $ hatch run analytics:export-analytics --reservations data/reservations.db
+"""
+
+import argparse
+import itertools
+from collections.abc import Iterable, Iterator
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from airline_agent.constants import FLIGHT_DATA_DATE, FLIGHT_DATA_NUM_DAYS, FLIGHT_DATA_VERSION
+from airline_agent.data_generation.generate_flights import (
+    ADD_ONS,
+    EAGER_FLIGHT_DATA_VERSION,
+    LAZY_FLIGHT_DATA_VERSION,
+    ROUTES,
+    FlightRecord,
+    generate_bucket_records,
+)
+from airline_agent.inventory.flights import load_flight_table
+from airline_agent.inventory.snapshot import FlightTable, load_snapshot
+from airline_agent.reservations.records import BookingRecord
+from airline_agent.reservations.sqlite import SqliteReservationStore
+from airline_agent.types.booking import FARE_TYPES
+
+ExportFormat = Literal["parquet", "arrow"]
+
+DEFAULT_EXPORT_PATH = Path(__file__).resolve().parents[3] / "data" / "analytics"
+
+# Rows per record batch, and so per Parquet row group
+DEFAULT_CHUNK_ROWS = 16384
+
+# Flight chunks hold these `FlightTable` columns, plus `day`: the local departure date as an ordinal
+FlightColumns = dict[str, npt.NDArray[Any]]
+_TABLE_COLUMNS = (
+    "id",
+    "origin",
+    "destination",
+    "departure",
+    "arrival",
+    "flight_number",
+    "carrier",
+    "fare_price",
+    "fare_seats",
+    "add_on_price",
+)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_FLIGHT_FIELDS: "list[pa.Field[Any]]" = [
+    pa.field("flight_id", pa.string()),
+    pa.field("origin", pa.string()),
+    pa.field("destination", pa.string()),
+    pa.field("departure_date", pa.date32()),
+    pa.field("departure", pa.timestamp("s", tz="UTC")),
+    pa.field("arrival", pa.timestamp("s", tz="UTC")),
+    pa.field("flight_number", pa.string()),
+    pa.field("carrier", pa.string()),
+    *(pa.field(f"{fare_type}_price", pa.float64()) for fare_type in FARE_TYPES),
+    *(pa.field(f"{fare_type}_seats", pa.int32()) for fare_type in FARE_TYPES),
+    *(pa.field(f"{add_on.service_type}_price", pa.float64()) for add_on in ADD_ONS),
+]
+FLIGHT_SCHEMA = pa.schema(_FLIGHT_FIELDS)
+
+_BOOKED_FLIGHT_FIELDS: "list[pa.Field[Any]]" = [
+    pa.field("session_id", pa.string()),
+    pa.field("booking_id", pa.string()),
+    pa.field("status", pa.string()),
+    pa.field("created_at", pa.timestamp("us", tz="UTC")),
+    pa.field("updated_at", pa.timestamp("us", tz="UTC")),
+    pa.field("hold_expires_at", pa.timestamp("us", tz="UTC")),
+    pa.field("flight_id", pa.string()),
+    pa.field("fare_type", pa.string()),
+    pa.field("currency", pa.string()),
+    pa.field("base_price", pa.float64()),
+    pa.field("add_ons_price", pa.float64()),
+    pa.field("num_add_ons", pa.int32()),
+    pa.field("checked_bags_included", pa.int32()),
+    pa.field("checked_in", pa.bool_()),
+    pa.field("seat_assignment", pa.string()),
+]
+BOOKED_FLIGHT_SCHEMA = pa.schema(_BOOKED_FLIGHT_FIELDS)
+
+
+def table_chunks(table: FlightTable, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[FlightColumns]:
+    """The flights of a table in chunks of rows, sliced from its columns (and so read from a snapshot as needed)."""
+    columns = table.columns
+    bucket_starts = columns["bucket_start"]
+    # The low 32 bits of a bucket key are the ordinal of its local departure date (see `bucket_key`)
+    bucket_days = columns["bucket_key"] & 0xFFFFFFFF
+    for start in range(0, len(table), chunk_rows):
+        stop = min(start + chunk_rows, len(table))
+        buckets = np.searchsorted(bucket_starts, np.arange(start, stop), side="right") - 1
+        yield {name: columns[name][start:stop] for name in _TABLE_COLUMNS} | {"day": bucket_days[buckets]}
+
+
+def record_chunks(records: Iterable[FlightRecord], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[FlightColumns]:
+    """Flight records in chunks of rows, consuming `records` one chunk at a time."""
+    for chunk in itertools.batched(records, chunk_rows, strict=False):
+        yield {
+            "id": np.array([record.id for record in chunk], dtype=np.bytes_),
+            "origin": np.array([record.origin for record in chunk], dtype=np.bytes_),
+            "destination": np.array([record.destination for record in chunk], dtype=np.bytes_),
+            "departure": np.array([int(record.departure.timestamp()) for record in chunk], dtype=np.int64),
+            "arrival": np.array([int(record.arrival.timestamp()) for record in chunk], dtype=np.int64),
+            "flight_number": np.array([record.flight_number for record in chunk], dtype=np.bytes_),
+            "carrier": np.array([record.carrier for record in chunk], dtype=np.bytes_),
+            "fare_price": np.array([record.fare_prices for record in chunk], dtype=np.float64),
+            "fare_seats": np.array([record.fare_seats for record in chunk], dtype=np.int32),
+            "add_on_price": np.array([record.add_on_prices for record in chunk], dtype=np.float64),
+            "day": np.array([record.departure.date().toordinal() for record in chunk], dtype=np.int64),
+        }
+
+
+def lazy_inventory_records() -> Iterator[FlightRecord]:
+    """The version-2 inventory, generated one (route, day) bucket at a time, as `LazyFlightInventory` serves it."""
+    for origin, destination in ROUTES:
+        for day in range(FLIGHT_DATA_NUM_DAYS):
+            yield from generate_bucket_records(origin, destination, FLIGHT_DATA_DATE + timedelta(days=day))
+
+
+def inventory_chunks(version: int, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[FlightColumns]:
+    """The inventory of a flight data version in chunks of rows."""
+    if version == EAGER_FLIGHT_DATA_VERSION:
+        return table_chunks(load_flight_table(), chunk_rows)
+    if version == LAZY_FLIGHT_DATA_VERSION:
+        return record_chunks(lazy_inventory_records(), chunk_rows)
+    msg = f"Unknown flight data version: {version}"
+    raise ValueError(msg)
+
+
+def flight_batch(columns: FlightColumns) -> pa.RecordBatch:
+    """A chunk of flights as a record batch of `FLIGHT_SCHEMA`."""
+    arrays: list[pa.Array[Any]] = [
+        pa.array(columns["id"]).cast(pa.string()),
+        pa.array(columns["origin"]).cast(pa.string()),
+        pa.array(columns["destination"]).cast(pa.string()),
+        pa.array(columns["day"] - _EPOCH_ORDINAL, type=pa.int32()).cast(pa.date32()),
+        pa.array(columns["departure"], type=pa.timestamp("s", tz="UTC")),
+        pa.array(columns["arrival"], type=pa.timestamp("s", tz="UTC")),
+        pa.array(columns["flight_number"]).cast(pa.string()),
+        pa.array(columns["carrier"]).cast(pa.string()),
+        *(pa.array(np.ascontiguousarray(price)) for price in columns["fare_price"].T),
+        *(pa.array(np.ascontiguousarray(seats), type=pa.int32()) for seats in columns["fare_seats"].T),
+        *(pa.array(np.ascontiguousarray(price)) for price in columns["add_on_price"].T),
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=FLIGHT_SCHEMA)
+
+
+def booked_flight_rows(bookings: Iterable[tuple[str, BookingRecord]]) -> Iterator[dict[str, Any]]:
+    """One row of `BOOKED_FLIGHT_SCHEMA` per flight of each (session ID, booking)."""
+    for session_id, booking in bookings:
+        for flight_booking in booking.flights:
+            yield {
+                "session_id": session_id,
+                "booking_id": booking.booking_id,
+                "status": booking.status,
+                "created_at": booking.created_at,
+                "updated_at": booking.updated_at,
+                "hold_expires_at": booking.hold_expires_at,
+                "flight_id": flight_booking.flight_id,
+                "fare_type": flight_booking.fare_type,
+                "currency": flight_booking.currency,
+                "base_price": flight_booking.base_price,
+                "add_ons_price": sum(add_on.price for add_on in flight_booking.add_ons),
+                "num_add_ons": len(flight_booking.add_ons),
+                "checked_bags_included": flight_booking.checked_bags_included,
+                "checked_in": flight_booking.checked_in,
+                "seat_assignment": flight_booking.seat_assignment,
+            }
+
+
+def booked_flight_batches(
+    bookings: Iterable[tuple[str, BookingRecord]], chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[pa.RecordBatch]:
+    for rows in itertools.batched(booked_flight_rows(bookings), chunk_rows, strict=False):
+        yield pa.RecordBatch.from_pylist(list(rows), schema=BOOKED_FLIGHT_SCHEMA)
+
+
+def write_batches(path: Path, schema: pa.Schema, batches: Iterable[pa.RecordBatch], file_format: ExportFormat) -> int:
+    """Write record batches to a Parquet or Arrow IPC file as they are produced, returning the number of rows."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer: pq.ParquetWriter | pa.ipc.RecordBatchFileWriter = (
+        pq.ParquetWriter(path, schema, compression="zstd")
+        if file_format == "parquet"
+        else pa.ipc.new_file(str(path), schema)
+    )
+    num_rows = 0
+    with writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            num_rows += batch.num_rows
+    return num_rows
+
+
+def main() -> None:
+    options = parse_args()
+    extension = options.format
+
+    if options.snapshot is not None:
+        table = load_snapshot(options.snapshot)
+        if table is None:
+            msg = f"No flight inventory snapshot at {options.snapshot}"
+            raise SystemExit(msg)
+        chunks = table_chunks(table, options.chunk_rows)
+    else:
+        chunks = inventory_chunks(options.flight_data_version, options.chunk_rows)
+    path = options.output / f"flights.{extension}"
+    num_flights = write_batches(path, FLIGHT_SCHEMA, map(flight_batch, chunks), options.format)
+    print(f"Wrote {num_flights} flights to {path}")  # noqa: T201
+
+    if options.reservations is not None:
+        store = SqliteReservationStore(options.reservations)
+        try:
+            path = options.output / f"booked_flights.{extension}"
+            batches = booked_flight_batches(store.all_bookings(), options.chunk_rows)
+            num_booked = write_batches(path, BOOKED_FLIGHT_SCHEMA, batches, options.format)
+        finally:
+            store.close()
+        print(f"Wrote {num_booked} booked flights to {path}")  # noqa: T201
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export the flight inventory and reservations to columnar files.")
+    parser.add_argument(
+        "--output", type=Path, default=DEFAULT_EXPORT_PATH, help="Output directory (default: data/analytics)"
+    )
+    parser.add_argument("--format", choices=["parquet", "arrow"], default="parquet", help="File format")
+    parser.add_argument(
+        "--flight-data-version", type=int, default=FLIGHT_DATA_VERSION, help="Flight data version to export"
+    )
+    parser.add_argument("--snapshot", type=Path, help="Export this snapshot directory instead of the demo inventory")
+    parser.add_argument("--reservations", type=Path, help="SQLite reservation database to export bookings from")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Rows per chunk")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -47,8 +47,12 @@ from airline_agent.cleanlab_utils.validate_utils import (
     run_cleanlab_validation_logging_tools,
 )
 from airline_agent.constants import AGENT_INSTRUCTIONS, AGENT_MODEL
+from airline_agent.reservations.journal import JournalReservationStore
+from airline_agent.reservations.sqlite import SqliteReservationStore
+from airline_agent.reservations.store import ReservationStore
 from airline_agent.tools.booking import BookingTools
 from airline_agent.tools.knowledge_base import KnowledgeBase
+from airline_agent.tools.sessions import current_session_id
 
 load_dotenv()
 
@@ -79,7 +83,16 @@ kb = KnowledgeBase(
     kb_path=str(pathlib.Path(__file__).parents[4] / "data/kb.json"),
     vector_index_path=str(pathlib.Path(__file__).parents[4] / "data/vector-db"),
 )
-booking = BookingTools()
+# Reservations are kept in memory unless a database or a journal is configured. A database is shared by all
+# workers; a journal is written by a single worker
+reservation_db_path = os.getenv("RESERVATION_DB_PATH")
+reservation_journal_path = os.getenv("RESERVATION_JOURNAL_PATH")
+reservation_store: ReservationStore | None = None
+if reservation_db_path:
+    reservation_store = SqliteReservationStore(pathlib.Path(reservation_db_path))
+elif reservation_journal_path:
+    reservation_store = JournalReservationStore(pathlib.Path(reservation_journal_path))
+booking = BookingTools(reservation_store=reservation_store)
 project = get_cleanlab_project()
 agent = create_agent(kb, booking)
 
@@ -95,6 +108,8 @@ async def airline_chat_streaming(
 ) -> AsyncGenerator[RunEvent]:
     run_id = uuid.uuid4()
     thread_id = message.thread_id
+    # Scope booking tool calls in this run to the thread's booking session
+    current_session_id.set(thread_id)
 
     if thread_id not in cleanlab_enabled_by_thread:
         cleanlab_enabled_by_thread[thread_id] = cleanlab_enabled
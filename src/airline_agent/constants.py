@@ -8,6 +8,8 @@ DEMO_DATE = date(2025, 11, 5)
 DEMO_DATETIME = datetime(2025, 11, 5, 14, 0, 0, tzinfo=ZoneInfo("America/Los_Angeles"))
 FLIGHT_DATA_DATE = DEMO_DATE - timedelta(days=365)
 FLIGHT_DATA_NUM_DAYS = 365 * 2
+# 1: full inventory generated eagerly from a single RNG stream; 2: (route, day) buckets generated lazily
+FLIGHT_DATA_VERSION = 1
 
 OFFICIAL_DEMO_PROJECT_ID = "3aae1f96-2dda-492f-8c86-17d453d3c298"  # to copy configuration from
 STAGING_DEMO_PROJECT_ID = "6de236e4-c6e7-456c-b248-872236010992"
@@ -20,9 +22,17 @@ CONTEXT_RETRIEVAL_TOOLS = [
     "get_article",
     "list_directory",
     "search_flights",
+    "find_flight_by_number",
+    "get_fare_summary",
+    "get_fare_calendar",
+    "find_round_trips",
     "get_fare_details",
+    "get_fare_details_batch",
     "get_flight_timings",
+    "get_flight_timings_batch",
     "get_flight_status",
+    "get_flight_status_batch",
+    "get_seat_map",
 ]
 AGENT_MODEL = "gpt-4o"
 FALLBACK_RESPONSE = "I'm sorry, but I don't have the information you're looking for. Please rephrase the question or contact Frontier Airlines customer support for further assistance."
@@ -33,10 +43,16 @@ You are an AI customer support agent for Frontier Airlines. You can use tools to
 - search — find candidate articles by query (keep top-k small, ≤5), returns title/snippet/path.
 - get_article — get the full article by its path.
 - list_directory — list directory structure to make more informed searches.
-- search_flights — search available flights by origin and destination airport codes (IATA) and departure date (YYYY-MM-DD). Always ask for the departure date if the user doesn't provide it.
+- search_flights — search available flights by origin and destination airport codes (IATA) and departure date (YYYY-MM-DD). Either end can also be a metro area code ("BAY" for the San Francisco Bay Area, "NYC" for New York) or a list of airport codes, so search a whole city in one call instead of one call per airport. Use its time window, max_prices and sort_by parameters instead of filtering results yourself (e.g. "after 5pm under $150, cheapest first"); results are paged, so pass next_cursor to see more. Always ask for the departure date if the user doesn't provide it.
+- find_flight_by_number — look up a flight by flight number (e.g. "F9 482") and departure date to get its flight ID. Use this when the customer quotes a flight number instead of searching the route.
+- get_fare_summary — summarize fares for a route over a date range (up to 31 days): lowest and highest price, cheapest flight, and seats available per fare bundle. Use this instead of searching day by day for questions like "what's the cheapest flight next week".
+- get_fare_calendar — lowest price and number of flights for each departure date in a range (up to 31 days) for one fare bundle. Use this when the customer is flexible on dates and wants the cheapest day to fly.
+- find_round_trips — cheapest outbound and return flight combinations for a route given an outbound date range, a return date range, a fare bundle and a minimum stay. Use this for flexible-date round trips instead of searching each day.
 - get_fare_details — retrieve fare bundle pricing, included services, and add-ons for a specific flight.
 - get_flight_timings — get check-in, boarding, and door-close timing windows for a flight.
 - get_flight_status — get the latest status, gates, and delay information for a flight.
+- get_fare_details_batch, get_flight_timings_batch, get_flight_status_batch — the same information for a list of flight IDs in one call, keyed by flight ID. Use these instead of one call per flight when comparing several flights.
+- get_seat_map — seat availability for a flight by seating zone (UpFront Plus rows 1-2, Stretch rows 3-15, Standard rows 16-40), including free window and aisle seats.
 
 ## Tool Use Guidelines:
 - Don't make more tool calls than necessary.
@@ -0,0 +1,26 @@
+import argparse
+from pathlib import Path
+
+from airline_agent.inventory.flights import build_flight_table
+from airline_agent.inventory.snapshot import DEFAULT_SNAPSHOT_PATH, write_snapshot
+
+
+def main() -> None:
+    options = parse_args()
+
+    table = build_flight_table()
+    write_snapshot(table, options.output)
+
+    print(f"Wrote {len(table)} flights to {options.output}")  # noqa: T201
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the flight inventory and write it as a columnar snapshot.")
+    parser.add_argument(
+        "--output", type=Path, default=DEFAULT_SNAPSHOT_PATH, help="Snapshot directory (default: data/flight-inventory)"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,33 +3,100 @@ Module to generate Frontier Airlines (F9) flight data for SF Bay Area to New Yor
 Includes direct flights only.
 """
 
+import hashlib
 import random
-from datetime import UTC, datetime, timedelta
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from airline_agent.constants import FLIGHT_DATA_DATE, FLIGHT_DATA_NUM_DAYS
-from airline_agent.types.booking import Fare, Flight, ServiceAddOnOption
+from airline_agent.types.booking import (
+    FARE_TYPES,
+    Fare,
+    FareType,
+    Flight,
+    FlightSummary,
+    ServiceAddOnOption,
+    ServiceType,
+)
 
 # Constants
 RNG_SEED = 42
 
+# Inventory versions: version 1 (`generate_flight_records`) draws every flight from a single RNG stream,
+# version 2 (`generate_bucket_records`) seeds each (route, day) bucket independently.
+EAGER_FLIGHT_DATA_VERSION = 1
+LAZY_FLIGHT_DATA_VERSION = 2
+
 # San Francisco Bay Area airports
 SF_AIRPORTS = ["SFO", "SJC", "OAK"]
 
 # New York airports
 NYC_AIRPORTS = ["JFK", "EWR", "LGA"]
 
+# Metro area codes accepted in place of an airport code
+METRO_AREAS = {
+    "BAY": SF_AIRPORTS,
+    "NYC": NYC_AIRPORTS,
+}
+
 # Frontier Airlines only
 CARRIER_CODE = "F9"
 
-# Fare bundle base prices (Frontier Airlines style - no separate cabin classes)
-FARE_BASE_PRICES = {
-    "basic": {"price_range": (80, 150)},
-    "economy": {"price_range": (120, 200)},
-    "premium": {"price_range": (200, 320)},
-    "business": {"price_range": (350, 550)},
+
+@dataclass(frozen=True, slots=True)
+class FareBundleSpec:
+    """How a fare bundle is generated: uniform price and seat count ranges, and what the bundle includes."""
+
+    price_range: tuple[float, float]
+    seats_range: tuple[int, int]
+    included_services: tuple[str, ...] = ()
+    checked_bags_included: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class AddOnSpec:
+    """How an add-on option is generated: a uniform price range and a description."""
+
+    service_type: ServiceType
+    price_range: tuple[float, float]
+    description: str
+
+
+# Fare bundles (Frontier Airlines style - no separate cabin classes), in `FARE_TYPES` order
+_ECONOMY_SERVICES = ("carry_on", "standard_seat_selection", "refundability", "change_cancel_fee_waived")
+_PREMIUM_SERVICES = (*_ECONOMY_SERVICES, "premium_seat_selection", "priority_boarding")
+FARE_BUNDLES: dict[FareType, FareBundleSpec] = {
+    # Basic fare: no services included
+    "basic": FareBundleSpec(price_range=(80, 150), seats_range=(5, 15)),
+    # Economy bundle: Basic + Carry on, Standard seat selection, Refundability, Change/cancel fee waived
+    "economy": FareBundleSpec(price_range=(120, 200), seats_range=(3, 12), included_services=_ECONOMY_SERVICES),
+    # Premium bundle: Economy + Premium seat selection + Priority Boarding
+    "premium": FareBundleSpec(price_range=(200, 320), seats_range=(2, 8), included_services=_PREMIUM_SERVICES),
+    # Business bundle: Premium + 2 checked bags + UpFront Plus Seating
+    "business": FareBundleSpec(
+        price_range=(350, 550),
+        seats_range=(1, 4),
+        included_services=(*_PREMIUM_SERVICES, "upfront_plus_seating"),
+        checked_bags_included=2,
+    ),
 }
 
+ADD_ONS = [
+    AddOnSpec("checked_bag", (30, 40), "One checked bag (up to 50 lbs, 62 linear inches)"),
+    AddOnSpec("carry_on", (20, 30), "One carry-on bag (personal item included)"),
+    AddOnSpec("standard_seat_selection", (10, 25), "Select a standard seat in advance"),
+    AddOnSpec("premium_seat_selection", (25, 45), "Select a stretch seat with extra legroom"),
+    AddOnSpec(
+        "upfront_plus_seating", (50, 100), "UpFront Plus seating in first two rows with guaranteed empty middle seat"
+    ),
+    AddOnSpec("priority_boarding", (8, 15), "Priority boarding with overhead bin space"),
+    AddOnSpec("travel_insurance", (15, 30), "Trip protection insurance"),
+    AddOnSpec("refundability", (30, 60), "Add refundability to your booking"),
+    AddOnSpec("change_cancel_fee_waived", (20, 40), "Waive change and cancel fees"),
+]
+
 # Flight duration estimates (in hours)
 # Base durations for SFO routes
 BASE_DURATIONS = {
@@ -54,6 +121,9 @@ for (sf, nyc), duration in list(FLIGHT_DURATIONS.items()):
     if sf in SF_AIRPORTS and nyc in NYC_AIRPORTS:
         FLIGHT_DURATIONS[(nyc, sf)] = duration + 1  # jet stream
 
+# All served (origin, destination) pairs
+ROUTES = list(FLIGHT_DURATIONS)
+
 # Timezone mappings for airports
 AIRPORT_TIMEZONES = {
     # SF Bay Area
@@ -67,6 +137,22 @@ AIRPORT_TIMEZONES = {
 }
 
 
+def generator_inputs_hash() -> str:
+    """
+    A hash of the parameters flights are generated from: the seed, routes, time zones, fare bundles and add-ons.
+    Snapshots record it so that one generated from different parameters is not reused.
+    """
+    inputs = (
+        RNG_SEED,
+        CARRIER_CODE,
+        sorted(FLIGHT_DURATIONS.items()),
+        sorted((airport, str(timezone)) for airport, timezone in AIRPORT_TIMEZONES.items()),
+        FARE_BUNDLES,
+        ADD_ONS,
+    )
+    return hashlib.sha256(repr(inputs).encode()).hexdigest()
+
+
 def get_flight_duration(origin: str, destination: str) -> float:
     return FLIGHT_DURATIONS[(origin, destination)]
 
@@ -76,135 +162,107 @@ def get_airport_timezone(airport: str) -> ZoneInfo:
 
 
 def generate_fares(rng: random.Random) -> list[Fare]:
-    fares = []
+    prices, seats = draw_fares(rng)
+    return [build_fare(fare_idx, prices[fare_idx], seats[fare_idx]) for fare_idx in range(len(FARE_TYPES))]
 
-    # Basic fare: no services included
-    basic_price = rng.uniform(*FARE_BASE_PRICES["basic"]["price_range"])
-    fares.append(
-        Fare(
-            fare_type="basic",
-            price_total=round(basic_price, 2),
-            currency="USD",
-            seats_available=rng.randint(5, 15),
-            included_services=[],
-            checked_bags_included=0,
-        )
-    )
 
-    # Economy bundle: Basic + Carry on, Standard seat selection, Refundability, Change/cancel fee waived
-    economy_price = rng.uniform(*FARE_BASE_PRICES["economy"]["price_range"])
-    fares.append(
-        Fare(
-            fare_type="economy",
-            price_total=round(economy_price, 2),
-            currency="USD",
-            seats_available=rng.randint(3, 12),
-            included_services=["carry_on", "standard_seat_selection", "refundability", "change_cancel_fee_waived"],
-            checked_bags_included=0,
-        )
+def generate_add_ons(rng: random.Random) -> list[ServiceAddOnOption]:
+    return build_add_ons(draw_add_on_prices(rng))
+
+
+def draw_fares(rng: random.Random) -> tuple[tuple[float, ...], tuple[int, ...]]:
+    """Draw the price and seat count of each fare bundle, in `FARE_TYPES` order."""
+    prices, seats = [], []
+    for bundle in FARE_BUNDLES.values():
+        prices.append(round(rng.uniform(*bundle.price_range), 2))
+        seats.append(rng.randint(*bundle.seats_range))
+    return tuple(prices), tuple(seats)
+
+
+def draw_add_on_prices(rng: random.Random) -> tuple[float, ...]:
+    """Draw the price of each add-on, in `ADD_ONS` order."""
+    return tuple(round(rng.uniform(*add_on.price_range), 2) for add_on in ADD_ONS)
+
+
+def build_fare(fare_idx: int, price: float, seats: int) -> Fare:
+    """Build the `Fare` model of the fare bundle at `fare_idx` in `FARE_TYPES`."""
+    fare_type = FARE_TYPES[fare_idx]
+    bundle = FARE_BUNDLES[fare_type]
+    return Fare(
+        fare_type=fare_type,
+        price_total=price,
+        currency="USD",
+        seats_available=seats,
+        included_services=list(bundle.included_services),
+        checked_bags_included=bundle.checked_bags_included,
     )
 
-    # Premium bundle: Economy + Premium seat selection + Priority Boarding
-    premium_price = rng.uniform(*FARE_BASE_PRICES["premium"]["price_range"])
-    fares.append(
-        Fare(
-            fare_type="premium",
-            price_total=round(premium_price, 2),
-            currency="USD",
-            seats_available=rng.randint(2, 8),
-            included_services=[
-                "carry_on",
-                "standard_seat_selection",
-                "refundability",
-                "change_cancel_fee_waived",
-                "premium_seat_selection",
-                "priority_boarding",
-            ],
-            checked_bags_included=0,
-        )
-    )
 
-    # Business bundle: Premium + 2 checked bags + UpFront Plus Seating
-    business_price = rng.uniform(*FARE_BASE_PRICES["business"]["price_range"])
-    fares.append(
-        Fare(
-            fare_type="business",
-            price_total=round(business_price, 2),
-            currency="USD",
-            seats_available=rng.randint(1, 4),
-            included_services=[
-                "carry_on",
-                "standard_seat_selection",
-                "refundability",
-                "change_cancel_fee_waived",
-                "premium_seat_selection",
-                "priority_boarding",
-                "upfront_plus_seating",
-            ],
-            checked_bags_included=2,
+def build_add_ons(prices: Sequence[float]) -> list[ServiceAddOnOption]:
+    """Build the `ServiceAddOnOption` models of `ADD_ONS` with the given prices."""
+    return [
+        ServiceAddOnOption(
+            service_type=add_on.service_type, price=price, currency="USD", description=add_on.description
         )
-    )
+        for add_on, price in zip(ADD_ONS, prices, strict=True)
+    ]
 
-    return fares
 
+@dataclass(frozen=True, slots=True)
+class FlightRecord:
+    """
+    A generated flight as drawn: its schedule and its price vectors, one price (and seat count) per entry of
+    `FARE_BUNDLES` and `ADD_ONS`. Bundle definitions and add-on descriptions stay in those shared tables rather than
+    being copied into every flight.
+
+    Records are the in-memory form of the inventory; `flight` and `summary` build the pydantic models that tools
+    return.
+    """
+
+    id: str
+    origin: str
+    destination: str
+    departure: datetime
+    arrival: datetime
+    flight_number: str
+    fare_prices: tuple[float, ...]
+    fare_seats: tuple[int, ...]
+    add_on_prices: tuple[float, ...]
+    carrier: str = CARRIER_CODE
+
+    def fare(self, fare_idx: int) -> Fare:
+        return build_fare(fare_idx, self.fare_prices[fare_idx], self.fare_seats[fare_idx])
+
+    def add_ons(self) -> list[ServiceAddOnOption]:
+        return build_add_ons(self.add_on_prices)
+
+    def flight(self) -> Flight:
+        return Flight(
+            id=self.id,
+            origin=self.origin,
+            destination=self.destination,
+            departure=self.departure,
+            arrival=self.arrival,
+            flight_number=self.flight_number,
+            carrier=self.carrier,
+            fares=[self.fare(fare_idx) for fare_idx in range(len(FARE_TYPES))],
+            add_ons=self.add_ons(),
+        )
 
-def generate_add_ons(rng: random.Random) -> list[ServiceAddOnOption]:
-    return [
-        ServiceAddOnOption(
-            service_type="checked_bag",
-            price=round(rng.uniform(30, 40), 2),
-            currency="USD",
-            description="One checked bag (up to 50 lbs, 62 linear inches)",
-        ),
-        ServiceAddOnOption(
-            service_type="carry_on",
-            price=round(rng.uniform(20, 30), 2),
-            currency="USD",
-            description="One carry-on bag (personal item included)",
-        ),
-        ServiceAddOnOption(
-            service_type="standard_seat_selection",
-            price=round(rng.uniform(10, 25), 2),
-            currency="USD",
-            description="Select a standard seat in advance",
-        ),
-        ServiceAddOnOption(
-            service_type="premium_seat_selection",
-            price=round(rng.uniform(25, 45), 2),
-            currency="USD",
-            description="Select a stretch seat with extra legroom",
-        ),
-        ServiceAddOnOption(
-            service_type="upfront_plus_seating",
-            price=round(rng.uniform(50, 100), 2),
-            currency="USD",
-            description="UpFront Plus seating in first two rows with guaranteed empty middle seat",
-        ),
-        ServiceAddOnOption(
-            service_type="priority_boarding",
-            price=round(rng.uniform(8, 15), 2),
-            currency="USD",
-            description="Priority boarding with overhead bin space",
-        ),
-        ServiceAddOnOption(
-            service_type="travel_insurance",
-            price=round(rng.uniform(15, 30), 2),
-            currency="USD",
-            description="Trip protection insurance",
-        ),
-        ServiceAddOnOption(
-            service_type="refundability",
-            price=round(rng.uniform(30, 60), 2),
-            currency="USD",
-            description="Add refundability to your booking",
-        ),
-        ServiceAddOnOption(
-            service_type="change_cancel_fee_waived",
-            price=round(rng.uniform(20, 40), 2),
-            currency="USD",
-            description="Waive change and cancel fees",
-        ),
-    ]
+    def summary(self) -> FlightSummary:
+        return FlightSummary(
+            id=self.id,
+            flight_number=self.flight_number,
+            origin=self.origin,
+            destination=self.destination,
+            departure=self.departure,
+            arrival=self.arrival,
+            prices={
+                fare_type: price
+                for fare_type, price, seats in zip(FARE_TYPES, self.fare_prices, self.fare_seats, strict=True)
+                if seats > 0
+            },
+        )
 
 
 def generate_flight_id(origin: str, destination: str, departure: datetime, carrier: str) -> str:
@@ -212,19 +270,32 @@ def generate_flight_id(origin: str, destination: str, departure: datetime, carri
     return f"{carrier}-{origin}-{destination}-{date_str}"
 
 
-def generate_direct_flights(
+def parse_flight_id(flight_id: str) -> tuple[str, str, date] | None:
+    """Recover (origin, destination, local departure date) from a flight ID, or None if it is malformed."""
+    parts = flight_id.split("-", 3)
+    if len(parts) != 4:  # noqa: PLR2004
+        return None
+    _, origin, destination, departure = parts
+    try:
+        departure_date = date.fromisoformat(departure[:10])
+    except ValueError:
+        return None
+    return origin, destination, departure_date
+
+
+def generate_direct_flight_records(
     rng: random.Random,
     start_date: datetime,
     num_days: int = 8,
     origin_airports: list[str] | None = None,
     dest_airports: list[str] | None = None,
-) -> list[Flight]:
+) -> list[FlightRecord]:
     if origin_airports is None:
         origin_airports = SF_AIRPORTS
     if dest_airports is None:
         dest_airports = NYC_AIRPORTS
 
-    flights = []
+    records = []
 
     for day in range(num_days):
         date = start_date + timedelta(days=day)
@@ -232,56 +303,90 @@ def generate_direct_flights(
         # Generate comprehensive flights - multiple per origin-destination pair
         for origin in origin_airports:
             for destination in dest_airports:
-                # Generate 3-6 flights per origin-destination pair per day
-                num_flights = rng.randint(3, 6)
+                records.extend(generate_route_day_records(rng, origin, destination, date))
+
+    return records
+
+
+def generate_route_day_records(
+    rng: random.Random, origin: str, destination: str, day_start: datetime
+) -> list[FlightRecord]:
+    records = []
+
+    # Generate 3-6 flights per origin-destination pair per day
+    num_flights = rng.randint(3, 6)
+
+    for _ in range(num_flights):
+        # Random departure time between 6 AM and 10 PM
+        hour = rng.randint(6, 22)
+        minute = rng.choice([0, 15, 30, 45])
+
+        # Create timezone-aware departure time
+        origin_tz = get_airport_timezone(origin)
+        departure_time = day_start.replace(hour=hour, minute=minute, second=0, microsecond=0, tzinfo=origin_tz)
+
+        # Calculate arrival time
+        duration = get_flight_duration(origin, destination)
+        arrival_time_naive = departure_time + timedelta(hours=duration)
+
+        # Convert to destination timezone
+        dest_tz = get_airport_timezone(destination)
+        arrival_time = arrival_time_naive.astimezone(dest_tz)
+
+        flight_number = f"{CARRIER_CODE} {rng.randint(100, 999)}"
+        fare_prices, fare_seats = draw_fares(rng)
+        record = FlightRecord(
+            id=generate_flight_id(origin, destination, departure_time, CARRIER_CODE),
+            origin=origin,
+            destination=destination,
+            departure=departure_time,
+            arrival=arrival_time,
+            flight_number=flight_number,
+            fare_prices=fare_prices,
+            fare_seats=fare_seats,
+            add_on_prices=draw_add_on_prices(rng),
+        )
 
-                for _ in range(num_flights):
-                    # Random departure time between 6 AM and 10 PM
-                    hour = rng.randint(6, 22)
-                    minute = rng.choice([0, 15, 30, 45])
+        records.append(record)
 
-                    # Create timezone-aware departure time
-                    origin_tz = get_airport_timezone(origin)
-                    departure_time = date.replace(hour=hour, minute=minute, second=0, microsecond=0, tzinfo=origin_tz)
+    return records
 
-                    # Calculate arrival time
-                    duration = get_flight_duration(origin, destination)
-                    arrival_time_naive = departure_time + timedelta(hours=duration)
 
-                    # Convert to destination timezone
-                    dest_tz = get_airport_timezone(destination)
-                    arrival_time = arrival_time_naive.astimezone(dest_tz)
+def bucket_seed(origin: str, destination: str, day: date, version: int = LAZY_FLIGHT_DATA_VERSION) -> int:
+    """Seed for a single (route, day) bucket, independent of any other bucket."""
+    key = f"v{version}:{RNG_SEED}:{origin}:{destination}:{day.isoformat()}"
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
 
-                    flight = Flight(
-                        id=generate_flight_id(origin, destination, departure_time, CARRIER_CODE),
-                        origin=origin,
-                        destination=destination,
-                        departure=departure_time,
-                        arrival=arrival_time,
-                        flight_number=f"{CARRIER_CODE} {rng.randint(100, 999)}",
-                        carrier=CARRIER_CODE,
-                        fares=generate_fares(rng),
-                        add_ons=generate_add_ons(rng),
-                    )
 
-                    flights.append(flight)
+def generate_bucket_records(origin: str, destination: str, day: date) -> list[FlightRecord]:
+    """
+    Generate the flights for one route on one local departure date.
 
-    return flights
+    Buckets are seeded from their own key, so a bucket is the same regardless of which other buckets
+    were generated before it. This is inventory version `LAZY_FLIGHT_DATA_VERSION`; it does not
+    reproduce the flights returned by `generate_flight_data`, which draws all buckets from one stream.
+    """
+    rng = random.Random(bucket_seed(origin, destination, day))  # noqa: S311
+    start = datetime.combine(day, datetime.min.time(), tzinfo=UTC)
+    records = generate_route_day_records(rng, origin, destination, start)
+    records.sort(key=lambda x: x.departure)
+    # Same-minute departures share an ID; keep one flight per ID like the eager inventory does
+    return list({record.id: record for record in records}.values())
 
 
-def generate_flight_data() -> list[Flight]:
+def generate_flight_records() -> list[FlightRecord]:
     # Create seeded random number generator for reproducibility
     rng = random.Random(RNG_SEED)  # noqa: S311
 
     start_date = datetime.combine(FLIGHT_DATA_DATE, datetime.min.time(), tzinfo=UTC)
 
     # Generate SF -> NYC flights
-    direct_flights_sf_to_nyc = generate_direct_flights(
+    direct_flights_sf_to_nyc = generate_direct_flight_records(
         rng, start_date, num_days=FLIGHT_DATA_NUM_DAYS, origin_airports=SF_AIRPORTS, dest_airports=NYC_AIRPORTS
     )
 
     # Generate NYC -> SF flights
-    direct_flights_nyc_to_sf = generate_direct_flights(
+    direct_flights_nyc_to_sf = generate_direct_flight_records(
         rng, start_date, num_days=FLIGHT_DATA_NUM_DAYS, origin_airports=NYC_AIRPORTS, dest_airports=SF_AIRPORTS
     )
 
@@ -292,3 +397,8 @@ def generate_flight_data() -> list[Flight]:
     all_flights.sort(key=lambda x: x.departure)
 
     return all_flights
+
+
+def generate_flight_data() -> list[Flight]:
+    """The version-1 inventory as models, from `generate_flight_records`."""
+    return [record.flight() for record in generate_flight_records()]
@@ -0,0 +1,231 @@
+"""
+Vectorized flight schedule generator for route networks of any size.
+
+The network is a route table: each `Route` gives its airports' timezones, block time and daily frequency. Flights
+are drawn for every (route, day) at once with NumPy, from independent random streams for the schedule, the fares
+and the add-ons, and written straight into the columns of a `FlightTable`, so no `Flight` model is built and a
+network of hundreds of airports and millions of flights is generated in seconds. Flights follow the same rules as
+`generate_route_day_records` (departures between 06:00 and 22:45 local time in 15-minute steps, the fare bundles of
+`FARE_BUNDLES` and the add-ons of `ADD_ONS`), but the draws differ, so the demo inventories are not reproduced.
+"""
+
+import string
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import numpy.typing as npt
+
+from airline_agent.data_generation.generate_flights import (
+    ADD_ONS,
+    AIRPORT_TIMEZONES,
+    CARRIER_CODE,
+    FARE_BUNDLES,
+    FLIGHT_DURATIONS,
+    RNG_SEED,
+)
+from airline_agent.inventory.snapshot import SNAPSHOT_FORMAT_VERSION, FlightTable, spec_catalogs
+from airline_agent.types.booking import FARE_TYPES
+
+# Local departure times: whole hours from FIRST_DEPARTURE_HOUR to LAST_DEPARTURE_HOUR, plus 0-45 minutes
+FIRST_DEPARTURE_HOUR = 6
+LAST_DEPARTURE_HOUR = 22
+DEPARTURE_MINUTE_STEP = 15
+
+# Flight numbers are drawn from this range (inclusive)
+FLIGHT_NUMBERS = (100, 999)
+
+# Synthetic airports are named AAA to ZZZ
+MAX_SYNTHETIC_AIRPORTS = 26**3
+
+# Timezones of the airports of synthetic networks
+SYNTHETIC_TIMEZONES = [
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Phoenix",
+    "America/Los_Angeles",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class Route:
+    """A served (origin, destination) pair: airport timezones, block time and flights per day (inclusive range)."""
+
+    origin: str
+    destination: str
+    origin_timezone: str
+    destination_timezone: str
+    block_minutes: int
+    daily_flights: tuple[int, int] = (3, 6)
+
+
+def demo_route_table() -> list[Route]:
+    """The routes of the demo inventory."""
+    return [
+        Route(
+            origin=origin,
+            destination=destination,
+            origin_timezone=str(AIRPORT_TIMEZONES[origin]),
+            destination_timezone=str(AIRPORT_TIMEZONES[destination]),
+            block_minutes=round(hours * 60),
+        )
+        for (origin, destination), hours in FLIGHT_DURATIONS.items()
+    ]
+
+
+def synthetic_route_table(num_airports: int, routes_per_airport: int, seed: int = RNG_SEED) -> list[Route]:
+    """
+    A random network for load and scale testing. Airports are placed on a 4500 x 2500 km map, each one flies to
+    `routes_per_airport` others, and block times follow from the distance at 800 km/h plus 30 minutes of taxiing.
+    """
+    if not 0 < num_airports <= MAX_SYNTHETIC_AIRPORTS:
+        msg = f"num_airports must be between 1 and {MAX_SYNTHETIC_AIRPORTS}, got {num_airports}"
+        raise ValueError(msg)
+    rng = np.random.default_rng(seed)
+    letters = np.array(list(string.ascii_uppercase))
+    codes = ["".join(code) for code in letters[np.indices((26, 26, 26)).reshape(3, -1).T[:num_airports]]]
+    timezones = rng.choice(SYNTHETIC_TIMEZONES, size=num_airports)
+    positions = rng.uniform((0, 0), (4500, 2500), size=(num_airports, 2))
+    frequencies = rng.integers(1, 4, size=(num_airports, routes_per_airport))
+
+    routes = []
+    for origin in range(num_airports):
+        others = np.delete(np.arange(num_airports), origin)
+        destinations = rng.choice(others, size=min(routes_per_airport, len(others)), replace=False)
+        for destination, frequency in zip(destinations.tolist(), frequencies[origin].tolist(), strict=False):
+            distance = float(np.hypot(*(positions[origin] - positions[destination])))
+            routes.append(
+                Route(
+                    origin=codes[origin],
+                    destination=codes[destination],
+                    origin_timezone=str(timezones[origin]),
+                    destination_timezone=str(timezones[destination]),
+                    block_minutes=30 + 5 * round(distance / 800 * 12),
+                    daily_flights=(frequency, frequency + 3),
+                )
+            )
+    return routes
+
+
+def generate_schedule(
+    routes: list[Route], start_date: date, num_days: int, seed: int = RNG_SEED, carrier: str = CARRIER_CODE
+) -> FlightTable:
+    """Generate the flights of a route table over `num_days` days from `start_date` (local departure dates)."""
+    routes = sorted(routes, key=lambda route: (route.origin, route.destination))
+    if len({(route.origin, route.destination) for route in routes}) < len(routes):
+        msg = "routes must be unique"
+        raise ValueError(msg)
+    schedule_rng, fare_rng, add_on_rng = (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(3))
+
+    # Flights per (route, day) bucket, buckets in route then day order
+    low = np.array([route.daily_flights[0] for route in routes])
+    high = np.array([route.daily_flights[1] for route in routes])
+    counts = schedule_rng.integers(low[:, None], high[:, None] + 1, size=(len(routes), num_days)).ravel()
+    bucket = np.repeat(np.arange(len(routes) * num_days), counts)
+    route_idx, day_idx = np.divmod(bucket, num_days)
+    num_flights = len(bucket)
+
+    hours = schedule_rng.integers(FIRST_DEPARTURE_HOUR, LAST_DEPARTURE_HOUR + 1, num_flights)
+    steps = schedule_rng.integers(0, 60 // DEPARTURE_MINUTE_STEP, num_flights)
+    first_day = (start_date - date(1970, 1, 1)).days
+    local_minutes = (first_day + day_idx) * 1440 + hours * 60 + steps * DEPARTURE_MINUTE_STEP
+
+    # Sort each bucket by departure, keeping one flight per departure minute since flights are identified by it
+    order = np.lexsort((local_minutes, bucket))
+    bucket, route_idx, day_idx, local_minutes = bucket[order], route_idx[order], day_idx[order], local_minutes[order]
+    keep = np.ones(num_flights, dtype=bool)
+    keep[1:] = (bucket[1:] != bucket[:-1]) | (local_minutes[1:] != local_minutes[:-1])
+    bucket, route_idx, day_idx, local_minutes = bucket[keep], route_idx[keep], day_idx[keep], local_minutes[keep]
+    num_flights = len(bucket)
+
+    origin_timezones = [route.origin_timezone for route in routes]
+    departure = (local_minutes - _utc_offsets(origin_timezones, start_date, num_days)[route_idx, day_idx]) * 60
+    block_minutes = np.array([route.block_minutes for route in routes], dtype=np.int64)
+    arrival = departure + block_minutes[route_idx] * 60
+
+    # Strings are gathered from small lookup tables of byte strings and concatenated, without per-flight formatting
+    prefixes = np.array([f"{carrier}-{route.origin}-{route.destination}-" for route in routes], dtype=np.bytes_)
+    day_strings = np.array(
+        [date.fromordinal(start_date.toordinal() + day).isoformat() for day in range(num_days)], dtype=np.bytes_
+    )
+    time_strings = np.array([f"T{minute // 60:02}:{minute % 60:02}" for minute in range(1440)], dtype=np.bytes_)
+    flight_numbers = np.array(
+        [f"{carrier} {number}" for number in range(FLIGHT_NUMBERS[0], FLIGHT_NUMBERS[1] + 1)], dtype=np.bytes_
+    )
+    ids = np.strings.add(np.strings.add(prefixes[route_idx], day_strings[day_idx]), time_strings[local_minutes % 1440])
+    numbers = schedule_rng.integers(0, len(flight_numbers), num_flights)
+
+    bundles = [FARE_BUNDLES[fare_type] for fare_type in FARE_TYPES]
+    fare_price = fare_rng.uniform(
+        [bundle.price_range[0] for bundle in bundles],
+        [bundle.price_range[1] for bundle in bundles],
+        (num_flights, len(bundles)),
+    ).round(2)
+    fare_seats = fare_rng.integers(
+        [bundle.seats_range[0] for bundle in bundles],
+        [bundle.seats_range[1] + 1 for bundle in bundles],
+        (num_flights, len(bundles)),
+        dtype=np.int32,
+    )
+    add_on_price = add_on_rng.uniform(
+        [add_on.price_range[0] for add_on in ADD_ONS],
+        [add_on.price_range[1] for add_on in ADD_ONS],
+        (num_flights, len(ADD_ONS)),
+    ).round(2)
+
+    bucket_ids, bucket_starts = np.unique(bucket, return_index=True)
+    bucket_routes, bucket_days = np.divmod(bucket_ids, num_days)
+    columns: dict[str, npt.NDArray[Any]] = {
+        "id": ids,
+        "origin": np.array([route.origin for route in routes], dtype=np.bytes_)[route_idx],
+        "destination": np.array([route.destination for route in routes], dtype=np.bytes_)[route_idx],
+        "departure": departure,
+        "arrival": arrival,
+        "flight_number": flight_numbers[numbers],
+        "carrier": np.full(num_flights, carrier.encode()),
+        "fare_bundle": np.tile(np.arange(len(bundles), dtype=np.int8), (num_flights, 1)),
+        "fare_price": fare_price,
+        "fare_seats": fare_seats,
+        "fare_checked_bags": np.tile(
+            np.array([bundle.checked_bags_included for bundle in bundles], dtype=np.int8), (num_flights, 1)
+        ),
+        "add_on": np.tile(np.arange(len(ADD_ONS), dtype=np.int8), (num_flights, 1)),
+        "add_on_price": add_on_price,
+        # Same layout as `bucket_key`
+        "bucket_key": (bucket_routes << 32) | (start_date.toordinal() + bucket_days),
+        "bucket_start": np.append(bucket_starts, num_flights).astype(np.int64),
+    }
+
+    timezones = {route.origin: route.origin_timezone for route in routes}
+    timezones.update({route.destination: route.destination_timezone for route in routes})
+    return FlightTable(
+        columns,
+        {
+            "generator": "schedule",
+            "seed": seed,
+            "flight_data_date": start_date.isoformat(),
+            "flight_data_num_days": num_days,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": datetime.now(tz=UTC).isoformat(),
+            "routes": [[route.origin, route.destination] for route in routes],
+            "timezones": timezones,
+            **spec_catalogs(),
+        },
+    )
+
+
+def _utc_offsets(timezones: list[str], start_date: date, num_days: int) -> npt.NDArray[np.int64]:
+    """UTC offset in minutes of each timezone on each day, indexed like `timezones` and by day."""
+    # Offsets are taken at noon: every departure is after 06:00, and DST changes happen earlier in the night
+    names = sorted(set(timezones))
+    offsets = np.empty((len(names), num_days), dtype=np.int64)
+    for idx, name in enumerate(names):
+        zone = ZoneInfo(name)
+        for day in range(num_days):
+            noon = datetime.combine(date.fromordinal(start_date.toordinal() + day), time(12), tzinfo=zone)
+            offset = noon.utcoffset()
+            offsets[idx, day] = 0 if offset is None else offset.total_seconds() // 60
+    return offsets[[names.index(name) for name in timezones]]
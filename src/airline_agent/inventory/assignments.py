@@ -0,0 +1,40 @@
+"""
+Gate, terminal and seat choices derived from stable hashes of flight and booking IDs.
+
+Every choice is a pure function of the IDs involved, so it does not depend on which tools ran before it, in which
+order, or in which process, and the same flight always shows the same gates.
+"""
+
+import hashlib
+import random
+
+from airline_agent.data_generation.generate_flights import RNG_SEED
+
+DEPARTURE_TERMINALS = ["Terminal 1", "Terminal 2", "Terminal 3", "Terminal A", "Terminal B"]
+DEPARTURE_GATE_LETTERS = ["A", "B", "C", "D"]
+DEPARTURE_GATE_NUMBERS = (1, 50)
+ARRIVAL_TERMINALS = ["Terminal 1", "Terminal 2", "Terminal 3", "Terminal A", "Terminal B"]
+ARRIVAL_GATE_LETTERS = ["A", "B", "C", "D", "E"]
+ARRIVAL_GATE_NUMBERS = (1, 60)
+
+
+def stable_seed(*keys: str) -> int:
+    """64-bit seed for a tuple of IDs."""
+    key = ":".join((str(RNG_SEED), *keys))
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+
+def gates_and_terminals(flight_id: str) -> dict[str, str]:
+    """Departure and arrival terminal and gate of a flight, e.g. {"departure_gate": "B22", ...}."""
+    rng = random.Random(stable_seed("gates", flight_id))  # noqa: S311
+    return {
+        "departure_terminal": rng.choice(DEPARTURE_TERMINALS),
+        "departure_gate": f"{rng.choice(DEPARTURE_GATE_LETTERS)}{rng.randint(*DEPARTURE_GATE_NUMBERS)}",
+        "arrival_terminal": rng.choice(ARRIVAL_TERMINALS),
+        "arrival_gate": f"{rng.choice(ARRIVAL_GATE_LETTERS)}{rng.randint(*ARRIVAL_GATE_NUMBERS)}",
+    }
+
+
+def seat_seed(booking_id: str, flight_id: str) -> int:
+    """Seed that spreads a booking's seat over the free seats of a zone (see `SeatOccupancy.allocate`)."""
+    return stable_seed("seat", booking_id, flight_id)
@@ -0,0 +1,92 @@
+"""
+Deterministic operational timelines for flights: status changes, delays and gate changes.
+
+A flight's timeline is a list of events, each holding the complete operational state from its time on, so the state
+at any time is the last event at or before it, found with a binary search. Timelines are drawn from a stable hash of
+the flight ID (see `assignments`), so every process and every query order sees the same disruptions, and a query
+never changes state: advancing the clock only moves where the search lands.
+"""
+
+import bisect
+import functools
+import random
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+
+from airline_agent.inventory.assignments import DEPARTURE_GATE_NUMBERS, gates_and_terminals, stable_seed
+from airline_agent.types.booking import FlightStatus
+
+# Share of flights that are cancelled, and of the remaining flights that are delayed
+CANCELLATION_RATE = 0.02
+DELAY_RATE = 0.15
+# Delays are in 5-minute steps (inclusive range)
+DELAY_MINUTES = (15, 180)
+# How long before the scheduled departure a delay or cancellation is announced (inclusive range, in minutes)
+DISRUPTION_NOTICE_MINUTES = (30, 6 * 60)
+
+# Share of flights whose departure gate changes, and when (minutes before the scheduled departure)
+GATE_CHANGE_RATE = 0.1
+GATE_CHANGE_NOTICE_MINUTES = (20, 90)
+
+# Boarding starts this long before the (possibly delayed) departure
+BOARDING_LEAD_MINUTES = 15
+
+# Timelines kept in memory; each is a handful of events
+TIMELINE_CACHE_SIZE = 16384
+
+
+@dataclass(frozen=True, slots=True)
+class FlightEvent:
+    """Operational state of a flight from `at` until the next event. The first event of a timeline has no time."""
+
+    at: datetime | None
+    status: FlightStatus
+    delay_minutes: int | None
+    departure_gate: str
+
+
+class FlightTimeline:
+    def __init__(self, events: list[FlightEvent]) -> None:
+        self.events = events
+        self._times = [float("-inf") if event.at is None else event.at.timestamp() for event in events]
+
+    def at(self, when: datetime) -> FlightEvent:
+        """The state of the flight at a time."""
+        return self.events[bisect.bisect_right(self._times, when.timestamp()) - 1]
+
+
+@functools.lru_cache(maxsize=TIMELINE_CACHE_SIZE)
+def flight_timeline(flight_id: str, departure: datetime, arrival: datetime) -> FlightTimeline:
+    """The timeline of a flight with a scheduled departure and arrival."""
+    rng = random.Random(stable_seed("disruptions", flight_id))  # noqa: S311
+    gate = gates_and_terminals(flight_id)["departure_gate"]
+    state = FlightEvent(at=None, status="on_time", delay_minutes=None, departure_gate=gate)
+    changes: list[tuple[datetime, dict[str, object]]] = []
+
+    roll = rng.random()
+    notice = departure - timedelta(minutes=rng.randint(*DISRUPTION_NOTICE_MINUTES))
+    if roll < CANCELLATION_RATE:
+        return FlightTimeline([state, replace(state, at=notice, status="cancelled")])
+    delay = timedelta(0)
+    if roll < CANCELLATION_RATE + DELAY_RATE:
+        delay_minutes = rng.randrange(DELAY_MINUTES[0], DELAY_MINUTES[1] + 1, 5)
+        delay = timedelta(minutes=delay_minutes)
+        changes.append((notice, {"status": "delayed", "delay_minutes": delay_minutes}))
+
+    if rng.random() < GATE_CHANGE_RATE:
+        number = int(gate[1:])
+        new_number = rng.choice(
+            [n for n in range(DEPARTURE_GATE_NUMBERS[0], DEPARTURE_GATE_NUMBERS[1] + 1) if n != number]
+        )
+        changed_at = departure - timedelta(minutes=rng.randint(*GATE_CHANGE_NOTICE_MINUTES))
+        changes.append((changed_at, {"departure_gate": f"{gate[0]}{new_number}"}))
+
+    changes.append((departure + delay - timedelta(minutes=BOARDING_LEAD_MINUTES), {"status": "boarding"}))
+    changes.append((departure + delay, {"status": "departed"}))
+    changes.append((arrival + delay, {"status": "arrived"}))
+
+    events = [state]
+    for at, change in sorted(changes, key=lambda item: item[0]):
+        state = replace(state, at=at, **change)  # type: ignore[arg-type]
+        events.append(state)
+    return FlightTimeline(events)
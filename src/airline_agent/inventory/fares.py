@@ -0,0 +1,233 @@
+import bisect
+import heapq
+from collections.abc import Mapping
+from datetime import date, timedelta
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from airline_agent.inventory.snapshot import FlightTable
+from airline_agent.types.booking import FARE_TYPES, FareCalendarDay, FareSummary, FareType, RoundTripOption
+
+# flight ID -> fare type -> seats available, for fares whose availability differs from the inventory
+SeatOverrides = Mapping[str, Mapping[FareType, int]]
+
+FARE_TYPE_INDEX: dict[str, int] = {fare_type: idx for idx, fare_type in enumerate(FARE_TYPES)}
+
+
+class FareStore:
+    """
+    Fare prices, seat availability and checked bag allowances as `(flight_idx, fare_type_idx)` arrays.
+
+    The arrays are the shared, read-only fare columns of a `FlightTable`, so a route or date range is a contiguous
+    block of rows and queries over it are whole-array NumPy operations. Seat counts that a booking state has changed
+    are passed in as overrides, and only the rows they touch are patched.
+    """
+
+    def __init__(self, table: FlightTable) -> None:
+        self._table = table
+        self.price: npt.NDArray[np.float64] = table.columns["fare_price"]
+        self.seats_available: npt.NDArray[np.int32] = table.columns["fare_seats"]
+        self.checked_bags_included: npt.NDArray[np.int8] = table.columns["fare_checked_bags"]
+
+    def seats(self, rows: range, overrides: SeatOverrides) -> npt.NDArray[np.int32]:
+        """Seats available for a block of rows (rows x fare types), with overrides applied."""
+        seats = np.array(self.seats_available[rows.start : rows.stop])
+        for flight_id, fares in overrides.items():
+            row = self._table.find(flight_id)
+            if row is None or row not in rows:
+                continue
+            for fare_type, seats_available in fares.items():
+                seats[row - rows.start, FARE_TYPE_INDEX[fare_type]] = seats_available
+        return seats
+
+    def summarize(
+        self, rows: range, overrides: SeatOverrides, fare_types: tuple[FareType, ...] = FARE_TYPES
+    ) -> list[FareSummary]:
+        """Price range, availability and cheapest flight per fare type over a block of rows."""
+        return summarize_fares(
+            self._table.columns["id"][rows.start : rows.stop],
+            self.price[rows.start : rows.stop],
+            self.seats(rows, overrides),
+            fare_types,
+        )
+
+    def calendar(
+        self,
+        origin: str,
+        destination: str,
+        first_date: date,
+        last_date: date,
+        fare_type: FareType,
+        overrides: SeatOverrides,
+    ) -> list[FareCalendarDay]:
+        """Lowest available price and number of flights per departure date for a route."""
+        rows, days, starts = self._table.route_days(origin, destination, first_date, last_date)
+        return daily_fares(
+            first_date,
+            last_date,
+            days,
+            starts,
+            self._table.columns["id"][rows.start : rows.stop],
+            self.price[rows.start : rows.stop, FARE_TYPE_INDEX[fare_type]],
+            self.seats(rows, overrides)[:, FARE_TYPE_INDEX[fare_type]],
+        )
+
+
+def daily_fares(
+    first_date: date,
+    last_date: date,
+    days: npt.NDArray[np.int64],
+    starts: npt.NDArray[np.int64],
+    flight_ids: npt.NDArray[Any],
+    price: npt.NDArray[np.float64],
+    seats: npt.NDArray[np.int32],
+) -> list[FareCalendarDay]:
+    """
+    Per-day lowest available price for one fare type, over flights grouped by departure date.
+
+    `days` holds the date ordinal of each non-empty day and `starts` the index of its first flight in `flight_ids`,
+    `price` and `seats`. Days in the range without flights are reported with no flights and no price.
+    """
+    calendar = {
+        first_date.toordinal() + offset: FareCalendarDay(date=first_date + timedelta(days=offset), num_flights=0)
+        for offset in range((last_date - first_date).days + 1)
+    }
+    if len(days) == 0:
+        return list(calendar.values())
+
+    counts = np.diff(np.append(starts, len(price)))
+    available_price = np.where(seats > 0, price, np.inf)
+    min_price = np.minimum.reduceat(available_price, starts)
+    # First flight of each day whose price equals the day's minimum
+    positions = np.arange(len(price))
+    cheapest = np.minimum.reduceat(
+        np.where(available_price == np.repeat(min_price, counts), positions, len(price)), starts
+    )
+
+    for day, count, day_min, day_cheapest in zip(days, counts, min_price, cheapest, strict=True):
+        has_seats = bool(np.isfinite(day_min))
+        cheapest_id = flight_ids[day_cheapest] if has_seats else None
+        calendar[int(day)] = FareCalendarDay(
+            date=date.fromordinal(int(day)),
+            num_flights=int(count),
+            min_price=float(day_min) if has_seats else None,
+            cheapest_flight_id=cheapest_id.decode() if isinstance(cheapest_id, bytes) else cheapest_id,
+        )
+    return list(calendar.values())
+
+
+def summarize_fares(
+    flight_ids: npt.NDArray[Any],
+    price: npt.NDArray[np.float64],
+    seats: npt.NDArray[np.int32],
+    fare_types: tuple[FareType, ...] = FARE_TYPES,
+) -> list[FareSummary]:
+    """
+    Summarize `(flight, fare type)` price and seat arrays, with one column per entry of `FARE_TYPES`.
+
+    `flight_ids` holds the flight ID of each row, as `str` or UTF-8 `bytes`.
+    """
+    if len(price) == 0:
+        return [FareSummary(fare_type=fare_type, seats_available=0, flights_available=0) for fare_type in fare_types]
+
+    available = seats > 0
+    available_price = np.where(available, price, np.inf)
+    min_price = available_price.min(axis=0)
+    max_price = np.where(available, price, -np.inf).max(axis=0)
+    cheapest = available_price.argmin(axis=0)
+    seats_available = np.where(available, seats, 0).sum(axis=0)
+    flights_available = available.sum(axis=0)
+
+    summaries = []
+    for fare_type in fare_types:
+        idx = FARE_TYPE_INDEX[fare_type]
+        has_seats = bool(flights_available[idx])
+        cheapest_id = flight_ids[cheapest[idx]] if has_seats else None
+        summaries.append(
+            FareSummary(
+                fare_type=fare_type,
+                min_price=float(min_price[idx]) if has_seats else None,
+                max_price=float(max_price[idx]) if has_seats else None,
+                seats_available=int(seats_available[idx]),
+                flights_available=int(flights_available[idx]),
+                cheapest_flight_id=cheapest_id.decode() if isinstance(cheapest_id, bytes) else cheapest_id,
+            )
+        )
+    return summaries
+
+
+def cheapest_round_trips(
+    outbound: list[FareCalendarDay], inbound: list[FareCalendarDay], min_stay_days: int, limit: int
+) -> list[RoundTripOption]:
+    """
+    The `limit` cheapest (outbound date, return date) pairs with at least `min_stay_days` between them, cheapest first.
+
+    Both calendars are in date order. For each outbound date the eligible return dates are a suffix of the return
+    calendar, so candidates are kept in a heap as (outbound date, return date range) with the range's cheapest date
+    found by a sparse-table range minimum query. Popping a candidate splits its range around the date it used, so
+    finding the pairs takes O((days + limit) log days) rather than scoring every pairing.
+    """
+    outbound = [day for day in outbound if day.min_price is not None]
+    inbound = [day for day in inbound if day.min_price is not None]
+    if not outbound or not inbound:
+        return []
+
+    return_ordinals = [day.date.toordinal() for day in inbound]
+    return_prices = np.array([day.min_price for day in inbound], dtype=np.float64)
+    cheapest_return = _RangeArgmin(return_prices)
+
+    heap: list[tuple[float, int, int, int, int]] = []
+
+    def push(out_idx: int, lo: int, hi: int) -> None:
+        ret_idx = cheapest_return(lo, hi)
+        total = cast("float", outbound[out_idx].min_price) + float(return_prices[ret_idx])
+        heapq.heappush(heap, (total, out_idx, ret_idx, lo, hi))
+
+    for out_idx, day in enumerate(outbound):
+        first = bisect.bisect_left(return_ordinals, day.date.toordinal() + min_stay_days)
+        if first < len(inbound):
+            push(out_idx, first, len(inbound))
+
+    options: list[RoundTripOption] = []
+    while heap and len(options) < limit:
+        total, out_idx, ret_idx, lo, hi = heapq.heappop(heap)
+        out_day, ret_day = outbound[out_idx], inbound[ret_idx]
+        options.append(
+            RoundTripOption(
+                outbound_flight_id=cast("str", out_day.cheapest_flight_id),
+                return_flight_id=cast("str", ret_day.cheapest_flight_id),
+                outbound_date=out_day.date,
+                return_date=ret_day.date,
+                stay_days=(ret_day.date - out_day.date).days,
+                outbound_price=cast("float", out_day.min_price),
+                return_price=cast("float", ret_day.min_price),
+                total_price=round(total, 2),
+            )
+        )
+        if lo < ret_idx:
+            push(out_idx, lo, ret_idx)
+        if ret_idx + 1 < hi:
+            push(out_idx, ret_idx + 1, hi)
+    return options
+
+
+class _RangeArgmin:
+    """Sparse table answering "index of the smallest value in `values[lo:hi]`" in O(1), preferring the lowest index."""
+
+    def __init__(self, values: npt.NDArray[np.float64]) -> None:
+        self._values = values
+        # _levels[k][i] is the argmin of values[i : i + 2**k]
+        self._levels = [np.arange(len(values))]
+        width = 1
+        while 2 * width <= len(values):
+            left, right = self._levels[-1][:-width], self._levels[-1][width:]
+            self._levels.append(np.where(values[right] < values[left], right, left))
+            width *= 2
+
+    def __call__(self, lo: int, hi: int) -> int:
+        level = (hi - lo).bit_length() - 1
+        left = int(self._levels[level][lo])
+        right = int(self._levels[level][hi - (1 << level)])
+        return right if self._values[right] < self._values[left] else left
@@ -0,0 +1,335 @@
+import functools
+import logging
+from collections import OrderedDict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+
+from airline_agent.constants import FLIGHT_DATA_DATE, FLIGHT_DATA_NUM_DAYS
+from airline_agent.data_generation.generate_flights import (
+    EAGER_FLIGHT_DATA_VERSION,
+    LAZY_FLIGHT_DATA_VERSION,
+    ROUTES,
+    FlightRecord,
+    generate_bucket_records,
+    generate_flight_records,
+    generator_inputs_hash,
+    parse_flight_id,
+)
+from airline_agent.inventory.fares import FARE_TYPE_INDEX, FareStore, SeatOverrides, daily_fares, summarize_fares
+from airline_agent.inventory.snapshot import DEFAULT_SNAPSHOT_PATH, FlightTable, build_table, load_snapshot
+from airline_agent.types.booking import (
+    FARE_TYPES,
+    Fare,
+    FareCalendar,
+    FareType,
+    RouteFareSummary,
+    ServiceAddOnOption,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of (route, day) buckets kept in memory by the lazy inventory
+LAZY_INVENTORY_CACHE_SIZE = 2048
+
+BucketKey = tuple[str, str, date]
+
+
+class FlightInventory(Protocol):
+    """
+    Read-only flight inventory. Flights are returned as `FlightRecord`s, which tools turn into pydantic models only for
+    the flights they return; single fares and add-on lists are returned as models.
+    """
+
+    def get(self, flight_id: str) -> FlightRecord | None:
+        """Look up a flight by ID, returning None if it does not exist."""
+        ...
+
+    def has_flight(self, flight_id: str) -> bool:
+        """Whether a flight exists."""
+        ...
+
+    def search(self, origin: str, destination: str, departure_date: date) -> list[FlightRecord]:
+        """Flights for a route departing on the given local date, in departure order."""
+        ...
+
+    def find_flight_number(self, flight_number: str, departure_date: date) -> list[FlightRecord]:
+        """
+        Flights with a flight number (e.g. "F9 482") departing on a local date. A flight number can be used by more
+        than one flight on the same day; such flights are returned in departure order, then by flight ID.
+        """
+        ...
+
+    def fare(self, flight_id: str, fare_type: str) -> Fare | None:
+        """A single fare of a flight, returning None if the flight or fare does not exist."""
+        ...
+
+    def add_ons(self, flight_id: str) -> list[ServiceAddOnOption] | None:
+        """The add-ons offered on a flight, returning None if the flight does not exist."""
+        ...
+
+    def fare_summary(
+        self, origin: str, destination: str, first_date: date, last_date: date, seat_overrides: SeatOverrides
+    ) -> RouteFareSummary:
+        """Per-fare price range, availability and cheapest flight for a route over a range of local dates."""
+        ...
+
+    def fare_calendar(
+        self,
+        origin: str,
+        destination: str,
+        first_date: date,
+        last_date: date,
+        fare_type: FareType,
+        seat_overrides: SeatOverrides,
+    ) -> FareCalendar:
+        """Lowest available price and number of flights for a fare on each local date of a range, empty days included."""
+        ...
+
+
+class TableFlightInventory:
+    """
+    The complete version-1 inventory from `generate_flight_records`, stored as a columnar `FlightTable`.
+
+    The table is memory-mapped from the snapshot built by `create-flight-snapshot` when one is available, and is
+    otherwise generated in memory. `FlightRecord`s are built per lookup, and fare queries go through a `FareStore`
+    over the table's fare columns.
+    """
+
+    def __init__(self, snapshot_path: Path = DEFAULT_SNAPSHOT_PATH) -> None:
+        self._table = load_flight_table(snapshot_path)
+        self._fares = FareStore(self._table)
+
+    def get(self, flight_id: str) -> FlightRecord | None:
+        row = self._table.find(flight_id)
+        return None if row is None else self._table.record(row)
+
+    def has_flight(self, flight_id: str) -> bool:
+        return self._table.find(flight_id) is not None
+
+    def search(self, origin: str, destination: str, departure_date: date) -> list[FlightRecord]:
+        return [self._table.record(row) for row in self._table.bucket_rows(origin, destination, departure_date)]
+
+    def find_flight_number(self, flight_number: str, departure_date: date) -> list[FlightRecord]:
+        return [self._table.record(row) for row in self._table.find_flight_number(flight_number, departure_date)]
+
+    def fare(self, flight_id: str, fare_type: str) -> Fare | None:
+        row = self._table.find(flight_id)
+        if row is None or fare_type not in FARE_TYPE_INDEX:
+            return None
+        return self._table.fare(row, FARE_TYPE_INDEX[fare_type])
+
+    def add_ons(self, flight_id: str) -> list[ServiceAddOnOption] | None:
+        row = self._table.find(flight_id)
+        return None if row is None else self._table.add_ons(row)
+
+    def fare_summary(
+        self, origin: str, destination: str, first_date: date, last_date: date, seat_overrides: SeatOverrides
+    ) -> RouteFareSummary:
+        rows = self._table.route_rows(origin, destination, first_date, last_date)
+        return RouteFareSummary(
+            origin=origin,
+            destination=destination,
+            start_date=first_date,
+            end_date=last_date,
+            num_flights=len(rows),
+            fares=self._fares.summarize(rows, seat_overrides),
+        )
+
+    def fare_calendar(
+        self,
+        origin: str,
+        destination: str,
+        first_date: date,
+        last_date: date,
+        fare_type: FareType,
+        seat_overrides: SeatOverrides,
+    ) -> FareCalendar:
+        return FareCalendar(
+            origin=origin,
+            destination=destination,
+            fare_type=fare_type,
+            days=self._fares.calendar(origin, destination, first_date, last_date, fare_type, seat_overrides),
+        )
+
+
+def load_flight_table(snapshot_path: Path = DEFAULT_SNAPSHOT_PATH) -> FlightTable:
+    """The version-1 inventory from its snapshot if there is a current one, and otherwise generated in memory."""
+    table = load_snapshot(snapshot_path)
+    if table is None or not _matches_flight_data(table):
+        logger.info("no flight inventory snapshot at %s, generating flights in memory", snapshot_path)
+        table = build_flight_table()
+    return table
+
+
+def build_flight_table() -> FlightTable:
+    """Generate the version-1 inventory as a `FlightTable`."""
+    return build_table(
+        generate_flight_records(),
+        flight_data_version=EAGER_FLIGHT_DATA_VERSION,
+        flight_data_date=FLIGHT_DATA_DATE.isoformat(),
+        flight_data_num_days=FLIGHT_DATA_NUM_DAYS,
+        generator_inputs_hash=generator_inputs_hash(),
+    )
+
+
+def _matches_flight_data(table: FlightTable) -> bool:
+    return (
+        table.meta.get("flight_data_version") == EAGER_FLIGHT_DATA_VERSION
+        and table.meta.get("flight_data_date") == FLIGHT_DATA_DATE.isoformat()
+        and table.meta.get("flight_data_num_days") == FLIGHT_DATA_NUM_DAYS
+        and table.meta.get("generator_inputs_hash") == generator_inputs_hash()
+    )
+
+
+class LazyFlightInventory:
+    """
+    The version-2 inventory, generated one (route, day) bucket at a time on first access.
+
+    Generated buckets are kept in a bounded LRU cache as `FlightRecord`s, which hold only each flight's schedule and
+    price vectors. Evicting a bucket is safe because flights are never modified in place (see `FlightOverlay`); a
+    bucket that is generated again is identical.
+    """
+
+    def __init__(self, cache_size: int = LAZY_INVENTORY_CACHE_SIZE) -> None:
+        self._cache_size = cache_size
+        self._cache: OrderedDict[BucketKey, list[FlightRecord]] = OrderedDict()
+        self._routes = frozenset(ROUTES)
+        self._first_day = FLIGHT_DATA_DATE
+        self._last_day = FLIGHT_DATA_DATE + timedelta(days=FLIGHT_DATA_NUM_DAYS - 1)
+
+    def get(self, flight_id: str) -> FlightRecord | None:
+        key = parse_flight_id(flight_id)
+        if key is None:
+            return None
+        return next((record for record in self.search(*key) if record.id == flight_id), None)
+
+    def has_flight(self, flight_id: str) -> bool:
+        return self.get(flight_id) is not None
+
+    def search(self, origin: str, destination: str, departure_date: date) -> list[FlightRecord]:
+        key = (origin, destination, departure_date)
+        if not self._in_range(key):
+            return []
+        return list(self._bucket(key))
+
+    def find_flight_number(self, flight_number: str, departure_date: date) -> list[FlightRecord]:
+        records = [
+            record
+            for origin, destination in ROUTES
+            for record in self.search(origin, destination, departure_date)
+            if record.flight_number == flight_number
+        ]
+        return sorted(records, key=lambda record: (record.departure, record.id))
+
+    def fare(self, flight_id: str, fare_type: str) -> Fare | None:
+        record = self.get(flight_id)
+        if record is None or fare_type not in FARE_TYPE_INDEX:
+            return None
+        return record.fare(FARE_TYPE_INDEX[fare_type])
+
+    def add_ons(self, flight_id: str) -> list[ServiceAddOnOption] | None:
+        record = self.get(flight_id)
+        return None if record is None else record.add_ons()
+
+    def fare_summary(
+        self, origin: str, destination: str, first_date: date, last_date: date, seat_overrides: SeatOverrides
+    ) -> RouteFareSummary:
+        records = [
+            record
+            for day in range((last_date - first_date).days + 1)
+            for record in self.search(origin, destination, first_date + timedelta(days=day))
+        ]
+        return RouteFareSummary(
+            origin=origin,
+            destination=destination,
+            start_date=first_date,
+            end_date=last_date,
+            num_flights=len(records),
+            fares=summarize_fares(
+                np.array([record.id for record in records]),
+                np.array([record.fare_prices for record in records], dtype=np.float64).reshape(-1, len(FARE_TYPES)),
+                np.array(
+                    [
+                        [
+                            seat_overrides.get(record.id, {}).get(fare_type, seats)
+                            for fare_type, seats in zip(FARE_TYPES, record.fare_seats, strict=True)
+                        ]
+                        for record in records
+                    ],
+                    dtype=np.int32,
+                ).reshape(-1, len(FARE_TYPES)),
+                FARE_TYPES,
+            ),
+        )
+
+    def fare_calendar(
+        self,
+        origin: str,
+        destination: str,
+        first_date: date,
+        last_date: date,
+        fare_type: FareType,
+        seat_overrides: SeatOverrides,
+    ) -> FareCalendar:
+        records: list[FlightRecord] = []
+        days, starts = [], []
+        for offset in range((last_date - first_date).days + 1):
+            day = first_date + timedelta(days=offset)
+            bucket = self.search(origin, destination, day)
+            if bucket:
+                days.append(day.toordinal())
+                starts.append(len(records))
+                records.extend(bucket)
+        fare_idx = FARE_TYPE_INDEX[fare_type]
+        return FareCalendar(
+            origin=origin,
+            destination=destination,
+            fare_type=fare_type,
+            days=daily_fares(
+                first_date,
+                last_date,
+                np.array(days, dtype=np.int64),
+                np.array(starts, dtype=np.int64),
+                np.array([record.id for record in records]),
+                np.array([record.fare_prices[fare_idx] for record in records], dtype=np.float64),
+                np.array(
+                    [
+                        seat_overrides.get(record.id, {}).get(fare_type, record.fare_seats[fare_idx])
+                        for record in records
+                    ],
+                    dtype=np.int32,
+                ),
+            ),
+        )
+
+    def _bucket(self, key: BucketKey) -> list[FlightRecord]:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        records = generate_bucket_records(*key)
+        self._cache[key] = records
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return records
+
+    def _in_range(self, key: BucketKey) -> bool:
+        origin, destination, departure_date = key
+        return (origin, destination) in self._routes and self._first_day <= departure_date <= self._last_day
+
+
+@functools.cache
+def shared_flight_inventory(version: int) -> FlightInventory:
+    """
+    The process-wide inventory for a flight data version.
+
+    Inventories are read-only, so they are generated once and shared by every `BookingTools` instance.
+    """
+    if version == EAGER_FLIGHT_DATA_VERSION:
+        return TableFlightInventory()
+    if version == LAZY_FLIGHT_DATA_VERSION:
+        return LazyFlightInventory()
+    msg = f"Unknown flight data version: {version}"
+    raise ValueError(msg)
@@ -0,0 +1,34 @@
+import threading
+import zlib
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+
+# Number of locks flights are spread over; flights sharing a lock only contend with each other
+NUM_FLIGHT_LOCK_STRIPES = 64
+
+
+class FlightLocks:
+    """
+    Per-flight locks, striped over a fixed set of locks so memory does not grow with the number of flights.
+
+    `hold` takes the locks of several flights at once, always in stripe order, so concurrent multi-flight operations
+    cannot deadlock. With a single stripe this degenerates to one global lock. Any string can be locked this way;
+    booking tools also lock booking IDs, together with the flights they change.
+    """
+
+    def __init__(self, stripes: int = NUM_FLIGHT_LOCK_STRIPES) -> None:
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, flight_id: str) -> int:
+        return zlib.crc32(flight_id.encode()) % len(self._locks)
+
+    @contextmanager
+    def hold(self, *flight_ids: str) -> Iterator[None]:
+        with ExitStack() as stack:
+            for stripe in sorted({self._stripe(flight_id) for flight_id in flight_ids}):
+                stack.enter_context(self._locks[stripe])
+            yield
+
+
+# Shared by every booking session; sessions only contend when they change the same flights
+FLIGHT_LOCKS = FlightLocks()
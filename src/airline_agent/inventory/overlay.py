@@ -0,0 +1,107 @@
+import dataclasses
+import threading
+from collections import Counter
+from collections.abc import Mapping, Sequence
+
+from airline_agent.data_generation.generate_flights import FlightRecord
+from airline_agent.inventory.locks import FLIGHT_LOCKS, FlightLocks
+from airline_agent.inventory.seats import SeatOccupancy
+from airline_agent.types.booking import FARE_TYPES, Fare, FareType
+
+
+class FlightOverlay:
+    """
+    Copy-on-write layer over the shared, read-only flight inventory.
+
+    The inventory's flight records are never modified. Seat counts are recorded here per flight ID, and `view`
+    applies them to a copy of the record only for flights that changed. Seat occupancy is kept here too. Discarding
+    the overlay restores the pristine inventory.
+
+    Each booking session has its own overlay, so seat availability is per session by design: every conversation books
+    against its own copy of the inventory and does not see seats taken in others. Two sessions can therefore both
+    book a flight's last seat, or the same seat; the locks only keep a session from overselling its own copy.
+
+    The overlay is safe to use from several threads. Changes to a flight are made under that flight's lock (see
+    `FlightLocks`), and the per-flight records are replaced rather than modified, so readers never see a partial
+    change and can iterate `seats_available` while other threads write.
+    """
+
+    def __init__(self, locks: FlightLocks = FLIGHT_LOCKS) -> None:
+        self._locks = locks
+        # Guards publishing new records, which replaces the outer dicts
+        self._publish_lock = threading.Lock()
+        self._seats_available: dict[str, dict[FareType, int]] = {}
+        self._seat_occupancy: dict[str, SeatOccupancy] = {}
+
+    def view(self, record: FlightRecord) -> FlightRecord:
+        """The flight as seen through this overlay. Applying `view` to a flight that is already a view is a no-op."""
+        seats_available = self._seats_available.get(record.id)
+        if not seats_available:
+            return record
+        return dataclasses.replace(
+            record,
+            fare_seats=tuple(
+                seats_available.get(fare_type, seats)
+                for fare_type, seats in zip(FARE_TYPES, record.fare_seats, strict=True)
+            ),
+        )
+
+    def view_fare(self, flight_id: str, fare: Fare) -> Fare:
+        """A fare of a flight as seen through this overlay."""
+        seats_available = self._seats_available.get(flight_id, {}).get(fare.fare_type)
+        return fare if seats_available is None else fare.model_copy(update={"seats_available": seats_available})
+
+    @property
+    def seats_available(self) -> Mapping[str, Mapping[FareType, int]]:
+        """Seat counts that differ from the inventory, by flight ID and fare type."""
+        return self._seats_available
+
+    def take_seats(self, fares: Sequence[tuple[str, Fare]]) -> bool:
+        """
+        Take one seat of each fare, all or nothing.
+
+        `fares` are (flight ID, fare) pairs, with the fares as stored in the inventory; a fare listed twice takes two
+        seats. The locks of all the flights are held while the seats are checked and taken, so concurrent callers
+        cannot sell the same seat. Returns False, changing nothing, if any fare has too few seats left.
+        """
+        wanted = Counter((flight_id, fare.fare_type) for flight_id, fare in fares)
+        inventory_seats = {(flight_id, fare.fare_type): fare.seats_available for flight_id, fare in fares}
+        with self._locks.hold(*(flight_id for flight_id, _ in wanted)):
+            changes: dict[str, dict[FareType, int]] = {}
+            for (flight_id, fare_type), count in wanted.items():
+                left = self._seats_available.get(flight_id, {}).get(fare_type, inventory_seats[flight_id, fare_type])
+                if left < count:
+                    return False
+                changes.setdefault(flight_id, {})[fare_type] = left - count
+            self._publish_seats(changes)
+        return True
+
+    def release_seats(self, fares: Sequence[tuple[str, Fare]]) -> None:
+        """Give back one seat of each fare, undoing `take_seats` with the same (flight ID, fare) pairs."""
+        released = Counter((flight_id, fare.fare_type) for flight_id, fare in fares)
+        inventory_seats = {(flight_id, fare.fare_type): fare.seats_available for flight_id, fare in fares}
+        with self._locks.hold(*(flight_id for flight_id, _ in released)):
+            changes: dict[str, dict[FareType, int]] = {}
+            for (flight_id, fare_type), count in released.items():
+                left = self._seats_available.get(flight_id, {}).get(fare_type, inventory_seats[flight_id, fare_type])
+                changes.setdefault(flight_id, {})[fare_type] = left + count
+            self._publish_seats(changes)
+
+    def _publish_seats(self, changes: Mapping[str, Mapping[FareType, int]]) -> None:
+        # Callers hold the locks of the changed flights
+        with self._publish_lock:
+            self._seats_available = {
+                **self._seats_available,
+                **{
+                    flight_id: {**self._seats_available.get(flight_id, {}), **fares}
+                    for flight_id, fares in changes.items()
+                },
+            }
+
+    def seat_occupancy(self, flight_id: str) -> SeatOccupancy:
+        """The seat occupancy of a flight, created empty on first use."""
+        occupancy = self._seat_occupancy.get(flight_id)
+        if occupancy is None:
+            with self._publish_lock:
+                occupancy = self._seat_occupancy.setdefault(flight_id, SeatOccupancy())
+        return occupancy
@@ -0,0 +1,121 @@
+"""
+Seat occupancy for the cabin layout shared by every flight: rows 1-40 with seats A-F in a 3-3 configuration.
+
+Occupancy is a bitset (a Python int) with one bit per seat, numbered row by row from 1A. Zones and seat positions
+are precomputed masks over the same bits, so the free seats matching a request are one AND of masks, and picking
+one is a shift and the lowest set bit.
+"""
+
+import re
+import threading
+from collections.abc import Iterator
+
+from airline_agent.types.booking import SeatType
+
+ROWS = 40
+SEAT_LETTERS = "ABCDEF"
+
+# Rows of each seating zone (inclusive)
+ZONE_ROWS: dict[SeatType, tuple[int, int]] = {
+    "upfront_plus": (1, 2),
+    "stretch": (3, 15),
+    "standard": (16, 40),
+}
+
+SEAT_POSITIONS = {
+    "window": "AF",
+    "middle": "BE",
+    "aisle": "CD",
+}
+
+_SEAT_PATTERN = re.compile(rf"(?P<row>\d{{1,2}})(?P<letter>[{SEAT_LETTERS}])")
+
+
+def _mask(rows: range, letters: str) -> int:
+    mask = 0
+    for row in rows:
+        for letter in letters:
+            mask |= 1 << seat_bit(row, letter)
+    return mask
+
+
+def seat_bit(row: int, letter: str) -> int:
+    return (row - 1) * len(SEAT_LETTERS) + SEAT_LETTERS.index(letter)
+
+
+def seat_label(bit: int) -> str:
+    row, col = divmod(bit, len(SEAT_LETTERS))
+    return f"{row + 1}{SEAT_LETTERS[col]}"
+
+
+def parse_seat(seat: str) -> int | None:
+    """Bit of a seat label such as "12A", or None if it is not a seat in the layout."""
+    match = _SEAT_PATTERN.fullmatch(seat.strip().upper())
+    if match is None or not 1 <= int(match["row"]) <= ROWS:
+        return None
+    return seat_bit(int(match["row"]), match["letter"])
+
+
+ZONE_MASKS: dict[SeatType, int] = {
+    zone: _mask(range(first, last + 1), SEAT_LETTERS) for zone, (first, last) in ZONE_ROWS.items()
+}
+POSITION_MASKS: dict[str, int] = {
+    position: _mask(range(1, ROWS + 1), letters) for position, letters in SEAT_POSITIONS.items()
+}
+
+
+def zone_of(bit: int) -> SeatType:
+    return next(zone for zone, mask in ZONE_MASKS.items() if mask >> bit & 1)
+
+
+class SeatOccupancy:
+    """Occupied seats of one flight. Reserving and allocating seats is thread-safe."""
+
+    def __init__(self) -> None:
+        self._occupied = 0
+        self._lock = threading.Lock()
+
+    def is_free(self, bit: int) -> bool:
+        return not self._occupied >> bit & 1
+
+    def reserve(self, bit: int) -> bool:
+        """Mark a seat as occupied, returning False if it already was."""
+        with self._lock:
+            if not self.is_free(bit):
+                return False
+            self._occupied |= 1 << bit
+            return True
+
+    def release(self, bit: int) -> None:
+        with self._lock:
+            self._occupied &= ~(1 << bit)
+
+    def free_seats(self, zone: SeatType, position: str | None = None) -> int:
+        """Mask of the free seats in a zone, optionally only those in a position ("window", "middle", "aisle")."""
+        free = ZONE_MASKS[zone] & ~self._occupied
+        return free & POSITION_MASKS[position] if position in POSITION_MASKS else free
+
+    def allocate(self, zone: SeatType, position: str | None = None, seed: int = 0) -> str | None:
+        """
+        Reserve a free seat in a zone, in the requested position if one is free there and anywhere in the zone
+        otherwise. `seed` picks where in the zone to start looking, so different bookings spread over the zone; the
+        first free seat from there on (wrapping around to the front of the zone) is taken. Returns the seat label, or
+        None if the zone is full.
+        """
+        with self._lock:
+            free = self.free_seats(zone, position) or self.free_seats(zone)
+            if not free:
+                return None
+            zone_mask = ZONE_MASKS[zone]
+            start = (zone_mask & -zone_mask).bit_length() - 1 + seed % zone_mask.bit_count()
+            candidates = (free >> start << start) or free
+            bit = (candidates & -candidates).bit_length() - 1
+            self._occupied |= 1 << bit
+        return seat_label(bit)
+
+    def occupied_seats(self, zone: SeatType) -> Iterator[str]:
+        occupied = ZONE_MASKS[zone] & self._occupied
+        while occupied:
+            lowest = occupied & -occupied
+            yield seat_label(lowest.bit_length() - 1)
+            occupied ^= lowest
@@ -0,0 +1,269 @@
+"""
+Columnar, memory-mappable snapshot of the flight inventory.
+
+A snapshot is a directory holding one `.npy` file per column plus `meta.json`. Rows are sorted by route, local
+departure date and departure time, so the flights of one (route, day) bucket are a contiguous slice that is located
+with a binary search over `bucket_key`, and the flights of a route over a date range are a contiguous slice as well.
+Fare columns are `(flight, fare type)` arrays with one column per entry of `FARE_TYPES`. Fare bundles and add-on
+options are dictionary-encoded against catalogs stored in the metadata. Loading maps the column files read-only, so
+processes share the pages and startup does not depend on the size of the inventory; `FlightRecord`s and fare and
+add-on models are only built for the rows that are read.
+"""
+
+import functools
+import json
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import numpy.typing as npt
+
+from airline_agent.data_generation.generate_flights import (
+    ADD_ONS,
+    CARRIER_CODE,
+    FARE_BUNDLES,
+    FlightRecord,
+    parse_flight_id,
+)
+from airline_agent.types.booking import Fare, ServiceAddOnOption
+
+SNAPSHOT_FORMAT_VERSION = 2
+DEFAULT_SNAPSHOT_PATH = Path(__file__).resolve().parents[3] / "data" / "flight-inventory"
+
+_META_FILE = "meta.json"
+_COLUMNS = (
+    "id",
+    "origin",
+    "destination",
+    "departure",
+    "arrival",
+    "flight_number",
+    "carrier",
+    "fare_bundle",
+    "fare_price",
+    "fare_seats",
+    "fare_checked_bags",
+    "add_on",
+    "add_on_price",
+    "bucket_key",
+    "bucket_start",
+)
+
+
+def bucket_key(route_idx: int, day: date) -> int:
+    """Sortable integer key for a (route, local departure date) bucket."""
+    return (route_idx << 32) | day.toordinal()
+
+
+class FlightTable:
+    """Column arrays for a set of flights, plus the catalogs needed to turn a row back into a `FlightRecord`."""
+
+    def __init__(self, columns: dict[str, npt.NDArray[Any]], meta: dict[str, Any]) -> None:
+        self.columns = columns
+        self.meta = meta
+        self.routes: dict[tuple[str, str], int] = {
+            (origin, destination): idx for idx, (origin, destination) in enumerate(meta["routes"])
+        }
+        self._timezones = {airport: ZoneInfo(name) for airport, name in meta["timezones"].items()}
+        self._fare_bundles: list[dict[str, Any]] = meta["fare_bundles"]
+        self._add_ons: list[dict[str, Any]] = meta["add_ons"]
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def bucket_rows(self, origin: str, destination: str, departure_date: date) -> range:
+        """Row range of the flights for a route departing on a local date."""
+        return self.route_rows(origin, destination, departure_date, departure_date)
+
+    def route_rows(self, origin: str, destination: str, first_date: date, last_date: date) -> range:
+        """Row range of the flights for a route departing between two local dates (inclusive)."""
+        buckets = self._bucket_span(origin, destination, first_date, last_date)
+        starts = self.columns["bucket_start"]
+        return range(int(starts[buckets.start]), int(starts[buckets.stop]))
+
+    def route_days(
+        self, origin: str, destination: str, first_date: date, last_date: date
+    ) -> tuple[range, npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """
+        Row range of the flights for a route between two local dates (inclusive), together with the date ordinal of
+        each non-empty day in the range and the offset of that day's first flight within the row range.
+        """
+        buckets = self._bucket_span(origin, destination, first_date, last_date)
+        starts = self.columns["bucket_start"][buckets.start : buckets.stop + 1]
+        rows = range(int(starts[0]), int(starts[-1]))
+        days = self.columns["bucket_key"][buckets.start : buckets.stop] & 0xFFFFFFFF
+        return rows, np.asarray(days), np.asarray(starts[:-1] - rows.start)
+
+    def _bucket_span(self, origin: str, destination: str, first_date: date, last_date: date) -> range:
+        route_idx = self.routes.get((origin, destination))
+        if route_idx is None or last_date < first_date:
+            return range(0)
+        keys = self.columns["bucket_key"]
+        first = int(np.searchsorted(keys, bucket_key(route_idx, first_date), side="left"))
+        last = int(np.searchsorted(keys, bucket_key(route_idx, last_date), side="right"))
+        return range(first, last)
+
+    def find(self, flight_id: str) -> int | None:
+        """Row of a flight, located through the bucket encoded in its ID (e.g. "F9-SFO-JFK-2025-11-12T08:15")."""
+        bucket = parse_flight_id(flight_id)
+        if bucket is None:
+            return None
+        encoded = flight_id.encode()
+        ids = self.columns["id"]
+        return next((row for row in self.bucket_rows(*bucket) if ids[row] == encoded), None)
+
+    def find_flight_number(self, flight_number: str, departure_date: date) -> list[int]:
+        """Rows of the flights with a flight number departing on a local date, in departure order."""
+        return self._flight_number_index.get((flight_number.encode(), departure_date.toordinal()), [])
+
+    @functools.cached_property
+    def _flight_number_index(self) -> dict[tuple[bytes, int], list[int]]:
+        c = self.columns
+        days = np.repeat(c["bucket_key"] & 0xFFFFFFFF, np.diff(c["bucket_start"]))
+        # Departure order, then flight ID, so flights sharing a number on the same day are listed deterministically
+        order = np.lexsort((c["id"], c["departure"]))
+        index: dict[tuple[bytes, int], list[int]] = {}
+        for row, flight_number, day in zip(
+            order.tolist(), c["flight_number"][order].tolist(), days[order].tolist(), strict=True
+        ):
+            index.setdefault((flight_number, day), []).append(row)
+        return index
+
+    def record(self, row: int) -> FlightRecord:
+        """
+        The `FlightRecord` of a row. The price columns are taken as they are, since the fare bundle and add-on
+        catalogs of tables built by `build_table` and `generate_schedule` are those of `spec_catalogs`.
+        """
+        c = self.columns
+        origin = c["origin"][row].decode()
+        destination = c["destination"][row].decode()
+        return FlightRecord(
+            id=c["id"][row].decode(),
+            origin=origin,
+            destination=destination,
+            departure=datetime.fromtimestamp(int(c["departure"][row]), tz=self._timezones[origin]),
+            arrival=datetime.fromtimestamp(int(c["arrival"][row]), tz=self._timezones[destination]),
+            flight_number=c["flight_number"][row].decode(),
+            fare_prices=tuple(c["fare_price"][row].tolist()),
+            fare_seats=tuple(c["fare_seats"][row].tolist()),
+            add_on_prices=tuple(c["add_on_price"][row].tolist()),
+            carrier=c["carrier"][row].decode(),
+        )
+
+    def add_ons(self, row: int) -> list[ServiceAddOnOption]:
+        """Build the add-on options offered on a row."""
+        c = self.columns
+        return [
+            ServiceAddOnOption(**self._add_ons[add_on], price=float(price))
+            for add_on, price in zip(c["add_on"][row], c["add_on_price"][row], strict=True)
+        ]
+
+    def fare(self, row: int, fare_idx: int) -> Fare:
+        """Build the `Fare` model for a row and fare type column."""
+        c = self.columns
+        return Fare(
+            **self._fare_bundles[c["fare_bundle"][row, fare_idx]],
+            price_total=float(c["fare_price"][row, fare_idx]),
+            seats_available=int(c["fare_seats"][row, fare_idx]),
+            checked_bags_included=int(c["fare_checked_bags"][row, fare_idx]),
+        )
+
+
+def spec_catalogs() -> dict[str, list[dict[str, Any]]]:
+    """
+    The `fare_bundles` and `add_ons` catalogs of `FARE_BUNDLES` and `ADD_ONS`, for tables whose `fare_bundle` and
+    `add_on` columns index those tables directly.
+    """
+    return {
+        "fare_bundles": [
+            {"currency": "USD", "fare_type": fare_type, "included_services": list(bundle.included_services)}
+            for fare_type, bundle in FARE_BUNDLES.items()
+        ],
+        "add_ons": [
+            {"currency": "USD", "description": add_on.description, "service_type": add_on.service_type}
+            for add_on in ADD_ONS
+        ],
+    }
+
+
+def build_table(records: Iterable[FlightRecord], **meta: Any) -> FlightTable:
+    """
+    Encode generated flights into a `FlightTable`. Extra keyword arguments are stored in the table metadata.
+
+    Flights are deduplicated by ID (the last one wins, as when building a dict). Records already hold their fares and
+    add-ons as price vectors over `FARE_BUNDLES` and `ADD_ONS`, so those become the catalogs unchanged. Only scheduled
+    inventory is stored: operational fields such as gates and status are left at their defaults.
+    """
+    by_id = {record.id: record for record in records}
+    routes = sorted({(record.origin, record.destination) for record in by_id.values()})
+    route_idx = {route: idx for idx, route in enumerate(routes)}
+
+    def sort_key(record: FlightRecord) -> tuple[int, date, datetime]:
+        return (route_idx[(record.origin, record.destination)], record.departure.date(), record.departure)
+
+    rows = sorted(by_id.values(), key=sort_key)
+
+    timezones: dict[str, str] = {}
+    for record in rows:
+        timezones.setdefault(record.origin, str(record.departure.tzinfo))
+        timezones.setdefault(record.destination, str(record.arrival.tzinfo))
+
+    keys = np.array([bucket_key(*sort_key(record)[:2]) for record in rows], dtype=np.int64)
+    bucket_keys, bucket_starts = np.unique(keys, return_index=True)
+    bundles = list(FARE_BUNDLES.values())
+
+    columns: dict[str, npt.NDArray[Any]] = {
+        "id": np.array([record.id for record in rows], dtype=np.bytes_),
+        "origin": np.array([record.origin for record in rows], dtype=np.bytes_),
+        "destination": np.array([record.destination for record in rows], dtype=np.bytes_),
+        "departure": np.array([int(record.departure.timestamp()) for record in rows], dtype=np.int64),
+        "arrival": np.array([int(record.arrival.timestamp()) for record in rows], dtype=np.int64),
+        "flight_number": np.array([record.flight_number for record in rows], dtype=np.bytes_),
+        "carrier": np.full(len(rows), CARRIER_CODE.encode()),
+        "fare_bundle": np.tile(np.arange(len(bundles), dtype=np.int8), (len(rows), 1)),
+        "fare_price": np.array([record.fare_prices for record in rows], dtype=np.float64).reshape(-1, len(bundles)),
+        "fare_seats": np.array([record.fare_seats for record in rows], dtype=np.int32).reshape(-1, len(bundles)),
+        "fare_checked_bags": np.tile(
+            np.array([bundle.checked_bags_included for bundle in bundles], dtype=np.int8), (len(rows), 1)
+        ),
+        "add_on": np.tile(np.arange(len(ADD_ONS), dtype=np.int8), (len(rows), 1)),
+        "add_on_price": np.array([record.add_on_prices for record in rows], dtype=np.float64).reshape(-1, len(ADD_ONS)),
+        "bucket_key": bucket_keys,
+        "bucket_start": np.append(bucket_starts, len(rows)).astype(np.int64),
+    }
+    return FlightTable(
+        columns,
+        {
+            **meta,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": datetime.now(tz=UTC).isoformat(),
+            "routes": routes,
+            "timezones": timezones,
+            **spec_catalogs(),
+        },
+    )
+
+
+def write_snapshot(table: FlightTable, path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    for name in _COLUMNS:
+        np.save(path / f"{name}.npy", table.columns[name])
+    # Written last, so a directory with metadata always has complete columns
+    with (path / _META_FILE).open("w") as f:
+        json.dump(table.meta, f, indent=2)
+
+
+def load_snapshot(path: Path) -> FlightTable | None:
+    """Memory-map a snapshot, returning None if there is no usable snapshot at the path."""
+    meta_path = path / _META_FILE
+    if not meta_path.exists():
+        return None
+    with meta_path.open() as f:
+        meta = json.load(f)
+    if meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return None
+    columns = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in _COLUMNS}
+    return FlightTable(columns, meta)
@@ -73,7 +73,7 @@ The agent under test (AUT) is a customer support agent for Frontier Airlines. It
 
 In case it is helpful to you, you also have direct access to the list of tools that the AUT has access to.
 
-The state associated with these tools, in particular, booking state, can be reset by calling reset_booking_state().
+The state associated with these tools, in particular, booking state, can be reset by calling reset_booking_state(). Bookings are kept per chat thread, so a new AUT thread always starts without bookings; if the tools use a durable reservation store, the reset keeps bookings made earlier.
 """.strip()
 
 
@@ -109,7 +109,9 @@ def get_trace_of_agent_under_test(ctx: RunContext[Dependencies]) -> list[ChatCom
 
 def reset_booking_state(_ctx: RunContext[Dependencies]) -> None:
     """
-    This is useful to reset the state associated with the tools that the agent under test has access to.
+    Reset the state associated with the tools that the agent under test has access to: the bookings and seat changes
+    of every chat thread. If the tools use a durable reservation store (RESERVATION_DB_PATH or
+    RESERVATION_JOURNAL_PATH), its bookings are kept, and a thread used again sees the seats its bookings took.
     """
     booking._reset()  # noqa: SLF001
 
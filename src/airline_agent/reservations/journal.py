@@ -0,0 +1,310 @@
+"""
+Event-sourced reservation store: an append-only journal of booking changes, with periodic snapshots.
+
+Every `save` appends one JSON line to `journal.jsonl` in the store's directory. The first save of a booking records
+it in full; later saves record only what changed since the booking was last saved (a status change, an add-on, a
+check-in), as changes to its JSON form (see `diff`), and saves that change nothing are not recorded. Entries are
+numbered, so the journal is an audit trail of every change to every booking, and `replay_journal` rebuilds the
+bookings as they were after any entry, e.g. to reproduce the state a red-teaming session saw.
+
+Every `snapshot_interval` entries, the state is written to `snapshot.jsonl`: a header line with the number of the last
+entry it includes and the journal offset after it, then a line per booking. Opening a store loads the snapshot and
+replays only the entries after it, so startup reads a bounded tail of the journal however long it grows. Bookings are
+held as their JSON, as in the `data` column of `SqliteReservationStore`, and a snapshot line keeps the JSON as it is,
+so loading a snapshot splits lines rather than parsing bookings, and a booking is parsed when it is read. Snapshots
+are written to a temporary file and renamed into place, and a torn last line left by a crash while appending is
+dropped, so a store can always be reopened after a crash.
+
+The store restores bookings only. `BookingTools` rebuilds what they imply, as for any durable store: the seats taken
+by a session's bookings when the session is first used, and the expiry of pending holds (see `pending_bookings`).
+
+Entries are written through to the operating system on every save, and synced to disk when a snapshot is taken and on
+`close`. The journal is written by one process; unlike `SqliteReservationStore`, it is not shared between workers.
+"""
+
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import pydantic_core
+
+from airline_agent.reservations.records import BookingRecord
+from airline_agent.reservations.store import BookingKey
+from airline_agent.types.booking import Booking
+
+# Journal entries between snapshots
+SNAPSHOT_INTERVAL = 1000
+
+JOURNAL_FILE = "journal.jsonl"
+SNAPSHOT_FILE = "snapshot.jsonl"
+
+# A booking in its JSON form, as stored: the `Booking` model's fields with JSON values
+BookingData = dict[str, Any]
+# A change to a JSON value: ("set", path, value) or ("append", path to a list, items)
+Change = tuple[str, list[str | int], Any]
+
+
+def encode(booking: BookingRecord) -> BookingData:
+    """The JSON form of a booking."""
+    data: BookingData = pydantic_core.to_jsonable_python(booking.as_dict())
+    return data
+
+
+def decode(data: bytes) -> BookingRecord:
+    return BookingRecord.from_model(Booking.model_validate_json(data))
+
+
+def diff(old: Any, new: Any, path: tuple[str | int, ...] = ()) -> list[Change]:
+    """
+    The changes turning the JSON value `old` into `new`, for `patch`: objects with the same keys and lists that did
+    not shrink are compared member by member, items added at the end of a list are appended, and any other
+    difference sets the value. The changes of a saved booking thus name only the fields that changed.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict) and old.keys() == new.keys():
+        return [change for key in new for change in diff(old[key], new[key], (*path, key))]
+    if isinstance(old, list) and isinstance(new, list) and len(new) >= len(old):
+        changes = [change for idx, item in enumerate(old) for change in diff(item, new[idx], (*path, idx))]
+        if len(new) > len(old):
+            changes.append(("append", list(path), new[len(old) :]))
+        return changes
+    return [("set", list(path), new)]
+
+
+def patch(data: Any, changes: Iterable[Change]) -> Any:
+    """Apply changes from `diff` to a JSON value, returning the new value. `data` is not modified."""
+    for op, path, value in changes:
+        data = _patched(data, path, op, value)
+    return data
+
+
+def _patched(node: Any, path: list[str | int], op: str, value: Any) -> Any:
+    if not path:
+        return value if op == "set" else [*node, *value]
+    copy: Any = dict(node) if isinstance(node, dict) else list(node)
+    copy[path[0]] = _patched(node[path[0]], path[1:], op, value)
+    return copy
+
+
+class _Bookings:
+    """Bookings as JSON by session, in the order they were first saved."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, dict[str, bytes]] = {}
+
+    def apply(self, entry: dict[str, Any]) -> None:
+        if entry["op"] == "clear":
+            self.sessions.clear()
+            return
+        bookings = self.sessions.setdefault(entry["session_id"], {})
+        if entry["op"] == "put":
+            data = entry["data"]
+        else:
+            data = patch(pydantic_core.from_json(bookings[entry["booking_id"]]), entry["changes"])
+        bookings[entry["booking_id"]] = pydantic_core.to_json(data)
+
+    def items(self) -> Iterator[tuple[BookingKey, bytes]]:
+        for session_id, bookings in self.sessions.items():
+            for booking_id, data in bookings.items():
+                yield (session_id, booking_id), data
+
+
+def _read_entries(journal: BinaryIO) -> Iterator[tuple[dict[str, Any], int]]:
+    """Entries of a journal from its current position, each with the offset after it, up to any torn last line."""
+    offset = journal.tell()
+    for line in journal:
+        if not line.endswith(b"\n"):
+            return
+        offset += len(line)
+        yield pydantic_core.from_json(line), offset
+
+
+def replay_journal(path: Path, until: int | None = None) -> dict[BookingKey, BookingRecord]:
+    """
+    The bookings of the store in a directory after its entry number `until` (after its last entry by default), by
+    (session ID, booking ID) in the order they were made. The whole journal is read, ignoring snapshots.
+    """
+    bookings = _Bookings()
+    journal_path = path / JOURNAL_FILE
+    if journal_path.exists():
+        with journal_path.open("rb") as journal:
+            for entry, _ in _read_entries(journal):
+                if until is not None and entry["seq"] > until:
+                    break
+                bookings.apply(entry)
+    return {key: decode(data) for key, data in bookings.items()}
+
+
+class JournalReservationStore:
+    """
+    Reservation store kept in memory and journaled to a directory, restored from it when opened. Bookings are
+    returned as copies. Call `close` when done.
+    """
+
+    def __init__(self, path: Path, snapshot_interval: int = SNAPSHOT_INTERVAL) -> None:
+        self._path = path
+        self._snapshot_interval = snapshot_interval
+        self._lock = threading.Lock()
+        # Only one snapshot is written at a time; a save that finds one in progress leaves it to finish
+        self._snapshot_lock = threading.Lock()
+        self._bookings = _Bookings()
+        # Secondary index for flight manifests, built on first use; dict keys keep booking order
+        self._by_flight: dict[str, dict[BookingKey, None]] | None = None
+
+        path.mkdir(parents=True, exist_ok=True)
+        self._seq, offset = self._load_snapshot()
+        self._journal = (path / JOURNAL_FILE).open("a+b")
+        if offset > self._journal.seek(0, os.SEEK_END):
+            msg = f"The snapshot in {path} is ahead of its journal"
+            raise ValueError(msg)
+        self._journal.seek(offset)
+        for entry, entry_end in _read_entries(self._journal):
+            self._bookings.apply(entry)
+            self._seq, offset = entry["seq"], entry_end
+        # Drop a torn last line, so the next entry starts on a line of its own
+        self._journal.truncate(offset)
+        self._journal.seek(offset)
+        self._snapshot_seq = self._seq
+
+    @property
+    def seq(self) -> int:
+        """Number of the last journal entry."""
+        return self._seq
+
+    def get(self, session_id: str, booking_id: str) -> BookingRecord | None:
+        data = self._bookings.sessions.get(session_id, {}).get(booking_id)
+        return None if data is None else decode(data)
+
+    def add(self, session_id: str, booking: BookingRecord) -> bool:
+        return self._store(session_id, booking, new=True)
+
+    def save(self, session_id: str, booking: BookingRecord) -> None:
+        self._store(session_id, booking, new=False)
+
+    def _store(self, session_id: str, booking: BookingRecord, *, new: bool) -> bool:
+        """Journal and store a booking, returning False without storing it if `new` and the booking exists."""
+        data = encode(booking)
+        with self._lock:
+            old = self._bookings.sessions.get(session_id, {}).get(booking.booking_id)
+            if new and old is not None:
+                return False
+            if old is None:
+                self._append({"op": "put", "session_id": session_id, "booking_id": booking.booking_id, "data": data})
+            else:
+                changes = diff(pydantic_core.from_json(old), data)
+                if not changes:
+                    return True
+                self._append(
+                    {"op": "patch", "session_id": session_id, "booking_id": booking.booking_id, "changes": changes}
+                )
+            self._bookings.sessions.setdefault(session_id, {})[booking.booking_id] = pydantic_core.to_json(data)
+            if self._by_flight is not None:
+                for flight_booking in booking.flights:
+                    self._by_flight.setdefault(flight_booking.flight_id, {})[session_id, booking.booking_id] = None
+            snapshot_due = self._seq - self._snapshot_seq >= self._snapshot_interval
+        if snapshot_due:
+            self.snapshot(wait=False)
+        return True
+
+    def session_bookings(self, session_id: str, status: str | None = None) -> list[BookingRecord]:
+        bookings = [decode(data) for data in list(self._bookings.sessions.get(session_id, {}).values())]
+        return [booking for booking in bookings if status is None or booking.status == status]
+
+    def flight_bookings(self, flight_id: str, status: str | None = None) -> list[BookingRecord]:
+        with self._lock:
+            if self._by_flight is None:
+                self._by_flight = self._flight_index()
+            bookings = [
+                decode(self._bookings.sessions[session_id][booking_id])
+                for session_id, booking_id in self._by_flight.get(flight_id, {})
+            ]
+        return [booking for booking in bookings if status is None or booking.status == status]
+
+    def pending_bookings(self) -> list[tuple[str, BookingRecord]]:
+        with self._lock:
+            bookings = list(self._bookings.items())
+        # Only bookings whose JSON contains "pending" are parsed
+        return [
+            (session_id, booking)
+            for (session_id, _), data in bookings
+            if b'"pending"' in data and (booking := decode(data)).status == "pending"
+        ]
+
+    def discard_session(self, session_id: str) -> None:
+        # Durable: the bookings stay for when the session resumes
+        pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._append({"op": "clear"})
+            self._bookings.sessions.clear()
+            self._by_flight = None
+
+    def snapshot(self, *, wait: bool = True) -> None:
+        """
+        Write a snapshot of the current state, syncing the journal first. Returns at once if `wait` is False and
+        another snapshot is being written.
+        """
+        if not self._snapshot_lock.acquire(blocking=wait):
+            return
+        try:
+            with self._lock:
+                # Bookings are replaced rather than modified on save, so a shallow copy is a consistent state
+                bookings = list(self._bookings.items())
+                seq, offset = self._seq, self._journal.tell()
+                self._snapshot_seq = seq
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+            header = pydantic_core.to_json({"seq": seq, "offset": offset, "bookings": len(bookings)})
+            temporary = self._path / f"{SNAPSHOT_FILE}.tmp"
+            with temporary.open("wb") as f:
+                # Compact JSON has no raw tabs or newlines, so each line splits at its first tab
+                f.write(
+                    b"\n".join([header, *(pydantic_core.to_json(key) + b"\t" + data for key, data in bookings), b""])
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            temporary.replace(self._path / SNAPSHOT_FILE)
+        finally:
+            self._snapshot_lock.release()
+
+    def close(self) -> None:
+        """Sync the journal to disk and close it."""
+        with self._lock:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journal.close()
+
+    def _load_snapshot(self) -> tuple[int, int]:
+        """Load the snapshot if there is one, returning the number of its last entry and the journal offset after it."""
+        snapshot_path = self._path / SNAPSHOT_FILE
+        if not snapshot_path.exists():
+            return 0, 0
+        header, *lines = snapshot_path.read_bytes().split(b"\n")[:-1]
+        snapshot = pydantic_core.from_json(header)
+        if len(lines) != snapshot["bookings"]:
+            msg = f"The snapshot in {self._path} has {len(lines)} bookings, expected {snapshot['bookings']}"
+            raise ValueError(msg)
+        sessions = self._bookings.sessions
+        for line in lines:
+            key, data = line.split(b"\t", 1)
+            session_id, booking_id = pydantic_core.from_json(key)
+            sessions.setdefault(session_id, {})[booking_id] = data
+        return snapshot["seq"], snapshot["offset"]
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        # Callers hold `_lock`
+        self._seq += 1
+        self._journal.write(pydantic_core.to_json({"seq": self._seq, **entry}) + b"\n")
+        self._journal.flush()
+
+    def _flight_index(self) -> dict[str, dict[BookingKey, None]]:
+        # Callers hold `_lock`
+        by_flight: dict[str, dict[BookingKey, None]] = {}
+        for key, data in self._bookings.items():
+            for flight_booking in pydantic_core.from_json(data)["flights"]:
+                by_flight.setdefault(flight_booking["flight_id"], {})[key] = None
+        return by_flight
@@ -0,0 +1,151 @@
+"""
+In-memory form of bookings.
+
+Tools read and change bookings as slotted dataclasses, which are smaller and faster to build and change than the
+pydantic models; `BookingRecord.to_model` builds the `Booking` a tool returns, and `BookingRecord.from_model` reads
+one back, e.g. from its stored JSON.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from airline_agent.types.booking import (
+    Booking,
+    BookingState,
+    FareType,
+    FlightBooking,
+    GenericServiceAddOn,
+    SeatType,
+    ServiceAddOn,
+    ServiceType,
+)
+
+
+@dataclass(slots=True)
+class AddOnRecord:
+    """A purchased add-on. Seat selection add-ons (`SeatServiceAddOn`) have a seat type; other add-ons do not."""
+
+    service_type: ServiceType
+    price: float
+    currency: str
+    added_at: datetime
+    seat_type: SeatType | None = None
+    seat_preference: str | None = None
+    seat_assignment: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Fields of the add-on's pydantic model, for validating it as part of a `Booking`."""
+        data: dict[str, Any] = {
+            "service_type": self.service_type,
+            "price": self.price,
+            "currency": self.currency,
+            "added_at": self.added_at,
+        }
+        if self.seat_type is not None:
+            data.update(
+                seat_type=self.seat_type, seat_preference=self.seat_preference, seat_assignment=self.seat_assignment
+            )
+        return data
+
+    @classmethod
+    def from_model(cls, add_on: ServiceAddOn) -> "AddOnRecord":
+        if isinstance(add_on, GenericServiceAddOn):
+            return cls(add_on.service_type, add_on.price, add_on.currency, add_on.added_at)
+        return cls(
+            add_on.service_type,
+            add_on.price,
+            add_on.currency,
+            add_on.added_at,
+            seat_type=add_on.seat_type,
+            seat_preference=add_on.seat_preference,
+            seat_assignment=add_on.seat_assignment,
+        )
+
+
+@dataclass(slots=True)
+class FlightBookingRecord:
+    """One flight of a booking, as `FlightBooking`."""
+
+    flight_id: str
+    fare_type: FareType
+    base_price: float
+    currency: str
+    included_services: tuple[str, ...]
+    checked_bags_included: int
+    add_ons: list[AddOnRecord] = field(default_factory=list)
+    checked_in: bool = False
+    checked_in_at: datetime | None = None
+    seat_assignment: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "flight_id": self.flight_id,
+            "fare_type": self.fare_type,
+            "base_price": self.base_price,
+            "currency": self.currency,
+            "included_services": self.included_services,
+            "checked_bags_included": self.checked_bags_included,
+            "add_ons": [add_on.as_dict() for add_on in self.add_ons],
+            "checked_in": self.checked_in,
+            "checked_in_at": self.checked_in_at,
+            "seat_assignment": self.seat_assignment,
+        }
+
+    @classmethod
+    def from_model(cls, flight_booking: FlightBooking) -> "FlightBookingRecord":
+        return cls(
+            flight_id=flight_booking.flight_id,
+            fare_type=flight_booking.fare_type,
+            base_price=flight_booking.base_price,
+            currency=flight_booking.currency,
+            included_services=tuple(flight_booking.included_services),
+            checked_bags_included=flight_booking.checked_bags_included,
+            add_ons=[AddOnRecord.from_model(add_on) for add_on in flight_booking.add_ons],
+            checked_in=flight_booking.checked_in,
+            checked_in_at=flight_booking.checked_in_at,
+            seat_assignment=flight_booking.seat_assignment,
+        )
+
+
+@dataclass(slots=True)
+class BookingRecord:
+    """A booking, as `Booking` with its `BookingStatus` fields inlined."""
+
+    booking_id: str
+    flights: list[FlightBookingRecord]
+    currency: str
+    status: BookingState
+    created_at: datetime
+    updated_at: datetime
+    hold_expires_at: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Fields of the booking's pydantic model, nested as in `Booking`."""
+        return {
+            "booking_id": self.booking_id,
+            "flights": [flight_booking.as_dict() for flight_booking in self.flights],
+            "currency": self.currency,
+            "status": {
+                "status": self.status,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+                "hold_expires_at": self.hold_expires_at,
+            },
+        }
+
+    def to_model(self) -> Booking:
+        # One validation call for the whole booking is faster than building each nested model
+        return Booking.model_validate(self.as_dict())
+
+    @classmethod
+    def from_model(cls, booking: Booking) -> "BookingRecord":
+        return cls(
+            booking_id=booking.booking_id,
+            flights=[FlightBookingRecord.from_model(flight_booking) for flight_booking in booking.flights],
+            currency=booking.currency,
+            status=booking.status.status,
+            created_at=booking.status.created_at,
+            updated_at=booking.status.updated_at,
+            hold_expires_at=booking.status.hold_expires_at,
+        )
@@ -0,0 +1,221 @@
+"""
+Durable reservation store in a SQLite database in WAL mode, shareable by several processes on the same host.
+
+Each booking is one row holding the JSON of its `Booking` model, keyed by (session ID, booking ID), with an index on
+(session ID, status) for listing a session's bookings and a partial index of pending bookings for scheduling the
+expiry of seat holds. A second table maps flight IDs to bookings, so flight manifests are an index range scan rather
+than a scan of every booking. SQL statements are module constants with bound parameters: each connection prepares a
+statement once and reuses it from its statement cache.
+
+Writes are group committed. `save` and `add` hand their rows to a single writer thread and wait; the writer takes
+every write queued since its last commit and commits them in one transaction, so concurrent savers share one WAL sync
+instead of paying for one each. They return once their transaction is durable. `add` inserts with a statement that
+does nothing on conflict, so a new booking never replaces one saved under the same key, even by another process. Reads use one connection per thread and, thanks
+to WAL, do not wait for the writer.
+"""
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+from airline_agent.reservations.records import BookingRecord
+from airline_agent.types.booking import Booking
+
+# Most bookings committed in one transaction
+MAX_GROUP_COMMIT_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bookings (
+    session_id TEXT NOT NULL,
+    booking_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (session_id, booking_id)
+);
+CREATE INDEX IF NOT EXISTS bookings_by_status ON bookings (session_id, status);
+CREATE INDEX IF NOT EXISTS pending_bookings ON bookings (session_id) WHERE status = 'pending';
+CREATE TABLE IF NOT EXISTS booking_flights (
+    flight_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    booking_id TEXT NOT NULL,
+    PRIMARY KEY (flight_id, session_id, booking_id)
+) WITHOUT ROWID;
+"""
+
+# The rowid keeps the order bookings were first saved in: an update keeps the row, and so the booking's position
+_UPSERT_BOOKING = """
+INSERT INTO bookings (session_id, booking_id, status, data) VALUES (?, ?, ?, ?)
+ON CONFLICT (session_id, booking_id) DO UPDATE SET status = excluded.status, data = excluded.data
+"""
+_INSERT_BOOKING = """
+INSERT INTO bookings (session_id, booking_id, status, data) VALUES (?, ?, ?, ?)
+ON CONFLICT (session_id, booking_id) DO NOTHING
+"""
+_INSERT_BOOKING_FLIGHT = "INSERT OR IGNORE INTO booking_flights (flight_id, session_id, booking_id) VALUES (?, ?, ?)"
+_SELECT_BOOKING = "SELECT data FROM bookings WHERE session_id = ? AND booking_id = ?"
+_SELECT_SESSION_BOOKINGS = "SELECT data FROM bookings WHERE session_id = ? ORDER BY rowid"
+_SELECT_SESSION_BOOKINGS_BY_STATUS = "SELECT data FROM bookings WHERE session_id = ? AND status = ? ORDER BY rowid"
+_SELECT_ALL_BOOKINGS = "SELECT session_id, data FROM bookings ORDER BY rowid"
+_SELECT_PENDING_BOOKINGS = "SELECT session_id, data FROM bookings WHERE status = 'pending'"
+_SELECT_FLIGHT_BOOKINGS = """
+SELECT b.data FROM booking_flights AS f
+JOIN bookings AS b ON b.session_id = f.session_id AND b.booking_id = f.booking_id
+WHERE f.flight_id = ? AND (? IS NULL OR b.status = ?)
+ORDER BY b.rowid
+"""
+
+
+def _load(data: str) -> BookingRecord:
+    return BookingRecord.from_model(Booking.model_validate_json(data))
+
+
+class _PendingWrite:
+    def __init__(self, session_id: str, booking: BookingRecord, *, insert: bool) -> None:
+        self.statement = _INSERT_BOOKING if insert else _UPSERT_BOOKING
+        self.session_id = session_id
+        self.booking_id = booking.booking_id
+        self.status = booking.status
+        self.data = booking.to_model().model_dump_json()
+        self.flight_ids = [flight_booking.flight_id for flight_booking in booking.flights]
+        self.done = threading.Event()
+        self.written = False
+        self.error: Exception | None = None
+
+
+class SqliteReservationStore:
+    """Reservation store in a SQLite database file, created if it does not exist. Call `close` when done."""
+
+    def __init__(self, path: Path, max_group_commit_size: int = MAX_GROUP_COMMIT_SIZE) -> None:
+        self._path = path
+        self._max_group_commit_size = max_group_commit_size
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode = WAL")
+        self._writer.executescript(_SCHEMA)
+        self._queue: queue.SimpleQueue[_PendingWrite | None] = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(target=self._write_loop, name="reservation-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Transactions are managed explicitly; connections are only shared with `close`
+        connection = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA busy_timeout = 5000")
+        # Sync the WAL on every commit, so committed bookings survive power loss, not only a process restart
+        connection.execute("PRAGMA synchronous = FULL")
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+            with self._readers_lock:
+                self._readers.append(connection)
+        return connection
+
+    def get(self, session_id: str, booking_id: str) -> BookingRecord | None:
+        row = self._reader().execute(_SELECT_BOOKING, (session_id, booking_id)).fetchone()
+        return None if row is None else _load(row[0])
+
+    def add(self, session_id: str, booking: BookingRecord) -> bool:
+        return self._write(_PendingWrite(session_id, booking, insert=True))
+
+    def save(self, session_id: str, booking: BookingRecord) -> None:
+        self._write(_PendingWrite(session_id, booking, insert=False))
+
+    def _write(self, pending: _PendingWrite) -> bool:
+        """Queue a write for the writer thread and wait until it is committed, returning whether a row was written."""
+        self._queue.put(pending)
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.written
+
+    def session_bookings(self, session_id: str, status: str | None = None) -> list[BookingRecord]:
+        if status is None:
+            rows = self._reader().execute(_SELECT_SESSION_BOOKINGS, (session_id,))
+        else:
+            rows = self._reader().execute(_SELECT_SESSION_BOOKINGS_BY_STATUS, (session_id, status))
+        return [_load(data) for (data,) in rows]
+
+    def flight_bookings(self, flight_id: str, status: str | None = None) -> list[BookingRecord]:
+        rows = self._reader().execute(_SELECT_FLIGHT_BOOKINGS, (flight_id, status, status))
+        return [_load(data) for (data,) in rows]
+
+    def pending_bookings(self) -> list[tuple[str, BookingRecord]]:
+        return [(session_id, _load(data)) for session_id, data in self._reader().execute(_SELECT_PENDING_BOOKINGS)]
+
+    def all_bookings(self) -> Iterator[tuple[str, BookingRecord]]:
+        """Every stored booking with its session ID, in the order they were first saved, read as they are iterated."""
+        for session_id, data in self._reader().execute(_SELECT_ALL_BOOKINGS):
+            yield session_id, _load(data)
+
+    def discard_session(self, session_id: str) -> None:
+        # Durable: the bookings stay for when the session resumes
+        pass
+
+    def clear(self) -> None:
+        connection = self._reader()
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute("DELETE FROM booking_flights")
+        connection.execute("DELETE FROM bookings")
+        connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Finish the queued writes and close the database."""
+        self._queue.put(None)
+        self._writer_thread.join()
+        with self._readers_lock:
+            for connection in [*self._readers, self._writer]:
+                connection.close()
+            self._readers.clear()
+
+    def _write_loop(self) -> None:
+        while (first := self._queue.get()) is not None:
+            batch = [first]
+            stop = False
+            while len(batch) < self._max_group_commit_size:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+            self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch: list[_PendingWrite]) -> None:
+        error: Exception | None = None
+        try:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                # One statement per write, in queue order, so an insert sees the rows written before it
+                written = [
+                    w
+                    for w in batch
+                    if self._writer.execute(w.statement, (w.session_id, w.booking_id, w.status, w.data)).rowcount
+                ]
+                self._writer.executemany(
+                    _INSERT_BOOKING_FLIGHT,
+                    [(flight_id, w.session_id, w.booking_id) for w in written for flight_id in w.flight_ids],
+                )
+                self._writer.execute("COMMIT")
+            except Exception:
+                self._writer.execute("ROLLBACK")
+                raise
+        except Exception as e:  # noqa: BLE001 - handed to the waiting callers
+            error = e
+        else:
+            for pending in written:
+                pending.written = True
+        for pending in batch:
+            pending.error = error
+            pending.done.set()
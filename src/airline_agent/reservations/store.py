@@ -0,0 +1,120 @@
+import threading
+from typing import Protocol
+
+from airline_agent.reservations.records import BookingRecord
+
+# Bookings are stored per booking session (chat thread), and booking IDs are only unique within a session
+BookingKey = tuple[str, str]
+
+
+class ReservationStore(Protocol):
+    """Where bookings are kept, as `BookingRecord`s."""
+
+    def get(self, session_id: str, booking_id: str) -> BookingRecord | None:
+        """Look up a booking of a session, returning None if it does not exist."""
+        ...
+
+    def add(self, session_id: str, booking: BookingRecord) -> bool:
+        """
+        Store a new booking, returning False without storing it if the session already has a booking with its ID.
+        Checking and storing are one step, so concurrent callers cannot both add the same booking ID.
+        """
+        ...
+
+    def save(self, session_id: str, booking: BookingRecord) -> None:
+        """
+        Store a new booking, or the new state of an existing one. Bookings returned by a store may be copies, so
+        changes to a booking are only kept once it is saved.
+        """
+        ...
+
+    def session_bookings(self, session_id: str, status: str | None = None) -> list[BookingRecord]:
+        """Bookings of a session in the order they were made, optionally only those with a status."""
+        ...
+
+    def flight_bookings(self, flight_id: str, status: str | None = None) -> list[BookingRecord]:
+        """Bookings of every session that include a flight, optionally only those with a status."""
+        ...
+
+    def pending_bookings(self) -> list[tuple[str, BookingRecord]]:
+        """Pending bookings (seat holds) of every session with their session IDs, e.g. to schedule their expiry."""
+        ...
+
+    def discard_session(self, session_id: str) -> None:
+        """
+        Called when a booking session is evicted for being idle. Stores that only live as long as the process drop
+        the session's bookings; durable stores keep them for when the session resumes.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Delete all bookings."""
+        ...
+
+
+class InMemoryReservationStore:
+    """
+    Reservation store held in process memory, lost on restart. A session's bookings are also lost when the session is
+    evicted for being idle (see `discard_session`). Bookings are stored and returned as is.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: dict[str, dict[str, BookingRecord]] = {}
+        # Secondary index for flight manifests; dict keys keep booking order
+        self._by_flight: dict[str, dict[BookingKey, None]] = {}
+
+    def get(self, session_id: str, booking_id: str) -> BookingRecord | None:
+        return self._sessions.get(session_id, {}).get(booking_id)
+
+    def add(self, session_id: str, booking: BookingRecord) -> bool:
+        with self._lock:
+            if booking.booking_id in self._sessions.get(session_id, {}):
+                return False
+            self._put(session_id, booking)
+        return True
+
+    def save(self, session_id: str, booking: BookingRecord) -> None:
+        with self._lock:
+            self._put(session_id, booking)
+
+    def _put(self, session_id: str, booking: BookingRecord) -> None:
+        # Callers hold `_lock`
+        self._sessions.setdefault(session_id, {})[booking.booking_id] = booking
+        for flight_booking in booking.flights:
+            self._by_flight.setdefault(flight_booking.flight_id, {})[session_id, booking.booking_id] = None
+
+    def session_bookings(self, session_id: str, status: str | None = None) -> list[BookingRecord]:
+        bookings = list(self._sessions.get(session_id, {}).values())
+        return [booking for booking in bookings if status is None or booking.status == status]
+
+    def flight_bookings(self, flight_id: str, status: str | None = None) -> list[BookingRecord]:
+        with self._lock:
+            bookings = [
+                self._sessions[session_id][booking_id] for session_id, booking_id in self._by_flight.get(flight_id, {})
+            ]
+        return [booking for booking in bookings if status is None or booking.status == status]
+
+    def pending_bookings(self) -> list[tuple[str, BookingRecord]]:
+        with self._lock:
+            sessions = [(session_id, list(bookings.values())) for session_id, bookings in self._sessions.items()]
+        return [
+            (session_id, booking)
+            for session_id, bookings in sessions
+            for booking in bookings
+            if booking.status == "pending"
+        ]
+
+    def discard_session(self, session_id: str) -> None:
+        with self._lock:
+            for booking in self._sessions.pop(session_id, {}).values():
+                for flight_booking in booking.flights:
+                    keys = self._by_flight.get(flight_booking.flight_id, {})
+                    keys.pop((session_id, booking.booking_id), None)
+                    if not keys:
+                        self._by_flight.pop(flight_booking.flight_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._by_flight.clear()
@@ -1,76 +1,451 @@
-import random
-from datetime import date, datetime, timedelta
-from typing import Any
-
+import heapq
+import re
+import secrets
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, time, timedelta
+from typing import Any, Literal
+
+import pydantic_core
 from pydantic_ai import ModelRetry
 from pydantic_ai.toolsets import FunctionToolset
 
-from airline_agent.constants import DEMO_DATETIME
-from airline_agent.data_generation.generate_flights import generate_flight_data
+from airline_agent.constants import FLIGHT_DATA_VERSION
+from airline_agent.data_generation.generate_flights import AIRPORT_TIMEZONES, CARRIER_CODE, METRO_AREAS, FlightRecord
+from airline_agent.inventory.assignments import gates_and_terminals, seat_seed
+from airline_agent.inventory.disruptions import flight_timeline
+from airline_agent.inventory.fares import FARE_TYPE_INDEX, cheapest_round_trips
+from airline_agent.inventory.flights import FlightInventory, shared_flight_inventory
+from airline_agent.inventory.locks import FLIGHT_LOCKS
+from airline_agent.inventory.overlay import FlightOverlay
+from airline_agent.inventory.seats import (
+    ROWS,
+    SEAT_LETTERS,
+    ZONE_ROWS,
+    SeatOccupancy,
+    parse_seat,
+    seat_label,
+    zone_of,
+)
+from airline_agent.reservations.records import AddOnRecord, BookingRecord, FlightBookingRecord
+from airline_agent.reservations.store import InMemoryReservationStore, ReservationStore
+from airline_agent.tools.clock import demo_clock
+from airline_agent.tools.holds import HoldExpiries
+from airline_agent.tools.payloads import PayloadCache
+from airline_agent.tools.sessions import (
+    SESSION_IDLE_TIMEOUT_SECONDS,
+    BookingSession,
+    BookingSessions,
+    current_session_id,
+)
 from airline_agent.types.booking import (
+    FARE_TYPES,
     Booking,
-    BookingStatus,
+    Fare,
+    FareCalendar,
     FareType,
-    Flight,
-    FlightBooking,
-    GenericServiceAddOn,
-    SeatServiceAddOn,
+    FlightSearchResults,
+    FlightSummary,
+    RoundTripOption,
+    RouteFareSummary,
+    SeatMap,
     SeatType,
+    SeatZoneAvailability,
     ServiceType,
 )
 
-# Constants for flight status timing (in seconds)
-BOARDING_START_THRESHOLD = 900  # 15 minutes until departure
-ON_TIME_THRESHOLD = 1800  # 30 minutes until departure
+# Longest departure date range accepted by tools that take one
+MAX_DATE_RANGE_DAYS = 31
 
-# Seed for deterministic random number generation
-RNG_SEED = 42
+# Page size of search_flights results, by default and at most
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
 
+SearchSortKey = Literal["departure", "arrival", "duration", "price"]
 
-class BookingTools:
-    def __init__(self) -> None:
-        flights = generate_flight_data()
-        self._flights: dict[str, Flight] = {flight.id: flight for flight in flights}
+# Flight number as quoted by customers: "F9 482", "F9482", "f9-482" or just "482"
+_FLIGHT_NUMBER_PATTERN = re.compile(rf"(?:{CARRIER_CODE}[\s-]*)?(?P<number>\d{{1,4}})", re.IGNORECASE)
 
-        self._reservations: dict[str, Booking] = {}
+# Most flights accepted by the batch tools
+MAX_BATCH_FLIGHTS = 20
 
-        self._rng = random.Random(RNG_SEED)  # noqa: S311
+# Most round-trip combinations returned by find_round_trips
+MAX_ROUND_TRIP_OPTIONS = 10
+
+# How long book_flights holds seats for a pending booking before releasing them
+SEAT_HOLD_MINUTES = 15
+
+
+class BookingTools:
+    """
+    Booking tools over the shared flight inventory. Reservations and flight changes are kept per booking session
+    (see `current_session_id`), so conversations do not see each other's bookings or the seats they took (see
+    `FlightOverlay`). Reservations are kept in `reservation_store`, in memory unless another store is given. A session
+    idle for `session_idle_timeout` seconds is evicted: its flight changes are dropped, and so are its bookings if
+    they are kept in memory, while a durable store keeps them for when the session resumes. `clock` gives the current
+    time, which is fixed in the demo; tests can advance it, for example to let seat holds expire.
+
+    Flights and bookings are handled as records (`FlightRecord`, `BookingRecord`); tools build pydantic models only
+    for what they return.
+    """
+
+    def __init__(
+        self,
+        flight_data_version: int = FLIGHT_DATA_VERSION,
+        session_idle_timeout: float = SESSION_IDLE_TIMEOUT_SECONDS,
+        reservation_store: ReservationStore | None = None,
+        clock: Callable[[], datetime] = demo_clock,
+    ) -> None:
+        self._inventory: FlightInventory = shared_flight_inventory(flight_data_version)
+        self._payloads = PayloadCache(self._inventory)
+        self._clock = clock
+        self._holds = HoldExpiries()
+        self._reservations: ReservationStore = reservation_store or InMemoryReservationStore()
+        self._sessions = BookingSessions(
+            session_idle_timeout, on_create=self._restore_session, on_evict=self._reservations.discard_session
+        )
+        self._schedule_stored_holds()
 
     def _reset(self) -> None:
-        """Clear all reservations and reset the random number generator for test isolation."""
-        # Regenerate flights to clear any mutations (gates, terminals, status updates)
-        flights = generate_flight_data()
-        self._flights = {flight.id: flight for flight in flights}
-        self._reservations = {}
-        self._rng = random.Random(RNG_SEED)  # noqa: S311
+        """
+        Evict all sessions for test isolation, dropping their flight changes and, with the in-memory store, their
+        reservations. A durable store keeps its bookings (see `ReservationStore.discard_session`).
+        """
+        self._sessions.clear()
+        self._holds = HoldExpiries()
+        self._schedule_stored_holds()
 
-    def search_flights(self, origin: str, destination: str, departure_date: str) -> list[Flight]:
+    @property
+    def _session(self) -> BookingSession:
+        return self._sessions.get(current_session_id.get())
+
+    @property
+    def _overlay(self) -> FlightOverlay:
+        return self._session.overlay
+
+    def _get_booking(self, booking_id: str) -> BookingRecord | None:
+        return self._reservations.get(current_session_id.get(), booking_id)
+
+    def _save_booking(self, booking: BookingRecord) -> None:
+        self._reservations.save(current_session_id.get(), booking)
+
+    def _booked_fares(self, booking: BookingRecord) -> list[tuple[str, Fare]]:
+        """The inventory fares of a booking's flights, as passed to `FlightOverlay.take_seats` when it was made."""
+        fares = []
+        for flight_booking in booking.flights:
+            fare = self._inventory.fare(flight_booking.flight_id, flight_booking.fare_type)
+            if fare is not None:
+                fares.append((flight_booking.flight_id, fare))
+        return fares
+
+    def _schedule_stored_holds(self) -> None:
         """
-        Search available flights by route and date.
+        Schedule the expiry of the holds in the reservation store, such as those kept by a durable store from before a
+        restart. Holds that are already overdue expire on the next tool call.
+        """
+        for session_id, booking in self._reservations.pending_bookings():
+            if booking.hold_expires_at is not None:
+                self._holds.schedule((session_id, booking.booking_id), booking.hold_expires_at)
+
+    def _restore_session(self, session_id: str, session: BookingSession) -> None:
+        """
+        Rebuild the flight changes of a new session from its stored bookings, so that a session resumed from a durable
+        store (after a restart, or after being evicted) sees the seats its bookings took. Confirmed and pending
+        bookings take a seat of each fare and their assigned seats; cancelled and expired bookings gave theirs back.
+        """
+        for booking in self._reservations.session_bookings(session_id):
+            if booking.status not in ("confirmed", "pending"):
+                continue
+            # Stored bookings were made against the same inventory, so their seats are there to take
+            session.overlay.take_seats(self._booked_fares(booking))
+            for flight_booking in booking.flights:
+                occupancy = session.overlay.seat_occupancy(flight_booking.flight_id)
+                for bit in _booked_seats(flight_booking):
+                    occupancy.reserve(bit)
+
+    def _release_expired_holds(self) -> None:
+        """
+        Release the seats of holds that have expired, in every session. Tools that read seat counts or bookings call
+        this first. It takes flight and booking locks, so it must not be called while holding any.
+        """
+        for session_id, booking_id in self._holds.pop_expired(self._clock()):
+            booking = self._reservations.get(session_id, booking_id)
+            if booking is not None:
+                self._end_hold(session_id, booking, "expired")
+
+    def _end_hold(
+        self, session_id: str, booking: BookingRecord, status: Literal["confirmed", "cancelled", "expired"]
+    ) -> BookingRecord:
+        """
+        Move a held booking to its next status, giving its fare seats and the seats assigned to it back unless it is
+        confirmed. The caller must own the hold, having taken it out of `_holds`.
+        """
+        # Seats are given back in the session's overlay if it is in memory; a session created later is rebuilt from
+        # its stored bookings, where the booking is no longer held
+        session = self._sessions.peek(session_id) if status != "confirmed" else None
+        if session is not None:
+            session.overlay.release_seats(self._booked_fares(booking))
+        with FLIGHT_LOCKS.hold(booking.booking_id):
+            # Read again under the lock, so changes saved by a parallel call are kept
+            booking = self._reservations.get(session_id, booking.booking_id) or booking
+            if session is not None:
+                for flight_booking in booking.flights:
+                    occupancy = session.overlay.seat_occupancy(flight_booking.flight_id)
+                    for bit in _booked_seats(flight_booking):
+                        occupancy.release(bit)
+            booking.status = status
+            booking.updated_at = self._clock()
+            if status == "confirmed":
+                booking.hold_expires_at = None
+            self._reservations.save(session_id, booking)
+        return booking
+
+    def _get_flight(self, flight_id: str) -> FlightRecord | None:
+        """Look up a flight with this booking state's mutations applied."""
+        flight = self._inventory.get(flight_id)
+        return None if flight is None else self._overlay.view(flight)
+
+    def search_flights(
+        self,
+        origin: str | list[str],
+        destination: str | list[str],
+        departure_date: str,
+        departure_after: str | None = None,
+        departure_before: str | None = None,
+        arrival_after: str | None = None,
+        arrival_before: str | None = None,
+        max_prices: dict[str, float] | None = None,
+        sort_by: SearchSortKey = "departure",
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        cursor: str | None = None,
+        detail: Literal["summary", "full"] = "summary",
+    ) -> FlightSearchResults:
+        """
+        Search available flights by route and date. Each end of the route can be an airport, a metro area covering
+        several airports, or a list of either, so all flights between two cities are found in one call.
+
+        Results can be filtered by departure and arrival time of day and by fare price, sorted, and paged, so
+        requests like "flights after 5pm under $150, cheapest first" are answered in one call. By default each
+        flight is summarized with its times and the price of each fare bundle with seats left; use get_fare_details
+        for what a fare bundle includes and the add-ons offered on a flight.
 
         Args:
-            origin: IATA airport code (e.g., "SFO", "JFK")
-            destination: IATA airport code (e.g., "SFO", "JFK")
+            origin: IATA airport code (e.g., "SFO", "JFK"), metro area code ("BAY" for SFO/SJC/OAK, "NYC" for
+                JFK/EWR/LGA), or a list of codes
+            destination: IATA airport code (e.g., "SFO", "JFK"), metro area code ("BAY" for SFO/SJC/OAK, "NYC" for
+                JFK/EWR/LGA), or a list of codes
             departure_date: Date in YYYY-MM-DD format
+            departure_after: Earliest local departure time in HH:MM format (inclusive)
+            departure_before: Latest local departure time in HH:MM format (inclusive)
+            arrival_after: Earliest local arrival time in HH:MM format (inclusive). Flights arriving the day after
+                departure_date are always later
+            arrival_before: Latest local arrival time in HH:MM format (inclusive). Flights arriving the day after
+                departure_date are always later
+            max_prices: Highest acceptable price per fare bundle, e.g. {"basic": 150}. Only flights with seats
+                available at or below the price in every listed fare bundle are returned
+            sort_by: "departure", "arrival", "duration", or "price" (lowest available fare first, among the fare
+                bundles in max_prices when given)
+            limit: Maximum number of flights to return (at most 50)
+            cursor: The next_cursor of a previous result, to get the following page of the same search
+            detail: "summary" for compact results, or "full" for complete flight records including all fare bundle
+                details and add-ons
 
         Returns:
-            List of available flights matching the route and date
+            A page of flights matching the route, date and filters, the number of matching flights, and the cursor
+            of the next page if there is one
         """
+        self._release_expired_holds()
         try:
             dep = date.fromisoformat(departure_date)
         except Exception:  # noqa: BLE001
             msg = f"Invalid departure_date: {departure_date}"
             raise ModelRetry(msg) from None
-
-        return [
-            fl
-            for fl in self._flights.values()
-            if fl.origin == origin
-            and fl.destination == destination
-            and fl.departure.date().isoformat() == dep.isoformat()
+        departure_window = (
+            _parse_time("departure_after", departure_after),
+            _parse_time("departure_before", departure_before),
+        )
+        arrival_window = (_parse_time("arrival_after", arrival_after), _parse_time("arrival_before", arrival_before))
+        for fare_type in max_prices or {}:
+            if fare_type not in FARE_TYPES:
+                msg = f"Fare type '{fare_type}' not found. Available fares: {list(FARE_TYPES)}"
+                raise ModelRetry(msg)
+        if sort_by not in _SEARCH_SORT_KEYS:
+            msg = f"Invalid sort_by: {sort_by}. Sort by one of {list(_SEARCH_SORT_KEYS)}"
+            raise ModelRetry(msg)
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            msg = f"limit must be between 1 and {MAX_SEARCH_LIMIT}: {limit}"
+            raise ModelRetry(msg)
+        offset = _parse_cursor(cursor)
+
+        # Each route's flights are already in departure order, so merging keeps the result sorted
+        flights = heapq.merge(
+            *(
+                self._inventory.search(route_origin, route_destination, dep)
+                for route_origin in _resolve_airports(origin)
+                for route_destination in _resolve_airports(destination)
+                if route_origin != route_destination
+            ),
+            key=lambda flight: flight.departure,
+        )
+        matches = [
+            view
+            for view in map(self._overlay.view, flights)
+            if _in_window(view.departure, dep, departure_window)
+            and _in_window(view.arrival, dep, arrival_window)
+            and _within_prices(view, max_prices or {})
         ]
+        if sort_by != "departure":
+            sort_key = _SEARCH_SORT_KEYS[sort_by]
+            matches.sort(key=lambda flight: sort_key(flight, max_prices or FARE_TYPES))
+
+        page = matches[offset : offset + limit]
+        return FlightSearchResults(
+            flights=[flight.flight() for flight in page] if detail == "full" else [flight.summary() for flight in page],
+            total=len(matches),
+            next_cursor=str(offset + limit) if offset + limit < len(matches) else None,
+        )
+
+    def find_flight_by_number(self, flight_number: str, departure_date: str) -> list[FlightSummary]:
+        """
+        Look up a flight by its flight number and departure date, e.g. when a customer asks about "F9 482 on Nov 12".
+        Use the returned flight ID with the other flight tools.
+
+        Args:
+            flight_number: Flight number, with or without the carrier code (e.g., "F9 482", "F9482", "482")
+            departure_date: Local departure date in YYYY-MM-DD format
+
+        Returns:
+            The flights with this number departing on the date. Usually there is one; if a flight number is used by
+            several flights that day, all of them are returned in departure order
+        """
+        self._release_expired_holds()
+        try:
+            dep = date.fromisoformat(departure_date)
+        except ValueError:
+            msg = f"Invalid departure_date: {departure_date}"
+            raise ModelRetry(msg) from None
+        match = _FLIGHT_NUMBER_PATTERN.fullmatch(flight_number.strip())
+        if match is None:
+            msg = f"Invalid flight_number: {flight_number}. Expected a Frontier flight number such as 'F9 482'"
+            raise ModelRetry(msg)
 
-    def get_fare_details(self, flight_id: str, fare_type: str = "basic") -> dict[str, Any]:
+        normalized = f"{CARRIER_CODE} {int(match['number'])}"
+        flights = self._inventory.find_flight_number(normalized, dep)
+        if not flights:
+            msg = f"No flight {normalized} departs on {departure_date}"
+            raise ModelRetry(msg)
+        return [self._overlay.view(flight).summary() for flight in flights]
+
+    def get_fare_summary(self, origin: str, destination: str, start_date: str, end_date: str) -> RouteFareSummary:
+        """
+        Summarize fares for a route over a range of departure dates: the lowest and highest price, the cheapest
+        flight, and the number of seats and flights still available for each fare bundle.
+
+        Args:
+            origin: IATA airport code (e.g., "SFO", "JFK")
+            destination: IATA airport code (e.g., "SFO", "JFK")
+            start_date: First departure date in YYYY-MM-DD format
+            end_date: Last departure date in YYYY-MM-DD format (inclusive, at most 31 days after start_date)
+
+        Returns:
+            Fare summary per fare bundle across all flights on the route in the date range
+        """
+        self._release_expired_holds()
+        origin, destination = _resolve_airport(origin), _resolve_airport(destination)
+        first, last = self._parse_date_range(start_date, end_date)
+        return self._inventory.fare_summary(origin, destination, first, last, self._overlay.seats_available)
+
+    def get_fare_calendar(
+        self, origin: str, destination: str, start_date: str, end_date: str, fare_type: str = "basic"
+    ) -> FareCalendar:
+        """
+        Get the lowest available price and the number of flights for each departure date in a range, to find the
+        cheapest day to fly. Days without flights are included with no price.
+
+        Args:
+            origin: IATA airport code (e.g., "SFO", "JFK")
+            destination: IATA airport code (e.g., "SFO", "JFK")
+            start_date: First departure date in YYYY-MM-DD format
+            end_date: Last departure date in YYYY-MM-DD format (inclusive, at most 31 days after start_date)
+            fare_type: Fare bundle type (basic, economy, premium, business)
+
+        Returns:
+            Lowest price, cheapest flight and number of flights per departure date
+        """
+        self._release_expired_holds()
+        origin, destination = _resolve_airport(origin), _resolve_airport(destination)
+        first, last = self._parse_date_range(start_date, end_date)
+        if fare_type not in FARE_TYPES:
+            msg = f"Fare type '{fare_type}' not found. Available fares: {list(FARE_TYPES)}"
+            raise ModelRetry(msg)
+        return self._inventory.fare_calendar(origin, destination, first, last, fare_type, self._overlay.seats_available)
+
+    def find_round_trips(
+        self,
+        origin: str,
+        destination: str,
+        outbound_start_date: str,
+        outbound_end_date: str,
+        return_start_date: str,
+        return_end_date: str,
+        fare_type: str = "basic",
+        min_stay_days: int = 1,
+        num_options: int = 5,
+    ) -> list[RoundTripOption]:
+        """
+        Find the cheapest round trips for a route when the outbound and return dates are flexible. Each option pairs
+        the cheapest available outbound flight of one date with the cheapest available return flight of another.
+
+        Args:
+            origin: IATA airport code (e.g., "SFO", "JFK")
+            destination: IATA airport code (e.g., "SFO", "JFK")
+            outbound_start_date: First outbound departure date in YYYY-MM-DD format
+            outbound_end_date: Last outbound departure date in YYYY-MM-DD format (inclusive, at most 31 days after
+                outbound_start_date)
+            return_start_date: First return departure date in YYYY-MM-DD format
+            return_end_date: Last return departure date in YYYY-MM-DD format (inclusive, at most 31 days after
+                return_start_date)
+            fare_type: Fare bundle type (basic, economy, premium, business), used for both flights
+            min_stay_days: Minimum number of days between the outbound and return departure dates
+            num_options: Number of round trips to return (at most 10)
+
+        Returns:
+            Round trip options sorted by total price, cheapest first
+        """
+        self._release_expired_holds()
+        origin, destination = _resolve_airport(origin), _resolve_airport(destination)
+        outbound_first, outbound_last = self._parse_date_range(outbound_start_date, outbound_end_date)
+        return_first, return_last = self._parse_date_range(return_start_date, return_end_date)
+        if fare_type not in FARE_TYPES:
+            msg = f"Fare type '{fare_type}' not found. Available fares: {list(FARE_TYPES)}"
+            raise ModelRetry(msg)
+        if min_stay_days < 0:
+            msg = f"min_stay_days must not be negative: {min_stay_days}"
+            raise ModelRetry(msg)
+        if not 1 <= num_options <= MAX_ROUND_TRIP_OPTIONS:
+            msg = f"num_options must be between 1 and {MAX_ROUND_TRIP_OPTIONS}: {num_options}"
+            raise ModelRetry(msg)
+
+        seats = self._overlay.seats_available
+        outbound = self._inventory.fare_calendar(origin, destination, outbound_first, outbound_last, fare_type, seats)
+        inbound = self._inventory.fare_calendar(destination, origin, return_first, return_last, fare_type, seats)
+        return cheapest_round_trips(outbound.days, inbound.days, min_stay_days, num_options)
+
+    def _parse_date_range(self, start_date: str, end_date: str) -> tuple[date, date]:
+        try:
+            first = date.fromisoformat(start_date)
+            last = date.fromisoformat(end_date)
+        except ValueError:
+            msg = f"Invalid date range: {start_date} to {end_date}. Dates must be in YYYY-MM-DD format"
+            raise ModelRetry(msg) from None
+        if last < first:
+            msg = f"end_date {end_date} is before start_date {start_date}"
+            raise ModelRetry(msg)
+        if (last - first).days >= MAX_DATE_RANGE_DAYS:
+            msg = f"Date range must cover at most {MAX_DATE_RANGE_DAYS} days: {start_date} to {end_date}"
+            raise ModelRetry(msg)
+        return first, last
+
+    def get_fare_details(self, flight_id: str, fare_type: str = "basic") -> str:
         """
         Get detailed fare information including what's included and available add-ons.
 
@@ -79,27 +454,43 @@ class BookingTools:
             fare_type: Fare bundle type (basic, economy, premium, business)
 
         Returns:
-            Dictionary with fare details including included services and available add-ons
+            JSON object with fare details including included services and available add-ons
         """
-        if flight_id not in self._flights:
+        self._release_expired_holds()
+        payloads = self._payloads.get(flight_id)
+        if payloads is None:
             msg = f"Flight not found: {flight_id}"
             raise ModelRetry(msg)
+        if fare_type not in FARE_TYPES:
+            msg = f"Fare type '{fare_type}' not found. Available fares: {list(FARE_TYPES)}"
+            raise ModelRetry(msg)
 
-        flight = self._flights[flight_id]
+        # The seats left are the only fare detail that bookings change; None while the inventory's count applies
+        seats_available = self._overlay.seats_available.get(flight_id, {}).get(fare_type)
+        payload = payloads.get(
+            ("fare_details", fare_type, seats_available),
+            lambda: self._fare_details(flight_id, fare_type, seats_available),
+        )
+        # A fare the flight does not have is memoized too, as JSON null
+        if payload == "null":
+            msg = f"Fare '{fare_type}' not available for flight {flight_id}. Available fares: {list(FARE_TYPES)}"
+            raise ModelRetry(msg)
+        return payload
 
+    def _fare_details(self, flight_id: str, fare_type: FareType, seats_available: int | None) -> dict[str, Any] | None:
+        """The result of get_fare_details, or None if the flight has no such fare."""
         # Find the fare for the requested fare type (no cabin classes in Frontier model)
-        fare = next((f for f in flight.fares if f.fare_type == fare_type), None)
-        if not fare:
-            available_fares = [f.fare_type for f in flight.fares]
-            msg = f"Fare '{fare_type}' not available for flight {flight_id}. Available fares: {available_fares}"
-            raise ModelRetry(msg)
+        fare = self._inventory.fare(flight_id, fare_type)
+        add_ons = self._inventory.add_ons(flight_id)
+        if fare is None or add_ons is None:
+            return None
 
         return {
             "flight_id": flight_id,
             "fare_type": fare_type,
             "price": fare.price_total,
             "currency": fare.currency,
-            "seats_available": fare.seats_available,
+            "seats_available": fare.seats_available if seats_available is None else seats_available,
             "included_services": fare.included_services,
             "checked_bags_included": fare.checked_bags_included,
             "available_add_ons": [
@@ -109,14 +500,30 @@ class BookingTools:
                     "currency": addon.currency,
                     "description": addon.description,
                 }
-                for addon in flight.add_ons
+                for addon in add_ons
             ],
         }
 
+    def get_fare_details_batch(self, flight_ids: list[str], fare_type: str = "basic") -> str:
+        """
+        Get fare details for several flights at once, e.g. to compare a fare bundle across search results.
+
+        Args:
+            flight_ids: The flight IDs (at most 20)
+            fare_type: Fare bundle type (basic, economy, premium, business)
+
+        Returns:
+            JSON object of fare details keyed by flight ID, as returned by get_fare_details. A flight that cannot be
+            looked up maps to {"error": message} instead
+        """
+        return self._json_batch(self.get_fare_details, flight_ids, fare_type)
+
     def book_flights(
         self,
         flight_ids: list[str],
         fare_type: FareType = "basic",
+        *,
+        hold: bool = False,
     ) -> Booking:
         """
         Book one or more flights for the current user.
@@ -124,66 +531,114 @@ class BookingTools:
         Args:
             flight_ids: List of flight IDs to book
             fare_type: Fare bundle type (basic, economy, premium, business). Defaults to "basic".
+            hold: Hold the seats for 15 minutes while the customer decides instead of confirming the booking. The
+                booking is pending until confirmed with confirm_booking; if it is not confirmed in time the hold
+                expires and the seats are released. Defaults to False.
 
         Returns:
             The created booking with booking ID and total price
         """
+        self._release_expired_holds()
         if not flight_ids:
             msg = "At least one flight ID must be provided"
             raise ModelRetry(msg)
 
-        now = DEMO_DATETIME
-        # Generate deterministic booking ID using seeded random
-        booking_id = f"BK-{self._rng.randint(0, 0xFFFFFFFF):08X}"
-
-        flight_bookings: list[FlightBooking] = []
+        now = self._clock()
+        flight_bookings: list[FlightBookingRecord] = []
         currency = "USD"
 
+        fares: list[tuple[str, Fare]] = []
         for flight_id in flight_ids:
-            if flight_id not in self._flights:
+            if not self._inventory.has_flight(flight_id):
                 msg = f"Flight not found: {flight_id}"
                 raise ModelRetry(msg)
 
-            flight = self._flights[flight_id]
-
             # Find the fare for the requested fare type (no cabin classes in Frontier model)
-            fare = next((f for f in flight.fares if f.fare_type == fare_type), None)
+            fare = self._inventory.fare(flight_id, fare_type)
             if not fare:
-                available_fares = [f.fare_type for f in flight.fares]
-                msg = f"Fare '{fare_type}' not available for flight {flight_id}. Available fares: {available_fares}"
-                raise ModelRetry(msg)
-
-            if fare.seats_available <= 0:
-                msg = f"No seats available for fare '{fare_type}' for flight {flight_id}"
+                msg = f"Fare '{fare_type}' not available for flight {flight_id}. Available fares: {list(FARE_TYPES)}"
                 raise ModelRetry(msg)
+            fares.append((flight_id, fare))
 
             flight_bookings.append(
-                FlightBooking(
+                FlightBookingRecord(
                     flight_id=flight_id,
                     fare_type=fare_type,
                     base_price=fare.price_total,
                     currency=fare.currency,
-                    included_services=fare.included_services.copy(),
+                    included_services=tuple(fare.included_services),
                     checked_bags_included=fare.checked_bags_included,
-                    add_ons=[],
                 )
             )
             currency = fare.currency  # Use currency from last flight
 
-        booking = Booking(
-            booking_id=booking_id,
+        # Take a seat on every flight at once, or on none of them
+        if not self._overlay.take_seats(fares):
+            sold_out = [
+                flight_id
+                for flight_id, fare in fares
+                if self._overlay.view_fare(flight_id, fare).seats_available < flight_ids.count(flight_id)
+            ]
+            msg = f"No seats available for fare '{fare_type}' for flight(s) {sold_out or flight_ids}"
+            raise ModelRetry(msg)
+
+        booking = BookingRecord(
+            booking_id=_new_booking_id(),
             flights=flight_bookings,
             currency=currency,
-            status=BookingStatus(
-                status="confirmed",
-                created_at=now,
-                updated_at=now,
-            ),
+            status="pending" if hold else "confirmed",
+            created_at=now,
+            updated_at=now,
+            hold_expires_at=now + timedelta(minutes=SEAT_HOLD_MINUTES) if hold else None,
         )
 
-        self._reservations[booking_id] = booking
+        # IDs are random, so a session resumed from a durable store or served by several workers does not reuse
+        # them; the store adds a booking only if its ID is free, and a taken ID is drawn again
+        session_id = current_session_id.get()
+        while not self._reservations.add(session_id, booking):
+            booking.booking_id = _new_booking_id()
+        if booking.hold_expires_at is not None:
+            self._holds.schedule((session_id, booking.booking_id), booking.hold_expires_at)
 
-        return booking
+        return booking.to_model()
+
+    def confirm_booking(self, booking_id: str) -> Booking:
+        """
+        Confirm a booking whose seats are on hold, before the hold expires.
+
+        Args:
+            booking_id: The booking ID (e.g., "BK-12345678")
+
+        Returns:
+            The confirmed booking
+        """
+        return self._finish_hold(booking_id, "confirmed")
+
+    def release_hold(self, booking_id: str) -> Booking:
+        """
+        Release the seats held for a pending booking without waiting for the hold to expire, cancelling the booking.
+
+        Args:
+            booking_id: The booking ID (e.g., "BK-12345678")
+
+        Returns:
+            The cancelled booking
+        """
+        return self._finish_hold(booking_id, "cancelled")
+
+    def _finish_hold(self, booking_id: str, status: Literal["confirmed", "cancelled"]) -> Booking:
+        self._release_expired_holds()
+        booking = self._get_booking(booking_id)
+        if booking is None:
+            msg = f"Booking not found: {booking_id}"
+            raise ModelRetry(msg)
+        if booking.status != "pending":
+            msg = f"Booking {booking_id} is not on hold: booking status is {booking.status}"
+            raise ModelRetry(msg)
+        if not self._holds.cancel((current_session_id.get(), booking_id)):
+            msg = f"The hold on booking {booking_id} has expired"
+            raise ModelRetry(msg)
+        return self._end_hold(current_session_id.get(), booking, status).to_model()
 
     def get_booking(self, booking_id: str) -> Booking:
         """
@@ -195,10 +650,12 @@ class BookingTools:
         Returns:
             The booking details
         """
-        if booking_id not in self._reservations:
+        self._release_expired_holds()
+        booking = self._get_booking(booking_id)
+        if booking is None:
             msg = f"Booking not found: {booking_id}"
             raise ModelRetry(msg)
-        return self._reservations[booking_id]
+        return booking.to_model()
 
     def get_my_bookings(self) -> list[Booking]:
         """
@@ -207,7 +664,11 @@ class BookingTools:
         Returns:
             List of all confirmed bookings
         """
-        return [booking for booking in self._reservations.values() if booking.status.status == "confirmed"]
+        self._release_expired_holds()
+        return [
+            booking.to_model()
+            for booking in self._reservations.session_bookings(current_session_id.get(), status="confirmed")
+        ]
 
     def add_service_to_booking(
         self,
@@ -231,12 +692,12 @@ class BookingTools:
         Returns:
             The updated booking with the new service added
         """
-        if booking_id not in self._reservations:
+        self._release_expired_holds()
+        booking = self._get_booking(booking_id)
+        if booking is None:
             msg = f"Booking not found: {booking_id}"
             raise ModelRetry(msg)
 
-        booking = self._reservations[booking_id]
-
         # Find the flight in the booking
         flight_booking = next((fb for fb in booking.flights if fb.flight_id == flight_id), None)
         if not flight_booking:
@@ -245,16 +706,15 @@ class BookingTools:
             raise ModelRetry(msg)
 
         # Get the flight to check available add-ons
-        if flight_id not in self._flights:
+        add_ons = self._inventory.add_ons(flight_id)
+        if add_ons is None:
             msg = f"Flight not found: {flight_id}"
             raise ModelRetry(msg)
 
-        flight = self._flights[flight_id]
-
         # Find the add-on option
-        addon_option = next((ao for ao in flight.add_ons if ao.service_type == service_type), None)
+        addon_option = next((ao for ao in add_ons if ao.service_type == service_type), None)
         if not addon_option:
-            available_addons = [ao.service_type for ao in flight.add_ons]
+            available_addons = [ao.service_type for ao in add_ons]
             msg = (
                 f"Service '{service_type}' not available for flight {flight_id}. Available add-ons: {available_addons}"
             )
@@ -276,129 +736,130 @@ class BookingTools:
             )
             raise ModelRetry(msg)
 
-        # Check if add-on already exists
-        existing_addon = next((ao for ao in flight_booking.add_ons if ao.service_type == service_type), None)
-        if existing_addon:
-            msg = f"Service '{service_type}' has already been added to flight {flight_id} in this booking"
-            raise ModelRetry(msg)
-
-        now = DEMO_DATETIME
-
-        # Create appropriate add-on type based on service type
-        addon: SeatServiceAddOn | GenericServiceAddOn
-        match service_type:
-            case "standard_seat_selection" | "premium_seat_selection" | "upfront_plus_seating":
-                seat_type: SeatType
-                match service_type:
-                    case "standard_seat_selection":
-                        seat_type = "standard"
-                    case "premium_seat_selection":
-                        seat_type = "stretch"
-                    case "upfront_plus_seating":
-                        seat_type = "upfront_plus"
-
-                addon = SeatServiceAddOn(
-                    service_type=service_type,
-                    price=addon_option.price,
-                    currency=addon_option.currency,
-                    added_at=now,
-                    seat_preference=seat_preference,
-                    seat_assignment=seat_assignment,
-                    seat_type=seat_type,
-                )
-            case _:
-                # For non-seat services, validate that seat parameters weren't provided
-                if seat_preference or seat_assignment:
-                    msg = "seat_preference and seat_assignment can only be set for seat selection service types"
-                    raise ModelRetry(msg)
-
-                addon = GenericServiceAddOn(
-                    service_type=service_type,
-                    price=addon_option.price,
-                    currency=addon_option.currency,
-                    added_at=now,
-                )
-
-        flight_booking.add_ons.append(addon)
-
-        booking.status.updated_at = now
-
-        return booking
+        # Looked up before taking the locks: creating the session restores its bookings, which takes flight locks
+        occupancy = self._overlay.seat_occupancy(flight_id)
+        # Held until the booking is saved, so concurrent calls cannot add the same service twice or overwrite each
+        # other's changes; booking IDs are spread over the same locks as flights
+        with FLIGHT_LOCKS.hold(flight_id, booking_id):
+            # Read again under the lock: the store may return copies, and a parallel call may have saved a change
+            booking = self._get_booking(booking_id) or booking
+            flight_booking = next(fb for fb in booking.flights if fb.flight_id == flight_id)
+            # Check if add-on already exists
+            existing_addon = next((ao for ao in flight_booking.add_ons if ao.service_type == service_type), None)
+            if existing_addon:
+                msg = f"Service '{service_type}' has already been added to flight {flight_id} in this booking"
+                raise ModelRetry(msg)
 
-    def _assign_seat(self, flight_booking: FlightBooking, _flight_id: str) -> str:
-        """Assign a seat to a flight booking based on preferences, fare type, or randomly."""
-        # Check if any seat selection add-on exists with an assignment
-        seat_addon: SeatServiceAddOn | None = None
-        for addon in flight_booking.add_ons:
-            if isinstance(addon, SeatServiceAddOn):
-                seat_addon = addon
-                break
+            now = self._clock()
+
+            # Create appropriate add-on type based on service type
+            addon: AddOnRecord
+            match service_type:
+                case "standard_seat_selection" | "premium_seat_selection" | "upfront_plus_seating":
+                    seat_type: SeatType
+                    match service_type:
+                        case "standard_seat_selection":
+                            seat_type = "standard"
+                        case "premium_seat_selection":
+                            seat_type = "stretch"
+                        case "upfront_plus_seating":
+                            seat_type = "upfront_plus"
+
+                    if seat_assignment:
+                        seat_assignment = _reserve_seat(occupancy, flight_id, seat_assignment, seat_type)
+
+                    addon = AddOnRecord(
+                        service_type=service_type,
+                        price=addon_option.price,
+                        currency=addon_option.currency,
+                        added_at=now,
+                        seat_type=seat_type,
+                        seat_preference=seat_preference,
+                        seat_assignment=seat_assignment,
+                    )
+                case _:
+                    # For non-seat services, validate that seat parameters weren't provided
+                    if seat_preference or seat_assignment:
+                        msg = "seat_preference and seat_assignment can only be set for seat selection service types"
+                        raise ModelRetry(msg)
+
+                    addon = AddOnRecord(
+                        service_type=service_type,
+                        price=addon_option.price,
+                        currency=addon_option.currency,
+                        added_at=now,
+                    )
+
+            flight_booking.add_ons.append(addon)
+            booking.updated_at = now
+            self._save_booking(booking)
+
+        return booking.to_model()
+
+    def _assign_seat(
+        self, occupancy: SeatOccupancy, booking_id: str, flight_booking: FlightBookingRecord, flight_id: str
+    ) -> str:
+        """Assign a free seat in a flight's `occupancy` to a flight booking based on preferences and fare type."""
+        # Check if any seat selection add-on exists with an assignment (already reserved when the add-on was added)
+        seat_addon = next((addon for addon in flight_booking.add_ons if addon.seat_type is not None), None)
 
         if seat_addon and seat_addon.seat_assignment:
             return seat_addon.seat_assignment
 
         # If seat selection exists with preference, try to honor it
         preference = seat_addon.seat_preference if seat_addon else None
-        seat_type = seat_addon.seat_type if seat_addon else None
 
-        # Generate random seat assignment based on fare type and seat selection
         # UpFront Plus: rows 1-2 (first two rows)
         # Stretch: rows 3-15 (premium seating area)
         # Standard: rows 16-40 (standard seating area)
-
-        if seat_type == "upfront_plus":
-            row_min, row_max = (1, 2)
-        elif seat_type == "stretch":
-            row_min, row_max = (3, 15)
+        seat_type = seat_addon.seat_type if seat_addon else None
+        zone: SeatType
+        if seat_type in ("upfront_plus", "stretch"):
+            zone = seat_type
         elif flight_booking.fare_type == "business":
             # Business fare includes UpFront Plus seating
-            row_min, row_max = (1, 2)
-        elif seat_type == "standard":
-            row_min, row_max = (16, 40)
+            zone = "upfront_plus"
         else:
             # Default to standard seating area
-            row_min, row_max = (16, 40)
+            zone = "standard"
+
+        seat = occupancy.allocate(zone, preference, seat_seed(booking_id, flight_id))
+        if seat is None:
+            msg = f"No {zone} seats left on flight {flight_id}"
+            raise ModelRetry(msg)
+        return seat
 
-        row = self._rng.randint(row_min, row_max)
+    def get_seat_map(self, flight_id: str) -> SeatMap:
+        """
+        Get seat availability for a flight by seating zone: UpFront Plus (rows 1-2), Stretch (rows 3-15) and
+        Standard (rows 16-40).
 
-        # Seat letters (typical 3-3 configuration: A, B, C, D, E, F)
-        seat_letters = ["A", "B", "C", "D", "E", "F"]
-        window_seats = ["A", "F"]
-        aisle_seats = ["C", "D"]
+        Args:
+            flight_id: The flight ID
 
-        if preference == "window":
-            seat_letter = self._rng.choice(window_seats)
-        elif preference == "aisle":
-            seat_letter = self._rng.choice(aisle_seats)
-        else:
-            seat_letter = self._rng.choice(seat_letters)
-
-        return f"{row}{seat_letter}"
-
-    def _assign_gates_and_terminals(self, flight: Flight) -> None:
-        """Assign gates and terminals to a flight if not already assigned."""
-        # Assign departure terminal and gate if not already assigned
-        if not flight.departure_terminal:
-            terminals = ["Terminal 1", "Terminal 2", "Terminal 3", "Terminal A", "Terminal B"]
-            flight.departure_terminal = self._rng.choice(terminals)
-
-        if not flight.departure_gate:
-            # Generate a gate like "A15", "B22", "C8"
-            gate_letters = ["A", "B", "C", "D"]
-            gate_letter = self._rng.choice(gate_letters)
-            gate_number = self._rng.randint(1, 50)
-            flight.departure_gate = f"{gate_letter}{gate_number}"
-
-        # Assign arrival terminal and gate if not already assigned
-        if not flight.arrival_terminal:
-            terminals = ["Terminal 1", "Terminal 2", "Terminal 3", "Terminal A", "Terminal B"]
-            flight.arrival_terminal = self._rng.choice(terminals)
-
-        if not flight.arrival_gate:
-            gate_letters = ["A", "B", "C", "D", "E"]
-            gate_letter = self._rng.choice(gate_letters)
-            gate_number = self._rng.randint(1, 60)
-            flight.arrival_gate = f"{gate_letter}{gate_number}"
+        Returns:
+            Number of free seats, free window and aisle seats, and seats already taken in each zone
+        """
+        self._release_expired_holds()
+        if not self._inventory.has_flight(flight_id):
+            msg = f"Flight not found: {flight_id}"
+            raise ModelRetry(msg)
+
+        occupancy = self._overlay.seat_occupancy(flight_id)
+        return SeatMap(
+            flight_id=flight_id,
+            zones=[
+                SeatZoneAvailability(
+                    zone=zone,
+                    rows=f"{first}-{last}",
+                    seats_available=occupancy.free_seats(zone).bit_count(),
+                    window_available=occupancy.free_seats(zone, "window").bit_count(),
+                    aisle_available=occupancy.free_seats(zone, "aisle").bit_count(),
+                    occupied_seats=list(occupancy.occupied_seats(zone)),
+                )
+                for zone, (first, last) in ZONE_ROWS.items()
+            ],
+        )
 
     def _calculate_check_in_timings(self, departure: datetime) -> dict[str, datetime]:
         """Calculate check-in and boarding timing windows."""
@@ -425,13 +886,13 @@ class BookingTools:
         Returns:
             The updated booking with check-in information
         """
-        if booking_id not in self._reservations:
+        self._release_expired_holds()
+        booking = self._get_booking(booking_id)
+        if booking is None:
             msg = f"Booking not found: {booking_id}"
             raise ModelRetry(msg)
-
-        booking = self._reservations[booking_id]
-        if booking.status.status != "confirmed":
-            msg = f"Cannot check in for booking {booking_id}: booking status is {booking.status.status}"
+        if booking.status != "confirmed":
+            msg = f"Cannot check in for booking {booking_id}: booking status is {booking.status}"
             raise ModelRetry(msg)
 
         # Find the flight in the booking
@@ -441,34 +902,36 @@ class BookingTools:
             msg = f"Flight {flight_id} not found in booking {booking_id}. Available flights: {available_flights}"
             raise ModelRetry(msg)
 
-        if flight_booking.checked_in:
-            msg = f"Already checked in for flight {flight_id} in booking {booking_id}"
-            raise ModelRetry(msg)
-
-        # Get the flight details
-        if flight_id not in self._flights:
+        if not self._inventory.has_flight(flight_id):
             msg = f"Flight not found: {flight_id}"
             raise ModelRetry(msg)
 
-        flight = self._flights[flight_id]
-        now = DEMO_DATETIME
-
-        # Assign gates and terminals if needed
-        self._assign_gates_and_terminals(flight)
-
-        # Assign seat if not already assigned
-        if not flight_booking.seat_assignment:
-            flight_booking.seat_assignment = self._assign_seat(flight_booking, flight_id)
+        now = self._clock()
+
+        # Looked up before taking the locks: creating the session restores its bookings, which takes flight locks
+        occupancy = self._overlay.seat_occupancy(flight_id)
+        # Held until the booking is saved, so concurrent check-ins cannot both assign a seat
+        with FLIGHT_LOCKS.hold(flight_id, booking_id):
+            # Read again under the lock: the store may return copies, and a parallel call may have saved a change
+            booking = self._get_booking(booking_id) or booking
+            flight_booking = next(fb for fb in booking.flights if fb.flight_id == flight_id)
+            if flight_booking.checked_in:
+                msg = f"Already checked in for flight {flight_id} in booking {booking_id}"
+                raise ModelRetry(msg)
 
-        # Update check-in status
-        flight_booking.checked_in = True
-        flight_booking.checked_in_at = now
+            # Assign seat if not already assigned
+            if not flight_booking.seat_assignment:
+                flight_booking.seat_assignment = self._assign_seat(occupancy, booking_id, flight_booking, flight_id)
 
-        booking.status.updated_at = now
+            # Update check-in status
+            flight_booking.checked_in = True
+            flight_booking.checked_in_at = now
+            booking.updated_at = now
+            self._save_booking(booking)
 
-        return booking
+        return booking.to_model()
 
-    def get_flight_timings(self, flight_id: str) -> dict[str, Any]:
+    def get_flight_timings(self, flight_id: str) -> str:
         """
         Get all timing windows for a flight (check-in, boarding, doors close, etc.).
 
@@ -476,17 +939,20 @@ class BookingTools:
             flight_id: The flight ID
 
         Returns:
-            Dictionary with all timing windows and estimated times
+            JSON object with all timing windows and estimated times
         """
-        if flight_id not in self._flights:
+        payloads = self._payloads.get(flight_id)
+        if payloads is None:
             msg = f"Flight not found: {flight_id}"
             raise ModelRetry(msg)
+        delay_minutes = payloads.timeline.at(self._clock()).delay_minutes
+        return payloads.get(("timings", delay_minutes), lambda: self._flight_timings(payloads.flight, delay_minutes))
 
-        flight = self._flights[flight_id]
+    def _flight_timings(self, flight: FlightRecord, delay_minutes: int | None) -> dict[str, Any]:
+        """The result of get_flight_timings, with the flight delayed by `delay_minutes`."""
         timings = self._calculate_check_in_timings(flight.departure)
-
         return {
-            "flight_id": flight_id,
+            "flight_id": flight.id,
             "flight_number": flight.flight_number,
             "origin": flight.origin,
             "destination": flight.destination,
@@ -497,17 +963,26 @@ class BookingTools:
             "scheduled_departure": flight.departure.isoformat(),
             "scheduled_arrival": flight.arrival.isoformat(),
             "estimated_departure": (
-                (flight.departure + timedelta(minutes=flight.delay_minutes or 0)).isoformat()
-                if flight.delay_minutes
-                else None
+                (flight.departure + timedelta(minutes=delay_minutes)).isoformat() if delay_minutes else None
             ),
             "estimated_arrival": (
-                (flight.arrival + timedelta(minutes=flight.delay_minutes or 0)).isoformat()
-                if flight.delay_minutes
-                else None
+                (flight.arrival + timedelta(minutes=delay_minutes)).isoformat() if delay_minutes else None
             ),
         }
 
+    def get_flight_timings_batch(self, flight_ids: list[str]) -> str:
+        """
+        Get the timing windows of several flights at once.
+
+        Args:
+            flight_ids: The flight IDs (at most 20)
+
+        Returns:
+            JSON object of timing windows keyed by flight ID, as returned by get_flight_timings. A flight that cannot
+            be looked up maps to {"error": message} instead
+        """
+        return self._json_batch(self.get_flight_timings, flight_ids)
+
     def get_flight_status(self, flight_id: str) -> dict[str, Any]:
         """
         Get current flight status including gates, terminals, delays, etc.
@@ -518,48 +993,75 @@ class BookingTools:
         Returns:
             Dictionary with current flight status and operational information
         """
-        if flight_id not in self._flights:
+        flight = self._get_flight(flight_id)
+        if flight is None:
             msg = f"Flight not found: {flight_id}"
             raise ModelRetry(msg)
 
-        flight = self._flights[flight_id]
-
-        # Auto-update gates/terminals if check-in window is open
-        self._assign_gates_and_terminals(flight)
+        # Gates and terminals are derived from the flight ID
+        gates = gates_and_terminals(flight.id)
 
-        # Update flight status based on current time
-        now = DEMO_DATETIME
-        time_until_departure = flight.departure - now
-
-        # Update status based on current time vs scheduled departure
-        if flight.status in ("scheduled", "on_time", "boarding"):
-            if time_until_departure.total_seconds() < 0:  # Past departure time
-                flight.status = "departed"
-            elif time_until_departure.total_seconds() < BOARDING_START_THRESHOLD:
-                flight.status = "boarding"
-            elif time_until_departure.total_seconds() < ON_TIME_THRESHOLD:
-                flight.status = "on_time"
-            else:
-                flight.status = "on_time"
-            flight.status_updated_at = now
+        # Status, delay and gate changes come from the flight's precomputed timeline, looked up at the current time
+        event = flight_timeline(flight.id, flight.departure, flight.arrival).at(self._clock())
+        # Estimated times are given only for a delayed flight, as in get_flight_timings; cancelled flights have no delay
+        delay = timedelta(minutes=event.delay_minutes) if event.delay_minutes else None
 
         return {
             "flight_id": flight_id,
             "flight_number": flight.flight_number,
             "origin": flight.origin,
             "destination": flight.destination,
-            "status": flight.status,
-            "status_updated_at": flight.status_updated_at.isoformat() if flight.status_updated_at else None,
-            "delay_minutes": flight.delay_minutes,
-            "departure_terminal": flight.departure_terminal,
-            "departure_gate": flight.departure_gate,
-            "arrival_terminal": flight.arrival_terminal,
-            "arrival_gate": flight.arrival_gate,
+            "status": event.status,
+            "status_updated_at": event.at.isoformat() if event.at else None,
+            "delay_minutes": event.delay_minutes,
+            "departure_terminal": gates["departure_terminal"],
+            "departure_gate": event.departure_gate,
+            "arrival_terminal": gates["arrival_terminal"],
+            "arrival_gate": gates["arrival_gate"],
             "scheduled_departure": flight.departure.isoformat(),
             "scheduled_arrival": flight.arrival.isoformat(),
+            "estimated_departure": (flight.departure + delay).isoformat() if delay else None,
+            "estimated_arrival": (flight.arrival + delay).isoformat() if delay else None,
             "carrier": flight.carrier,
         }
 
+    def get_flight_status_batch(self, flight_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Get the current status of several flights at once.
+
+        Args:
+            flight_ids: The flight IDs (at most 20)
+
+        Returns:
+            Flight status keyed by flight ID, as returned by get_flight_status. A flight that cannot be looked up
+            maps to {"error": message} instead
+        """
+        return self._batch(self.get_flight_status, flight_ids)
+
+    def _batch(
+        self, tool: Callable[..., dict[str, Any]], flight_ids: list[str], *args: Any
+    ) -> dict[str, dict[str, Any]]:
+        """Call a single-flight tool for each flight, reporting failures per flight rather than for the whole call."""
+        _check_batch_size(flight_ids)
+        results: dict[str, dict[str, Any]] = {}
+        for flight_id in flight_ids:
+            try:
+                results[flight_id] = tool(flight_id, *args)
+            except ModelRetry as e:
+                results[flight_id] = {"error": e.message}
+        return results
+
+    def _json_batch(self, tool: Callable[..., str], flight_ids: list[str], *args: Any) -> str:
+        """`_batch` for tools returning pre-serialized JSON, which is spliced into the result rather than parsed."""
+        _check_batch_size(flight_ids)
+        results: dict[str, str] = {}
+        for flight_id in flight_ids:
+            try:
+                results[flight_id] = tool(flight_id, *args)
+            except ModelRetry as e:
+                results[flight_id] = pydantic_core.to_json({"error": e.message}).decode()
+        return "{" + ",".join(f"{pydantic_core.to_json(key).decode()}:{value}" for key, value in results.items()) + "}"
+
     @property
     def tools(self) -> FunctionToolset:
         # For now, only include read-only/informational tools.
@@ -569,8 +1071,127 @@ class BookingTools:
         return FunctionToolset(
             tools=[
                 self.search_flights,
+                self.find_flight_by_number,
+                self.get_fare_summary,
+                self.get_fare_calendar,
+                self.find_round_trips,
                 self.get_fare_details,
+                self.get_fare_details_batch,
                 self.get_flight_timings,
+                self.get_flight_timings_batch,
                 self.get_flight_status,
+                self.get_flight_status_batch,
+                self.get_seat_map,
             ]
         )
+
+
+def _new_booking_id() -> str:
+    return f"BK-{secrets.randbits(32):08X}"
+
+
+def _reserve_seat(occupancy: SeatOccupancy, flight_id: str, seat: str, zone: SeatType) -> str:
+    """Reserve a specific seat in a zone of a flight's `occupancy`, returning its normalized label."""
+    bit = parse_seat(seat)
+    if bit is None:
+        msg = f"Invalid seat: {seat}. Seats are rows 1-{ROWS} with letters {SEAT_LETTERS}, e.g. 12A"
+        raise ModelRetry(msg)
+    if zone_of(bit) != zone:
+        first, last = ZONE_ROWS[zone]
+        msg = f"Seat {seat} is not a {zone} seat ({zone} seats are in rows {first}-{last})"
+        raise ModelRetry(msg)
+    if not occupancy.reserve(bit):
+        msg = f"Seat {seat} on flight {flight_id} is already taken"
+        raise ModelRetry(msg)
+    return seat_label(bit)
+
+
+def _booked_seats(flight_booking: FlightBookingRecord) -> set[int]:
+    """Bits of the seats taken by a flight booking: chosen with a seat selection add-on, or assigned at check-in."""
+    seats = [addon.seat_assignment for addon in flight_booking.add_ons]
+    seats.append(flight_booking.seat_assignment)
+    return {bit for seat in seats if seat and (bit := parse_seat(seat)) is not None}
+
+
+def _check_batch_size(flight_ids: list[str]) -> None:
+    if len(flight_ids) > MAX_BATCH_FLIGHTS:
+        msg = f"At most {MAX_BATCH_FLIGHTS} flights can be requested at once, got {len(flight_ids)}"
+        raise ModelRetry(msg)
+
+
+def _resolve_airports(codes: str | list[str]) -> list[str]:
+    """Expand metro area codes into their airports, dropping duplicates and keeping the given order."""
+    airports: dict[str, None] = {}
+    for code in [codes] if isinstance(codes, str) else codes:
+        normalized = code.strip().upper()
+        airports.update(dict.fromkeys(METRO_AREAS.get(normalized) or [_resolve_airport(normalized)]))
+    return list(airports)
+
+
+def _resolve_airport(code: str) -> str:
+    """Normalize an IATA airport code, rejecting airports that are not served."""
+    normalized = code.strip().upper()
+    if normalized in METRO_AREAS:
+        msg = f"{code} is a metro area. Use one of its airports: {METRO_AREAS[normalized]}"
+        raise ModelRetry(msg)
+    if normalized not in AIRPORT_TIMEZONES:
+        msg = f"Unknown airport: {code}. Served airports: {list(AIRPORT_TIMEZONES)}"
+        raise ModelRetry(msg)
+    return normalized
+
+
+def _parse_time(name: str, value: str | None) -> time | None:
+    if value is None:
+        return None
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        msg = f"Invalid {name}: {value}. Times must be in HH:MM format"
+        raise ModelRetry(msg) from None
+
+
+def _parse_cursor(cursor: str | None) -> int:
+    if cursor is None:
+        return 0
+    if not cursor.isdigit():
+        msg = f"Invalid cursor: {cursor}. Pass the next_cursor of a previous search_flights result"
+        raise ModelRetry(msg)
+    return int(cursor)
+
+
+def _in_window(value: datetime, day: date, window: tuple[time | None, time | None]) -> bool:
+    """Whether a local time falls in a time-of-day window on a given day."""
+    local = value.replace(tzinfo=None)
+    earliest, latest = window
+    return (earliest is None or local >= datetime.combine(day, earliest)) and (
+        latest is None or local <= datetime.combine(day, latest)
+    )
+
+
+def _within_prices(flight: FlightRecord, max_prices: dict[str, float]) -> bool:
+    return all(
+        flight.fare_seats[FARE_TYPE_INDEX[fare_type]] > 0
+        and flight.fare_prices[FARE_TYPE_INDEX[fare_type]] <= max_price
+        for fare_type, max_price in max_prices.items()
+    )
+
+
+def _lowest_available_price(flight: FlightRecord, fare_types: Iterable[str]) -> float:
+    fare_types = set(fare_types)
+    return min(
+        (
+            price
+            for fare_type, price, seats in zip(FARE_TYPES, flight.fare_prices, flight.fare_seats, strict=True)
+            if fare_type in fare_types and seats > 0
+        ),
+        default=float("inf"),
+    )
+
+
+# Sort keys of search_flights, called with a flight and the fare types the search is about
+_SEARCH_SORT_KEYS: dict[str, Callable[[FlightRecord, Iterable[str]], Any]] = {
+    "departure": lambda flight, _: flight.departure,
+    "arrival": lambda flight, _: flight.arrival,
+    "duration": lambda flight, _: flight.arrival - flight.departure,
+    "price": _lowest_available_price,
+}
@@ -0,0 +1,37 @@
+import threading
+from datetime import datetime, timedelta
+
+from airline_agent.constants import DEMO_DATETIME
+
+
+def demo_clock() -> datetime:
+    """The fixed current time of the demo."""
+    return DEMO_DATETIME
+
+
+class SimulatedClock:
+    """
+    Clock that only moves when told to, starting at the demo's current time. Pass it as the clock of the booking tools
+    to let time pass: seat holds expire and flights move through their status timelines as it is advanced.
+    """
+
+    def __init__(self, start: datetime = DEMO_DATETIME) -> None:
+        self._now = start
+        self._lock = threading.Lock()
+
+    def __call__(self) -> datetime:
+        return self._now
+
+    def advance(self, delta: timedelta) -> datetime:
+        """Move the clock forward, returning the new time."""
+        if delta < timedelta(0):
+            msg = "the clock cannot move backwards"
+            raise ValueError(msg)
+        with self._lock:
+            self._now += delta
+            return self._now
+
+    def set(self, now: datetime) -> None:
+        """Move the clock to a time, which may be before the current one."""
+        with self._lock:
+            self._now = now
@@ -0,0 +1,46 @@
+import heapq
+import threading
+from datetime import datetime
+
+from airline_agent.reservations.store import BookingKey
+
+
+class HoldExpiries:
+    """
+    Expiry times of seat holds, in a min-heap ordered by expiry.
+
+    Scheduling and popping a hold are O(log n) and checking for expired holds is O(1) when none are due, so expiry
+    never scans the reservations. Cancelled holds are only dropped from a dictionary; their heap entries are skipped
+    when they come due. A hold is handed out by exactly one of `pop_expired` and `cancel`, so whoever gets it owns the
+    booking's next status.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._heap: list[tuple[datetime, BookingKey]] = []
+        self._expires_at: dict[BookingKey, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def schedule(self, key: BookingKey, expires_at: datetime) -> None:
+        with self._lock:
+            self._expires_at[key] = expires_at
+            heapq.heappush(self._heap, (expires_at, key))
+
+    def cancel(self, key: BookingKey) -> bool:
+        """Remove a hold before it expires, returning False if it is not scheduled (e.g. it has already expired)."""
+        with self._lock:
+            return self._expires_at.pop(key, None) is not None
+
+    def pop_expired(self, now: datetime) -> list[BookingKey]:
+        """Remove and return the holds expiring at or before `now`, earliest first."""
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._heap)
+                # Skip entries of cancelled holds, and of holds that were scheduled again
+                if self._expires_at.get(key) == expires_at:
+                    del self._expires_at[key]
+                    expired.append(key)
+        return expired
@@ -0,0 +1,72 @@
+"""
+Pre-serialized results of the tools that return static flight data.
+
+`get_fare_details` and `get_flight_timings` return the same JSON for a flight until one of its mutable fields
+changes: the seats left in the fare, which booking sessions change (see `FlightOverlay`), and the delay on the
+flight's disruption timeline. Their results are serialized once per flight and per value of those fields, so a flight
+that is asked about again costs a few dictionary lookups, and since pydantic-ai passes string results to the model
+as they are, nothing is serialized again. A change to a mutable field is a different key rather than an update, so
+entries never go stale and need no invalidation.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import pydantic_core
+
+from airline_agent.data_generation.generate_flights import FlightRecord
+from airline_agent.inventory.disruptions import FlightTimeline, flight_timeline
+from airline_agent.inventory.flights import FlightInventory
+
+# Flights whose payloads are kept in memory; each holds a few payloads of about 1 KB
+PAYLOAD_CACHE_SIZE = 4096
+
+
+class FlightPayloads:
+    """A flight's record and timeline, and its serialized tool results by tool and mutable-field values."""
+
+    __slots__ = ("_payloads", "flight", "timeline")
+
+    def __init__(self, flight: FlightRecord) -> None:
+        self.flight = flight
+        self.timeline: FlightTimeline = flight_timeline(flight.id, flight.departure, flight.arrival)
+        self._payloads: dict[Hashable, str] = {}
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> str:
+        """The JSON payload for a key, from `build` serialized on first use. `key` must identify everything it uses."""
+        payload = self._payloads.get(key)
+        if payload is None:
+            # Threads racing on a missing payload build the same one, so the last write wins harmlessly
+            payload = self._payloads[key] = pydantic_core.to_json(build()).decode()
+        return payload
+
+
+class PayloadCache:
+    """The `FlightPayloads` of recently used flights of an inventory, in a bounded LRU."""
+
+    def __init__(self, inventory: FlightInventory, size: int = PAYLOAD_CACHE_SIZE) -> None:
+        self._inventory = inventory
+        self._size = size
+        self._lock = threading.Lock()
+        self._flights: OrderedDict[str, FlightPayloads] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def get(self, flight_id: str) -> FlightPayloads | None:
+        """The payloads of a flight of the inventory, or None if there is no such flight."""
+        with self._lock:
+            payloads = self._flights.get(flight_id)
+            if payloads is not None:
+                self._flights.move_to_end(flight_id)
+                return payloads
+        flight = self._inventory.get(flight_id)
+        if flight is None:
+            return None
+        with self._lock:
+            payloads = self._flights.setdefault(flight_id, FlightPayloads(flight))
+            if len(self._flights) > self._size:
+                self._flights.popitem(last=False)
+        return payloads
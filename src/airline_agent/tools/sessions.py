@@ -0,0 +1,97 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextvars import ContextVar
+
+from airline_agent.inventory.overlay import FlightOverlay
+
+# Sessions not used for this long are evicted
+SESSION_IDLE_TIMEOUT_SECONDS = 60 * 60
+
+DEFAULT_SESSION_ID = "default"
+
+# Booking session used by tools in the current context, normally the chat thread ID. Sync tools run in worker
+# threads with a copy of the caller's context, so setting this before running the agent scopes its tool calls.
+current_session_id: ContextVar[str] = ContextVar("current_session_id", default=DEFAULT_SESSION_ID)
+
+
+class BookingSession:
+    """
+    Flight mutations of one chat thread. Its reservations are kept in the reservation store under the session ID.
+
+    The inventory is shared by every session; a session only holds what it changed, so a session that has not booked
+    or looked anything up that changes state costs a few empty containers.
+    """
+
+    def __init__(self) -> None:
+        self.overlay = FlightOverlay()
+
+
+class BookingSessions:
+    """
+    Booking sessions by ID, created on first use and evicted once idle for `idle_timeout` seconds. Eviction is lazy:
+    idle sessions are evicted by the next `get` of another session, and a session used again before then is kept.
+    `on_create` is called with the ID and the new session before a session is first handed out, e.g. to restore its
+    state from stored bookings, and `on_evict` with the ID of each evicted session.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = SESSION_IDLE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        on_create: Callable[[str, BookingSession], None] | None = None,
+        on_evict: Callable[[str], None] | None = None,
+    ) -> None:
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._on_create = on_create
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        # Least recently used first, with the time of last use
+        self._sessions: OrderedDict[str, tuple[BookingSession, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> BookingSession:
+        """The session with an ID, marking it as used now and evicting sessions that have been idle too long."""
+        now = self._clock()
+        evicted = []
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            while self._sessions:
+                oldest_id, (_, last_used) = next(iter(self._sessions.items()))
+                if now - last_used < self._idle_timeout:
+                    break
+                del self._sessions[oldest_id]
+                evicted.append(oldest_id)
+            if entry is not None:
+                self._sessions[session_id] = (entry[0], now)
+        if self._on_evict is not None:
+            for evicted_id in evicted:
+                self._on_evict(evicted_id)
+        if entry is not None:
+            return entry[0]
+
+        # Set up outside the lock: `on_create` may read the store and take flight locks, which must neither hold up
+        # other sessions nor nest inside this lock. Of threads racing to create a session, the first to finish wins
+        session = BookingSession()
+        if self._on_create is not None:
+            self._on_create(session_id, session)
+        with self._lock:
+            return self._sessions.setdefault(session_id, (session, now))[0]
+
+    def peek(self, session_id: str) -> BookingSession | None:
+        """The session with an ID if it exists, without marking it as used."""
+        entry = self._sessions.get(session_id)
+        return None if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Evict every session, calling `on_evict` for each."""
+        with self._lock:
+            evicted = list(self._sessions)
+            self._sessions.clear()
+        if self._on_evict is not None:
+            for evicted_id in evicted:
+                self._on_evict(evicted_id)
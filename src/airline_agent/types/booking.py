@@ -1,9 +1,10 @@
-from datetime import datetime
-from typing import Annotated, Literal
+from datetime import date, datetime
+from typing import Annotated, Literal, get_args
 
 from pydantic import BaseModel, Discriminator, Field, computed_field
 
 FareType = Literal["basic", "economy", "premium", "business"]
+FARE_TYPES: tuple[FareType, ...] = get_args(FareType)
 ServiceType = Literal[
     "checked_bag",
     "carry_on",
@@ -25,6 +26,7 @@ GenericServiceType = Literal[
     "change_cancel_fee_waived",
 ]
 SeatType = Literal["standard", "stretch", "upfront_plus"]
+BookingState = Literal["confirmed", "cancelled", "pending", "expired"]
 FlightStatus = Literal[
     "scheduled",
     "on_time",
@@ -129,12 +131,106 @@ class Flight(BaseModel):
     delay_minutes: int | None = Field(default=None, description="Minutes of delay when the flight is delayed")
 
 
+class FlightSummary(BaseModel):
+    """Compact view of a flight for search results. Fare bundle contents and add-ons are left out."""
+
+    id: str
+    flight_number: str
+    origin: str
+    destination: str
+    departure: datetime
+    arrival: datetime
+    prices: dict[FareType, float] = Field(..., description="Price of each fare bundle that has seats available")
+
+
+class FlightSearchResults(BaseModel):
+    """One page of flight search results."""
+
+    flights: list[FlightSummary] | list[Flight]
+    total: int = Field(..., description="Number of flights matching the search and filters")
+    next_cursor: str | None = Field(default=None, description="Cursor of the next page, or None on the last page")
+
+
+class FareSummary(BaseModel):
+    """Prices and availability of one fare bundle across a set of flights. Sold-out fares are not counted."""
+
+    fare_type: FareType
+    min_price: float | None = Field(default=None, description="Lowest price among flights with seats available")
+    max_price: float | None = Field(default=None, description="Highest price among flights with seats available")
+    seats_available: int = Field(..., description="Total seats available across all flights")
+    flights_available: int = Field(..., description="Number of flights with at least one seat available")
+    cheapest_flight_id: str | None = Field(default=None, description="Flight offering the lowest price")
+
+
+class RouteFareSummary(BaseModel):
+    """Fare summary for a route over a range of departure dates."""
+
+    origin: str
+    destination: str
+    start_date: date
+    end_date: date
+    num_flights: int
+    fares: list[FareSummary]
+
+
+class FareCalendarDay(BaseModel):
+    """Lowest available price for a fare bundle on one departure date."""
+
+    date: date
+    num_flights: int = Field(..., description="Number of flights departing on this date")
+    min_price: float | None = Field(default=None, description="Lowest price among flights with seats available")
+    cheapest_flight_id: str | None = Field(default=None, description="Flight offering the lowest price")
+
+
+class FareCalendar(BaseModel):
+    """Lowest available price per departure date for a route and fare bundle."""
+
+    origin: str
+    destination: str
+    fare_type: FareType
+    days: list[FareCalendarDay]
+
+
+class RoundTripOption(BaseModel):
+    """An outbound and a return flight, each the cheapest available flight of its departure date."""
+
+    outbound_flight_id: str
+    return_flight_id: str
+    outbound_date: date
+    return_date: date
+    stay_days: int = Field(..., description="Days between the outbound and return departure dates")
+    outbound_price: float
+    return_price: float
+    total_price: float
+
+
+class SeatZoneAvailability(BaseModel):
+    """Seat availability in one seating zone of a flight."""
+
+    zone: SeatType
+    rows: str = Field(..., description='Rows of the zone, e.g. "3-15"')
+    seats_available: int
+    window_available: int
+    aisle_available: int
+    occupied_seats: list[str] = Field(default_factory=list, description='Seats already taken, e.g. ["3A", "3B"]')
+
+
+class SeatMap(BaseModel):
+    """Seat availability of a flight by zone. Each row has seats A-F; A and F are windows, C and D are aisles."""
+
+    flight_id: str
+    zones: list[SeatZoneAvailability]
+
+
 class BookingStatus(BaseModel):
     """State and timestamps for a booking."""
 
-    status: Literal["confirmed", "cancelled", "pending"]
+    status: BookingState
     created_at: datetime
     updated_at: datetime
+    hold_expires_at: datetime | None = Field(
+        default=None, description="For held (pending) bookings, when the hold lapses and its seats are released"
+    )
 
 
 class FlightBooking(BaseModel):
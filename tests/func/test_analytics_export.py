@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from airline_agent.analytics.export import (
+    BOOKED_FLIGHT_SCHEMA,
+    FLIGHT_SCHEMA,
+    booked_flight_batches,
+    flight_batch,
+    record_chunks,
+    table_chunks,
+    write_batches,
+)
+from airline_agent.data_generation.generate_flights import generate_flight_records
+from airline_agent.inventory.snapshot import build_table
+from airline_agent.reservations.sqlite import SqliteReservationStore
+from airline_agent.tools.booking import BookingTools
+from airline_agent.types.booking import FARE_TYPES
+
+
+def test_table_and_records_export_the_same_flights(tmp_path: Path) -> None:
+    records = generate_flight_records()[:300]
+    table = build_table(records)
+    by_table, by_records = tmp_path / "table.parquet", tmp_path / "records.arrow"
+
+    assert write_batches(by_table, FLIGHT_SCHEMA, map(flight_batch, table_chunks(table, 64)), "parquet") == len(table)
+    rows = [table.record(row) for row in range(len(table))]
+    assert write_batches(by_records, FLIGHT_SCHEMA, map(flight_batch, record_chunks(rows, 64)), "arrow") == len(rows)
+
+    exported = pq.read_table(by_table)
+    assert pq.ParquetFile(by_table).num_row_groups == 5
+    assert exported.equals(pa.ipc.open_file(str(by_records)).read_all().cast(exported.schema))
+    for record, row in zip(rows, exported.to_pylist(), strict=True):
+        assert row["flight_id"] == record.id
+        assert row["departure"] == record.departure
+        assert row["departure_date"] == record.departure.date()
+        assert [row[f"{fare_type}_price"] for fare_type in FARE_TYPES] == list(record.fare_prices)
+        assert [row[f"{fare_type}_seats"] for fare_type in FARE_TYPES] == list(record.fare_seats)
+
+
+def test_export_booked_flights(tmp_path: Path) -> None:
+    store = SqliteReservationStore(tmp_path / "reservations.db")
+    tools = BookingTools(reservation_store=store)
+    flight_ids = [flight.id for flight in tools.search_flights("SFO", "JFK", "2025-11-12").flights[:2]]
+    booking = tools.book_flights(flight_ids, "economy")
+    tools.add_service_to_booking(booking.booking_id, flight_ids[0], "checked_bag")
+    tools.book_flights(flight_ids[:1], hold=True)
+
+    path = tmp_path / "booked_flights.parquet"
+    assert write_batches(path, BOOKED_FLIGHT_SCHEMA, booked_flight_batches(store.all_bookings(), 2), "parquet") == 3
+    store.close()
+
+    rows = pq.read_table(path).to_pylist()
+    assert [(row["booking_id"], row["flight_id"], row["status"]) for row in rows] == [
+        (booking.booking_id, flight_ids[0], "confirmed"),
+        (booking.booking_id, flight_ids[1], "confirmed"),
+        (rows[2]["booking_id"], flight_ids[0], "pending"),
+    ]
+    assert rows[0]["num_add_ons"] == 1
+    assert rows[0]["add_ons_price"] > 0
+    assert rows[0]["created_at"] == booking.status.created_at
+    assert rows[2]["hold_expires_at"] is not None
@@ -0,0 +1,26 @@
+from airline_agent.inventory.assignments import gates_and_terminals, seat_seed, stable_seed
+from airline_agent.inventory.seats import SeatOccupancy
+
+FLIGHT_ID = "F9-SFO-JFK-2025-11-12T08:15"
+
+
+def test_assignments_are_stable() -> None:
+    # Pinned values: a change here moves the gates and seats of every flight and booking
+    assert gates_and_terminals(FLIGHT_ID) == {
+        "departure_terminal": "Terminal 3",
+        "departure_gate": "B34",
+        "arrival_terminal": "Terminal A",
+        "arrival_gate": "D17",
+    }
+    assert seat_seed("BK-0000002A", FLIGHT_ID) == 801647929310698285
+    assert SeatOccupancy().allocate("standard", "aisle", seat_seed("BK-0000002A", FLIGHT_ID)) == "30C"
+
+
+def test_assignments_depend_only_on_their_ids() -> None:
+    assert gates_and_terminals(FLIGHT_ID) == gates_and_terminals(FLIGHT_ID)
+    other_flight = "F9-SFO-JFK-2025-11-12T11:40"
+    assert seat_seed("BK-0000002A", FLIGHT_ID) != seat_seed("BK-0000002A", other_flight)
+    assert seat_seed("BK-0000002A", FLIGHT_ID) != seat_seed("BK-0000002B", FLIGHT_ID)
+    # Keys are joined with a separator, so shifting characters between them changes the seed
+    assert stable_seed("ab", "c") != stable_seed("a", "bc")
+    assert 0 <= stable_seed("gates", FLIGHT_ID) < 2**64
@@ -16,6 +16,75 @@ def test_search_flights() -> None:
     )
 
 
+def test_search_flights_metro_area() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    answer, _ = agent.chat("What flights are there from the Bay Area to New York on November 12, 2025?")
+    assert_judge(
+        [
+            "output lists flights departing from more than one Bay Area airport (SFO, SJC or OAK)",
+            "output lists flights arriving at more than one New York airport (JFK, EWR or LGA)",
+        ],
+        answer,
+    )
+
+
+def test_search_flights_filtered() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    answer, _ = agent.chat(
+        "Show me flights from SFO to JFK on November 12, 2025 departing after 10am with a basic fare under $150, "
+        "cheapest first"
+    )
+    assert_judge(
+        [
+            "output lists flights departing after 10am",
+            "output mentions basic fare prices under $150",
+        ],
+        answer,
+    )
+
+
+def test_get_fare_summary() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    answer, _ = agent.chat("What's the cheapest basic fare from SFO to JFK between November 10 and November 16, 2025?")
+    assert_judge(
+        [
+            "output mentions a specific lowest price for the basic fare",
+            "output mentions a specific flight or date for the cheapest fare",
+        ],
+        answer,
+    )
+
+
+def test_get_fare_calendar() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    answer, _ = agent.chat(
+        "My dates are flexible. Which day between November 10 and November 20, 2025 is cheapest to fly economy "
+        "from SFO to JFK?"
+    )
+    assert_judge(
+        [
+            "output names a specific date as the cheapest day to fly",
+            "output mentions a specific economy price",
+        ],
+        answer,
+    )
+
+
+def test_find_round_trips() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    answer, _ = agent.chat(
+        "I want a cheap basic round trip from SFO to JFK. I can leave any day between November 10 and 14, 2025 and "
+        "come back between November 17 and 21, 2025, staying at least 5 days. What are my best options?"
+    )
+    assert_judge(
+        [
+            "output lists at least one round trip with an outbound and a return date",
+            "output mentions a total price for the round trip",
+        ],
+        answer,
+    )
+
+
 def test_get_fare_details() -> None:
     agent = Agent(cleanlab_enabled=False)
     agent.chat("Show me flights from SFO to EWR on November 12, 2025")
@@ -118,6 +187,18 @@ def test_flight_status() -> None:
     )
 
 
+def test_flight_status_by_flight_number() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    answer, _ = agent.chat("What's the status of F9 838 on November 12, 2025?")
+    assert_judge(
+        [
+            "output identifies flight F9 838 from SFO to JFK",
+            "output mentions status (on time, delayed, boarding, etc.) or gate information",
+        ],
+        answer,
+    )
+
+
 def test_flight_timings() -> None:
     agent = Agent(cleanlab_enabled=False)
     agent.chat("Find flights from SJC to EWR on November 13, 2025")
@@ -131,6 +212,32 @@ def test_flight_timings() -> None:
     )
 
 
+def test_flight_status_multiple_flights() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    agent.chat("Show me flights from SFO to JFK on November 12, 2025")
+    answer, _ = agent.chat("What's the status and departure gate of each of those flights?")
+    assert_judge(
+        [
+            "output provides status information for more than one flight",
+            "output mentions status (on time, delayed, boarding, etc.) or gate information",
+        ],
+        answer,
+    )
+
+
+def test_seat_map() -> None:
+    agent = Agent(cleanlab_enabled=False)
+    agent.chat("Show me flights from SFO to LGA on November 14, 2025")
+    answer, _ = agent.chat("Are there window seats left in the Stretch section of the first flight?")
+    assert_judge(
+        [
+            "output mentions window seat availability in the Stretch section",
+            "output mentions a number of available seats",
+        ],
+        answer,
+    )
+
+
 def test_fare_comparison() -> None:
     agent = Agent(cleanlab_enabled=False)
     agent.chat("Show me flights from SFO to JFK on November 12, 2025")
@@ -0,0 +1,81 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic_ai import ModelRetry
+
+from airline_agent.tools.booking import BookingTools
+from airline_agent.tools.sessions import current_session_id
+from airline_agent.types.booking import FareType
+
+NUM_THREADS = 16
+ATTEMPTS_PER_THREAD = 20
+
+
+def _try_book(tools: BookingTools, flight_ids: list[str], fare_type: FareType = "business") -> bool:
+    try:
+        tools.book_flights(flight_ids, fare_type)
+    except ModelRetry:
+        return False
+    return True
+
+
+def _seats_available(tools: BookingTools, flight_id: str, fare_type: str = "business") -> int:
+    return int(json.loads(tools.get_fare_details(flight_id, fare_type))["seats_available"])
+
+
+def test_concurrent_bookings_do_not_oversell() -> None:
+    tools = BookingTools()
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    seats = _seats_available(tools, flight_id)
+    assert seats < NUM_THREADS * ATTEMPTS_PER_THREAD
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as pool:
+        results = list(pool.map(lambda _: _try_book(tools, [flight_id]), range(NUM_THREADS * ATTEMPTS_PER_THREAD)))
+
+    assert sum(results) == seats
+    assert _seats_available(tools, flight_id) == 0
+    assert len(tools.get_my_bookings()) == seats
+
+
+def test_concurrent_multi_leg_bookings_are_all_or_nothing() -> None:
+    tools = BookingTools()
+    outbound = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    inbound = tools.search_flights("JFK", "SFO", "2025-11-19").flights[0].id
+    outbound_seats = _seats_available(tools, outbound)
+    inbound_seats = _seats_available(tools, inbound)
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as pool:
+        results = list(
+            pool.map(lambda _: _try_book(tools, [outbound, inbound]), range(NUM_THREADS * ATTEMPTS_PER_THREAD))
+        )
+
+    booked = sum(results)
+    assert booked == min(outbound_seats, inbound_seats)
+    assert _seats_available(tools, outbound) == outbound_seats - booked
+    assert _seats_available(tools, inbound) == inbound_seats - booked
+
+
+def test_sessions_sell_seats_independently() -> None:
+    # Seat availability is per booking session by design (see `FlightOverlay`): sessions racing for the last seats
+    # each sell every seat once, and neither oversells
+    tools = BookingTools()
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    seats = _seats_available(tools, flight_id)
+    sessions = ["thread-a", "thread-b"]
+
+    def book(attempt: int) -> tuple[str, bool]:
+        session_id = sessions[attempt % len(sessions)]
+        current_session_id.set(session_id)
+        return session_id, _try_book(tools, [flight_id])
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as pool:
+        results = list(pool.map(book, range(NUM_THREADS * ATTEMPTS_PER_THREAD)))
+
+    for session_id in sessions:
+        assert sum(booked for booking_session, booked in results if booking_session == session_id) == seats
+        token = current_session_id.set(session_id)
+        try:
+            assert _seats_available(tools, flight_id) == 0
+            assert len(tools.get_my_bookings()) == seats
+        finally:
+            current_session_id.reset(token)
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from pydantic_ai import ModelRetry
+
+from airline_agent.tools.booking import BookingTools
+
+
+def test_fare_summary_normalizes_airports() -> None:
+    tools = BookingTools()
+    summary = tools.get_fare_summary(" sfo", "jfk ", "2025-11-12", "2025-11-13")
+    assert (summary.origin, summary.destination) == ("SFO", "JFK")
+    assert summary == tools.get_fare_summary("SFO", "JFK", "2025-11-12", "2025-11-13")
+    assert summary.num_flights > 0
+
+    with pytest.raises(ModelRetry, match="Unknown airport: XXX"):
+        tools.get_fare_summary("XXX", "JFK", "2025-11-12", "2025-11-13")
+    with pytest.raises(ModelRetry, match="BAY is a metro area"):
+        tools.get_fare_summary("SFO", "BAY", "2025-11-12", "2025-11-13")
+
+
+def test_search_rejects_unknown_airports() -> None:
+    tools = BookingTools()
+    assert tools.search_flights(["bay", "jfk"], "nyc", "2025-11-12").total > 0
+    with pytest.raises(ModelRetry, match="Unknown airport: XXX"):
+        tools.search_flights(["SFO", "XXX"], "JFK", "2025-11-12")
+
+
+def test_fare_calendar_normalizes_airports() -> None:
+    tools = BookingTools()
+    calendar = tools.get_fare_calendar("sfo", " jfk", "2025-11-12", "2025-11-18")
+    assert (calendar.origin, calendar.destination) == ("SFO", "JFK")
+    assert calendar == tools.get_fare_calendar("SFO", "JFK", "2025-11-12", "2025-11-18")
+    assert any(day.min_price is not None for day in calendar.days)
+
+    with pytest.raises(ModelRetry, match="Unknown airport: lax"):
+        tools.get_fare_calendar("SFO", "lax", "2025-11-12", "2025-11-18")
+
+
+def test_round_trips_normalize_airports() -> None:
+    tools = BookingTools()
+    dates = ("2025-11-12", "2025-11-14", "2025-11-18", "2025-11-20")
+    options = tools.find_round_trips("sfo ", "Jfk", *dates)
+    assert options
+    assert options == tools.find_round_trips("SFO", "JFK", *dates)
+    assert options[0].outbound_flight_id.startswith("F9-SFO-JFK-")
+
+    with pytest.raises(ModelRetry, match="Unknown airport: XYZ"):
+        tools.find_round_trips("XYZ", "JFK", *dates)
+
+
+def test_fare_details_rejects_unknown_fare_types() -> None:
+    tools = BookingTools()
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    assert json.loads(tools.get_fare_details(flight_id, "economy"))["fare_type"] == "economy"
+
+    for fare_type in ("first", "Economy", "economy "):
+        with pytest.raises(ModelRetry, match=f"Fare type '{fare_type}' not found"):
+            tools.get_fare_details(flight_id, fare_type)
+    payloads = tools._payloads.get(flight_id)  # noqa: SLF001
+    assert payloads is not None
+    assert list(payloads._payloads) == [("fare_details", "economy", None)]  # noqa: SLF001
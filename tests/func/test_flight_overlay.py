@@ -0,0 +1,51 @@
+import json
+
+import numpy as np
+
+from airline_agent.constants import FLIGHT_DATA_VERSION
+from airline_agent.data_generation.generate_flights import generate_flight_records
+from airline_agent.inventory.flights import shared_flight_inventory
+from airline_agent.inventory.overlay import FlightOverlay
+from airline_agent.inventory.seats import parse_seat
+from airline_agent.inventory.snapshot import build_table
+from airline_agent.tools.booking import BookingTools
+from airline_agent.types.booking import FARE_TYPES
+
+
+def test_overlay_changes_stay_out_of_the_table() -> None:
+    table = build_table(generate_flight_records()[:50])
+    fare_seats = table.columns["fare_seats"].copy()
+    record = table.record(0)
+    fare = table.fare(0, FARE_TYPES.index("economy"))
+
+    overlay = FlightOverlay()
+    assert overlay.take_seats([(record.id, fare), (record.id, fare)])
+    bit = parse_seat("12A")
+    assert bit is not None
+    assert overlay.seat_occupancy(record.id).reserve(bit)
+    assert overlay.view(record).fare_seats[FARE_TYPES.index("economy")] == fare.seats_available - 2
+    assert overlay.view_fare(record.id, fare).seats_available == fare.seats_available - 2
+
+    assert np.array_equal(table.columns["fare_seats"], fare_seats)
+    assert table.record(0) == record
+    assert table.fare(0, FARE_TYPES.index("economy")) == fare
+    fresh = FlightOverlay()
+    assert fresh.view(record) is record
+    assert fresh.seat_occupancy(record.id).is_free(bit)
+
+
+def test_reset_drops_the_overlay() -> None:
+    tools = BookingTools()
+    inventory = shared_flight_inventory(FLIGHT_DATA_VERSION)
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    base = inventory.get(flight_id)
+    assert base is not None
+    booking = tools.book_flights([flight_id])
+    tools.add_service_to_booking(booking.booking_id, flight_id, "premium_seat_selection", seat_assignment="5A")
+    assert json.loads(tools.get_fare_details(flight_id))["seats_available"] == base.fare_seats[0] - 1
+    assert inventory.get(flight_id) == base
+
+    tools._reset()  # noqa: SLF001
+    assert json.loads(tools.get_fare_details(flight_id))["seats_available"] == base.fare_seats[0]
+    assert all(zone.occupied_seats == [] for zone in tools.get_seat_map(flight_id).zones)
+    assert inventory.get(flight_id) == base
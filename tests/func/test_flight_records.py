@@ -0,0 +1,81 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from airline_agent.constants import FLIGHT_DATA_DATE, FLIGHT_DATA_NUM_DAYS
+from airline_agent.data_generation.generate_flights import (
+    EAGER_FLIGHT_DATA_VERSION,
+    ROUTES,
+    generate_bucket_records,
+    generate_flight_records,
+    generator_inputs_hash,
+)
+from airline_agent.inventory.flights import LazyFlightInventory, load_flight_table
+from airline_agent.inventory.snapshot import build_table, load_snapshot, write_snapshot
+from airline_agent.types.booking import FARE_TYPES
+
+
+def test_table_rows_rebuild_the_generated_flights() -> None:
+    records = generate_flight_records()[:500]
+    table = build_table(records)
+
+    assert table.meta["fare_bundles"][FARE_TYPES.index("business")]["included_services"][-1] == "upfront_plus_seating"
+    # Same-minute departures share an ID, and the table keeps the last one
+    for record in {record.id: record for record in records}.values():
+        row = table.find(record.id)
+        assert row is not None
+        assert table.record(row) == record
+        flight = record.flight()
+        assert [table.fare(row, fare_idx) for fare_idx in range(len(FARE_TYPES))] == flight.fares
+        assert table.add_ons(row) == flight.add_ons
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    records = generate_flight_records()[:200]
+    table = build_table(records, label="test")
+    write_snapshot(table, tmp_path)
+
+    loaded = load_snapshot(tmp_path)
+    assert loaded is not None
+    assert loaded.meta == json.loads(json.dumps(table.meta))
+    assert loaded.columns.keys() == table.columns.keys()
+    for name, column in table.columns.items():
+        assert np.array_equal(loaded.columns[name], column)
+    assert [loaded.record(row) for row in range(len(loaded))] == [table.record(row) for row in range(len(table))]
+    assert load_snapshot(tmp_path / "missing") is None
+
+
+def test_snapshot_from_other_generator_inputs_is_regenerated(tmp_path: Path) -> None:
+    records = generate_flight_records()[:200]
+    meta = {
+        "flight_data_version": EAGER_FLIGHT_DATA_VERSION,
+        "flight_data_date": FLIGHT_DATA_DATE.isoformat(),
+        "flight_data_num_days": FLIGHT_DATA_NUM_DAYS,
+    }
+    current = tmp_path / "current"
+    write_snapshot(build_table(records, **meta, generator_inputs_hash=generator_inputs_hash()), current)
+    assert len(load_flight_table(current)) == len(build_table(records))
+
+    stale = tmp_path / "stale"
+    write_snapshot(build_table(records, **meta, generator_inputs_hash="0" * 64), stale)
+    assert len(load_flight_table(stale)) > len(records)
+
+
+def test_lazy_inventory_serves_records() -> None:
+    inventory = LazyFlightInventory()
+    origin, destination = ROUTES[0]
+    day = date(2025, 12, 3)
+
+    records = inventory.search(origin, destination, day)
+    assert records == generate_bucket_records(origin, destination, day)
+    for record in records:
+        flight = record.flight()
+        assert inventory.get(record.id) == record
+        assert inventory.add_ons(record.id) == flight.add_ons
+        for fare in flight.fares:
+            assert inventory.fare(record.id, fare.fare_type) == fare
+        assert record.summary().prices == {fare.fare_type: fare.price_total for fare in flight.fares}
+    assert inventory.fare(records[0].id, "first") is None
+    assert inventory.get(f"{records[0].id[:-5]}03:07") is None
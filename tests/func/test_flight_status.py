@@ -0,0 +1,62 @@
+import json
+from datetime import date, timedelta
+
+from airline_agent.constants import FLIGHT_DATA_VERSION
+from airline_agent.data_generation.generate_flights import FlightRecord
+from airline_agent.inventory.disruptions import BOARDING_LEAD_MINUTES, flight_timeline
+from airline_agent.inventory.flights import shared_flight_inventory
+from airline_agent.tools.booking import BookingTools
+from airline_agent.tools.clock import SimulatedClock
+
+
+def _delayed_flight() -> FlightRecord:
+    inventory = shared_flight_inventory(FLIGHT_DATA_VERSION)
+    flights = [flight for day in range(12, 20) for flight in inventory.search("SFO", "JFK", date(2025, 11, day))]
+    return next(
+        flight
+        for flight in flights
+        if any(
+            event.status == "delayed" for event in flight_timeline(flight.id, flight.departure, flight.arrival).events
+        )
+    )
+
+
+def test_status_follows_timeline() -> None:
+    flight = _delayed_flight()
+    delay_event = next(
+        event
+        for event in flight_timeline(flight.id, flight.departure, flight.arrival).events
+        if event.status == "delayed"
+    )
+    assert delay_event.at is not None
+    assert delay_event.delay_minutes is not None
+    delay = timedelta(minutes=delay_event.delay_minutes)
+
+    clock = SimulatedClock(delay_event.at - timedelta(minutes=1))
+    tools = BookingTools(clock=clock)
+    status = tools.get_flight_status(flight.id)
+    assert status["status"] == "on_time"
+    assert status["estimated_departure"] is None
+    assert status["estimated_arrival"] is None
+    assert json.loads(tools.get_flight_timings(flight.id))["estimated_departure"] is None
+
+    clock.advance(timedelta(minutes=1))
+    status = tools.get_flight_status(flight.id)
+    assert status["status"] == "delayed"
+    assert status["delay_minutes"] == delay_event.delay_minutes
+    assert status["estimated_departure"] == (flight.departure + delay).isoformat()
+    timings = json.loads(tools.get_flight_timings(flight.id))
+    assert timings["estimated_departure"] == status["estimated_departure"]
+    assert timings["estimated_arrival"] == status["estimated_arrival"] == (flight.arrival + delay).isoformat()
+
+    clock.set(flight.departure + delay - timedelta(minutes=BOARDING_LEAD_MINUTES))
+    assert tools.get_flight_status(flight.id)["status"] == "boarding"
+    clock.set(flight.arrival + delay)
+    assert tools.get_flight_status(flight.id)["status"] == "arrived"
+
+
+def test_status_is_independent_of_query_order() -> None:
+    flight_ids = [flight.id for flight in BookingTools().search_flights("OAK", "LGA", "2025-11-20").flights]
+    first = BookingTools().get_flight_status_batch(flight_ids)
+    second = BookingTools().get_flight_status_batch(flight_ids[::-1])
+    assert first == second
@@ -0,0 +1,78 @@
+from datetime import date, time, timedelta
+
+import numpy as np
+import pytest
+
+from airline_agent.data_generation.generate_flights import CARRIER_CODE
+from airline_agent.data_generation.generate_schedule import (
+    FIRST_DEPARTURE_HOUR,
+    LAST_DEPARTURE_HOUR,
+    MAX_SYNTHETIC_AIRPORTS,
+    demo_route_table,
+    generate_schedule,
+    synthetic_route_table,
+)
+from airline_agent.inventory.fares import FareStore
+
+
+def test_demo_network_schedule() -> None:
+    routes = demo_route_table()
+    # Spans the end of daylight saving time on 2025-11-02
+    table = generate_schedule(routes, date(2025, 10, 25), 14)
+
+    assert len(np.unique(table.columns["id"])) == len(table)
+    block_minutes = {(route.origin, route.destination): route.block_minutes for route in routes}
+    for route in routes:
+        for day in (date(2025, 11, 1), date(2025, 11, 2)):
+            rows = table.bucket_rows(route.origin, route.destination, day)
+            assert 0 < len(rows) <= route.daily_flights[1]
+            flights = [table.record(row) for row in rows]
+            assert [flight.departure for flight in flights] == sorted(flight.departure for flight in flights)
+            for flight in flights:
+                assert table.find(flight.id) is not None
+                assert flight.departure.date() == day
+                assert time(FIRST_DEPARTURE_HOUR) <= flight.departure.time() <= time(LAST_DEPARTURE_HOUR, 45)
+                assert flight.carrier == CARRIER_CODE
+                assert flight.flight_number.startswith(f"{CARRIER_CODE} ")
+                assert flight.id.endswith(flight.departure.strftime("%Y-%m-%dT%H:%M"))
+                assert flight.arrival - flight.departure == timedelta(
+                    minutes=block_minutes[route.origin, route.destination]
+                )
+                assert [fare.fare_type for fare in flight.flight().fares] == ["basic", "economy", "premium", "business"]
+    FareStore(table)
+
+
+def test_schedule_is_deterministic() -> None:
+    routes = synthetic_route_table(30, 5)
+    first = generate_schedule(routes, date(2025, 1, 1), 10)
+    second = generate_schedule(routes[::-1], date(2025, 1, 1), 10)
+    for name, column in first.columns.items():
+        assert np.array_equal(column, second.columns[name]), name
+
+
+def test_synthetic_network_schedule_across_dst() -> None:
+    routes = synthetic_route_table(40, 4)
+    # Spans the start of daylight saving time on 2026-03-08
+    table = generate_schedule(routes, date(2026, 3, 1), 14)
+
+    assert len(np.unique(table.columns["id"])) == len(table)
+    for route in routes:
+        for day in (date(2026, 3, 7), date(2026, 3, 8), date(2026, 3, 9)):
+            rows = table.bucket_rows(route.origin, route.destination, day)
+            assert 0 < len(rows) <= route.daily_flights[1]
+            for row in rows:
+                record = table.record(row)
+                assert str(record.departure.tzinfo) == route.origin_timezone
+                assert record.departure.date() == day
+                assert time(FIRST_DEPARTURE_HOUR) <= record.departure.time() <= time(LAST_DEPARTURE_HOUR, 45)
+                # IDs hold the local departure time, drawn before converting to UTC with the day's offset
+                assert record.id.endswith(record.departure.strftime("%Y-%m-%dT%H:%M"))
+                assert record.arrival - record.departure == timedelta(minutes=route.block_minutes)
+
+
+def test_synthetic_route_table_checks_airport_count() -> None:
+    assert len({route.origin for route in synthetic_route_table(3, 2)}) == 3
+    with pytest.raises(ValueError, match="num_airports"):
+        synthetic_route_table(MAX_SYNTHETIC_AIRPORTS + 1, 1)
+    with pytest.raises(ValueError, match="num_airports"):
+        synthetic_route_table(0, 1)
@@ -0,0 +1,263 @@
+import contextvars
+import dataclasses
+import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from pydantic_ai import ModelRetry
+
+from airline_agent.reservations.journal import JOURNAL_FILE, SNAPSHOT_FILE, JournalReservationStore, replay_journal
+from airline_agent.reservations.records import BookingRecord
+from airline_agent.reservations.sqlite import SqliteReservationStore
+from airline_agent.reservations.store import InMemoryReservationStore
+from airline_agent.tools.booking import SEAT_HOLD_MINUTES, BookingTools
+from airline_agent.tools.clock import SimulatedClock
+from airline_agent.tools.sessions import current_session_id
+from airline_agent.types.booking import Booking
+
+
+def test_bookings_survive_restart(tmp_path: Path) -> None:
+    path = tmp_path / "reservations.db"
+    store = SqliteReservationStore(path)
+    tools = BookingTools(reservation_store=store)
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    booking = tools.book_flights([flight_id], "economy")
+    tools.add_service_to_booking(booking.booking_id, flight_id, "checked_bag")
+    booking = tools.add_service_to_booking(
+        booking.booking_id, flight_id, "premium_seat_selection", seat_assignment="5a"
+    )
+    store.close()
+
+    store = SqliteReservationStore(path)
+    tools = BookingTools(reservation_store=store)
+    restored = tools.get_booking(booking.booking_id)
+    assert restored == booking
+    assert [add_on.service_type for add_on in restored.flights[0].add_ons] == ["checked_bag", "premium_seat_selection"]
+    assert tools.check_in(booking.booking_id, flight_id).flights[0].seat_assignment == "5A"
+    # The session's booking IDs start over after a restart, but must not reuse a stored booking's ID
+    assert tools.book_flights([flight_id]).booking_id != booking.booking_id
+    assert len(tools.get_my_bookings()) == 2
+    store.close()
+
+
+def _seats_available(tools: BookingTools, flight_id: str, fare_type: str) -> int:
+    return int(json.loads(tools.get_fare_details(flight_id, fare_type))["seats_available"])
+
+
+def test_restart_restores_taken_seats(tmp_path: Path) -> None:
+    path = tmp_path / "reservations.db"
+    store = SqliteReservationStore(path)
+    tools = BookingTools(reservation_store=store)
+    flights = tools.search_flights("SFO", "JFK", "2025-11-12").flights
+    flight_id = next(flight.id for flight in flights if _seats_available(tools, flight.id, "business") == 1)
+    tools.book_flights([flight_id], "business")
+    booking = tools.book_flights([flight_id], "basic")
+    tools.add_service_to_booking(booking.booking_id, flight_id, "standard_seat_selection", seat_assignment="36E")
+    store.close()
+
+    store = SqliteReservationStore(path)
+    tools = BookingTools(reservation_store=store)
+    assert _seats_available(tools, flight_id, "business") == 0
+    with pytest.raises(ModelRetry, match="No seats available"):
+        tools.book_flights([flight_id], "business")
+    standard = next(zone for zone in tools.get_seat_map(flight_id).zones if zone.zone == "standard")
+    assert standard.occupied_seats == ["36E"]
+    booking = tools.book_flights([flight_id], "basic")
+    with pytest.raises(ModelRetry, match="already taken"):
+        tools.add_service_to_booking(booking.booking_id, flight_id, "standard_seat_selection", seat_assignment="36E")
+    store.close()
+
+
+def test_holds_expire_after_restart(tmp_path: Path) -> None:
+    path = tmp_path / "reservations.db"
+    clock = SimulatedClock()
+    store = SqliteReservationStore(path)
+    tools = BookingTools(reservation_store=store, clock=clock)
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    seats = _seats_available(tools, flight_id, "basic")
+    overdue = tools.book_flights([flight_id], hold=True)
+    clock.advance(timedelta(minutes=10))
+    held = tools.book_flights([flight_id], hold=True)
+    store.close()
+
+    clock.advance(timedelta(minutes=10))
+    store = SqliteReservationStore(path)
+    tools = BookingTools(reservation_store=store, clock=clock)
+    assert tools.get_booking(overdue.booking_id).status.status == "expired"
+    assert _seats_available(tools, flight_id, "basic") == seats - 1
+    assert tools.confirm_booking(held.booking_id).status.status == "confirmed"
+    assert store.pending_bookings() == []
+    store.close()
+
+
+def test_reset_keeps_durable_bookings(tmp_path: Path) -> None:
+    store = SqliteReservationStore(tmp_path / "reservations.db")
+    tools = BookingTools(reservation_store=store)
+    in_memory = BookingTools()
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    booking = tools.book_flights([flight_id])
+    in_memory.book_flights([flight_id])
+
+    tools._reset()  # noqa: SLF001
+    in_memory._reset()  # noqa: SLF001
+    assert tools.get_booking(booking.booking_id) == booking
+    assert in_memory.get_my_bookings() == []
+    store.close()
+
+
+def test_resumed_session_checks_in_and_adds_seats(tmp_path: Path) -> None:
+    store = SqliteReservationStore(tmp_path / "reservations.db")
+    tools = BookingTools(reservation_store=store)
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    first = tools.book_flights([flight_id]).booking_id
+    second = tools.book_flights([flight_id]).booking_id
+
+    def resume(call: Callable[[], Booking]) -> Booking:
+        # Restoring the session on first use takes flight locks, which the tool must not be holding by then
+        tools._reset()  # noqa: SLF001
+        results: list[Booking] = []
+        context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(lambda: results.append(call()),), daemon=True)
+        thread.start()
+        thread.join(timeout=30)
+        assert results, "the tool call deadlocked"
+        return results[0]
+
+    checked_in = resume(lambda: tools.check_in(first, flight_id))
+    assert checked_in.flights[0].checked_in
+    seat = checked_in.flights[0].seat_assignment
+    assert seat is not None
+    booking = resume(
+        lambda: tools.add_service_to_booking(second, flight_id, "premium_seat_selection", seat_assignment="5A")
+    )
+    assert [addon.service_type for addon in booking.flights[0].add_ons] == ["premium_seat_selection"]
+    occupied = {zone.zone: zone.occupied_seats for zone in tools.get_seat_map(flight_id).zones}
+    assert occupied["stretch"] == ["5A"]
+    assert occupied["standard"] == [seat]
+    store.close()
+
+
+def test_stores_add_only_new_bookings(tmp_path: Path) -> None:
+    tools = BookingTools()
+    record = BookingRecord.from_model(
+        tools.book_flights([tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id])
+    )
+    other = dataclasses.replace(record, currency="EUR")
+    sqlite = SqliteReservationStore(tmp_path / "reservations.db")
+    journal = JournalReservationStore(tmp_path / "journal")
+    for store in (InMemoryReservationStore(), sqlite, journal):
+        assert store.add("thread", record)
+        assert not store.add("thread", other)
+        assert store.get("thread", record.booking_id) == record
+        assert store.add("other-thread", other)
+        assert [b.currency for b in store.flight_bookings(record.flights[0].flight_id)] == ["USD", "EUR"]
+    sqlite.close()
+    journal.close()
+
+
+def test_workers_sharing_a_store_do_not_reuse_booking_ids(tmp_path: Path) -> None:
+    store = SqliteReservationStore(tmp_path / "reservations.db")
+    workers = [BookingTools(reservation_store=store) for _ in range(4)]
+    flight_id = workers[0].search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+
+    def book(tools: BookingTools) -> str:
+        current_session_id.set("shared-thread")
+        return tools.book_flights([flight_id]).booking_id
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        booking_ids = list(pool.map(book, workers * 2))
+    assert len(set(booking_ids)) == len(booking_ids)
+    assert sorted(b.booking_id for b in store.session_bookings("shared-thread")) == sorted(booking_ids)
+    store.close()
+
+
+def test_sqlite_store_indexes_sessions_and_flights(tmp_path: Path) -> None:
+    store = SqliteReservationStore(tmp_path / "reservations.db")
+    tools = BookingTools(reservation_store=store)
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+
+    def book(session_id: str) -> str:
+        current_session_id.set(session_id)
+        return tools.book_flights([flight_id]).booking_id
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        sessions = [f"thread-{idx}" for idx in range(32)]
+        booking_ids = list(pool.map(book, sessions))
+
+    manifest = store.flight_bookings(flight_id, status="confirmed")
+    assert sorted(booking.booking_id for booking in manifest) == sorted(booking_ids)
+    for session_id, booking_id in zip(sessions, booking_ids, strict=True):
+        assert [booking.booking_id for booking in store.session_bookings(session_id)] == [booking_id]
+    assert store.session_bookings("thread-0", status="cancelled") == []
+    store.close()
+
+
+def test_journal_restores_from_snapshot_and_tail(tmp_path: Path) -> None:
+    store = JournalReservationStore(tmp_path, snapshot_interval=4)
+    tools = BookingTools(reservation_store=store)
+    flight_ids = [flight.id for flight in tools.search_flights("SFO", "JFK", "2025-11-12").flights[:2]]
+    booking = tools.book_flights(flight_ids, "economy")
+    tools.add_service_to_booking(booking.booking_id, flight_ids[0], "checked_bag")
+    tools.add_service_to_booking(booking.booking_id, flight_ids[1], "premium_seat_selection", seat_assignment="5a")
+    booking = tools.check_in(booking.booking_id, flight_ids[0])
+    hold = tools.book_flights(flight_ids[:1], hold=True)
+    hold = tools.confirm_booking(hold.booking_id)
+    assert store.seq == 6
+    store.close()
+
+    lines = (tmp_path / JOURNAL_FILE).read_text().splitlines()
+    assert json.loads(lines[1])["op"] == "patch"
+    assert len(lines[1]) < len(lines[0]) / 2
+    header, *snapshot = (tmp_path / SNAPSHOT_FILE).read_text().splitlines()
+    assert json.loads(header)["seq"] == 4
+    assert len(snapshot) == 1
+    # A crash while appending leaves a torn last line, which is dropped on restore
+    with (tmp_path / JOURNAL_FILE).open("a") as f:
+        f.write('{"seq": 7, "op": "pa')
+
+    store = JournalReservationStore(tmp_path)
+    tools = BookingTools(reservation_store=store)
+    assert tools.get_booking(booking.booking_id) == booking
+    assert tools.get_booking(hold.booking_id) == hold
+    assert [booking.booking_id for booking in store.flight_bookings(flight_ids[1])] == [booking.booking_id]
+    released = tools.release_hold(tools.book_flights(flight_ids[1:], hold=True).booking_id)
+    assert store.seq == 8
+    assert [booking.booking_id for booking in store.flight_bookings(flight_ids[1], "cancelled")] == [
+        released.booking_id
+    ]
+    store.close()
+
+    replayed = replay_journal(tmp_path, until=1)
+    assert [record.to_model().flights[0].add_ons for record in replayed.values()] == [[]]
+    assert [record.status for record in replay_journal(tmp_path).values()] == ["confirmed", "confirmed", "cancelled"]
+
+
+def test_journal_restore_rebuilds_seats_and_holds(tmp_path: Path) -> None:
+    clock = SimulatedClock()
+    store = JournalReservationStore(tmp_path)
+    tools = BookingTools(reservation_store=store, clock=clock)
+    flights = tools.search_flights("SFO", "JFK", "2025-11-12").flights
+    flight_id = next(flight.id for flight in flights if _seats_available(tools, flight.id, "business") == 1)
+    seats = _seats_available(tools, flight_id, "basic")
+    tools.book_flights([flight_id], "business")
+    held = tools.book_flights([flight_id], hold=True)
+    tools.add_service_to_booking(held.booking_id, flight_id, "standard_seat_selection", seat_assignment="36E")
+    store.close()
+
+    store = JournalReservationStore(tmp_path)
+    tools = BookingTools(reservation_store=store, clock=clock)
+    assert _seats_available(tools, flight_id, "business") == 0
+    assert _seats_available(tools, flight_id, "basic") == seats - 1
+    standard = next(zone for zone in tools.get_seat_map(flight_id).zones if zone.zone == "standard")
+    assert standard.occupied_seats == ["36E"]
+
+    clock.advance(timedelta(minutes=SEAT_HOLD_MINUTES))
+    assert tools.get_booking(held.booking_id).status.status == "expired"
+    assert _seats_available(tools, flight_id, "basic") == seats
+    standard = next(zone for zone in tools.get_seat_map(flight_id).zones if zone.zone == "standard")
+    assert standard.occupied_seats == []
+    store.close()
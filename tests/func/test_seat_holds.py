@@ -0,0 +1,106 @@
+import json
+from datetime import timedelta
+
+import pytest
+from pydantic_ai import ModelRetry
+
+from airline_agent.constants import DEMO_DATETIME
+from airline_agent.tools.booking import SEAT_HOLD_MINUTES, BookingTools
+from airline_agent.tools.clock import SimulatedClock
+from airline_agent.tools.sessions import current_session_id
+
+
+def _seats_available(tools: BookingTools, flight_id: str) -> int:
+    return int(json.loads(tools.get_fare_details(flight_id, "basic"))["seats_available"])
+
+
+def test_expired_hold_releases_seats() -> None:
+    clock = SimulatedClock()
+    tools = BookingTools(clock=clock)
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    seats = _seats_available(tools, flight_id)
+
+    booking = tools.book_flights([flight_id], hold=True)
+    assert booking.status.status == "pending"
+    assert booking.status.hold_expires_at == DEMO_DATETIME + timedelta(minutes=SEAT_HOLD_MINUTES)
+    assert _seats_available(tools, flight_id) == seats - 1
+
+    clock.advance(timedelta(minutes=SEAT_HOLD_MINUTES - 1))
+    assert _seats_available(tools, flight_id) == seats - 1
+
+    clock.advance(timedelta(minutes=1))
+    assert _seats_available(tools, flight_id) == seats
+    assert tools.get_booking(booking.booking_id).status.status == "expired"
+    with pytest.raises(ModelRetry):
+        tools.confirm_booking(booking.booking_id)
+
+
+def test_confirmed_hold_keeps_seats() -> None:
+    clock = SimulatedClock()
+    tools = BookingTools(clock=clock)
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    seats = _seats_available(tools, flight_id)
+
+    held = tools.book_flights([flight_id], hold=True)
+    released = tools.book_flights([flight_id], hold=True)
+    clock.advance(timedelta(minutes=5))
+    confirmed = tools.confirm_booking(held.booking_id)
+    assert confirmed.status.status == "confirmed"
+    assert confirmed.status.hold_expires_at is None
+    assert tools.release_hold(released.booking_id).status.status == "cancelled"
+    assert _seats_available(tools, flight_id) == seats - 1
+
+    clock.advance(timedelta(minutes=SEAT_HOLD_MINUTES))
+    assert _seats_available(tools, flight_id) == seats - 1
+    assert [booking.booking_id for booking in tools.get_my_bookings()] == [held.booking_id]
+
+
+def _occupied_seats(tools: BookingTools, flight_id: str) -> list[str]:
+    return [seat for zone in tools.get_seat_map(flight_id).zones for seat in zone.occupied_seats]
+
+
+def test_released_hold_frees_assigned_seats() -> None:
+    tools = BookingTools()
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    held = tools.book_flights([flight_id], hold=True)
+    tools.add_service_to_booking(held.booking_id, flight_id, "premium_seat_selection", seat_assignment="5A")
+    assert _occupied_seats(tools, flight_id) == ["5A"]
+
+    tools.release_hold(held.booking_id)
+    assert _occupied_seats(tools, flight_id) == []
+    booking = tools.book_flights([flight_id])
+    tools.add_service_to_booking(booking.booking_id, flight_id, "premium_seat_selection", seat_assignment="5A")
+    assert _occupied_seats(tools, flight_id) == ["5A"]
+
+
+def test_expired_hold_frees_assigned_seats() -> None:
+    clock = SimulatedClock()
+    tools = BookingTools(clock=clock)
+    outbound = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    inbound = tools.search_flights("JFK", "SFO", "2025-11-19").flights[0].id
+    held = tools.book_flights([outbound, inbound], hold=True)
+    tools.add_service_to_booking(held.booking_id, outbound, "premium_seat_selection", seat_assignment="5A")
+    tools.add_service_to_booking(held.booking_id, inbound, "premium_seat_selection", seat_assignment="6A")
+
+    clock.advance(timedelta(minutes=SEAT_HOLD_MINUTES))
+    assert _occupied_seats(tools, outbound) == []
+    assert _occupied_seats(tools, inbound) == []
+    assert tools.get_booking(held.booking_id).status.status == "expired"
+
+
+def test_fare_details_follow_each_sessions_seats() -> None:
+    tools = BookingTools()
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    token = current_session_id.set("seat-holds-a")
+    try:
+        seats = _seats_available(tools, flight_id)
+
+        booking = tools.book_flights([flight_id], hold=True)
+        assert _seats_available(tools, flight_id) == seats - 1
+        current_session_id.set("seat-holds-b")
+        assert _seats_available(tools, flight_id) == seats
+        current_session_id.set("seat-holds-a")
+        tools.release_hold(booking.booking_id)
+        assert _seats_available(tools, flight_id) == seats
+    finally:
+        current_session_id.reset(token)
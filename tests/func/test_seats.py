@@ -0,0 +1,56 @@
+from airline_agent.inventory.seats import ROWS, SEAT_LETTERS, SeatOccupancy, parse_seat, seat_label, zone_of
+
+
+def test_parse_seat_bounds() -> None:
+    assert parse_seat("1A") == 0
+    assert parse_seat("40F") == ROWS * len(SEAT_LETTERS) - 1
+    assert parse_seat(" 12c ") == parse_seat("12C")
+    for seat in ("0A", "41A", "12G", "100A", "A12", "12", ""):
+        assert parse_seat(seat) is None
+    for bit in range(ROWS * len(SEAT_LETTERS)):
+        assert parse_seat(seat_label(bit)) == bit
+    assert [zone_of(parse_seat(seat) or 0) for seat in ("2F", "3A", "15F", "16A")] == [
+        "upfront_plus",
+        "stretch",
+        "stretch",
+        "standard",
+    ]
+
+
+def test_allocate_starts_at_the_seed_and_wraps_around() -> None:
+    # upfront_plus is rows 1-2, so a seed picks one of its 12 seats
+    occupancy = SeatOccupancy()
+    assert occupancy.allocate("upfront_plus", seed=11) == "2F"
+    assert occupancy.allocate("upfront_plus", seed=11) == "1A"
+    assert occupancy.allocate("upfront_plus", seed=12 + 11) == "1B"
+    assert occupancy.allocate("upfront_plus", seed=4) == "1E"
+    # Seeds index the zone's seats, not the whole cabin
+    assert SeatOccupancy().allocate("stretch", seed=0) == "3A"
+    assert SeatOccupancy().allocate("stretch", seed=7) == "4B"
+
+
+def test_allocate_prefers_the_position_and_falls_back_to_the_zone() -> None:
+    occupancy = SeatOccupancy()
+    assert occupancy.allocate("upfront_plus", "window", seed=2) == "1F"
+    assert occupancy.allocate("upfront_plus", "aisle", seed=0) == "1C"
+    for seat in ("1A", "2A", "2F"):
+        bit = parse_seat(seat)
+        assert bit is not None
+        assert occupancy.reserve(bit)
+    # No window seat is left in the zone, so the first free seat from the seed is taken
+    assert occupancy.allocate("upfront_plus", "window", seed=0) == "1B"
+    assert occupancy.allocate("upfront_plus", "unknown", seed=0) == "1D"
+
+
+def test_allocate_returns_none_when_the_zone_is_full() -> None:
+    occupancy = SeatOccupancy()
+    seats = {occupancy.allocate("upfront_plus", seed=seed) for seed in range(12)}
+    assert seats == {f"{row}{letter}" for row in (1, 2) for letter in SEAT_LETTERS}
+    assert occupancy.allocate("upfront_plus") is None
+    assert occupancy.allocate("upfront_plus", "window", seed=5) is None
+    assert occupancy.allocate("stretch") == "3A"
+
+    bit = parse_seat("2C")
+    assert bit is not None
+    occupancy.release(bit)
+    assert occupancy.allocate("upfront_plus", "window") == "2C"
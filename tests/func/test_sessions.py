@@ -0,0 +1,99 @@
+from pathlib import Path
+
+from airline_agent.reservations.sqlite import SqliteReservationStore
+from airline_agent.tools.booking import BookingTools
+from airline_agent.tools.sessions import BookingSession, BookingSessions, current_session_id
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sessions_are_evicted_once_idle() -> None:
+    clock = _Clock()
+    created: list[str] = []
+    evicted: list[str] = []
+    sessions = BookingSessions(
+        idle_timeout=60,
+        clock=clock,
+        on_create=lambda session_id, _: created.append(session_id),
+        on_evict=evicted.append,
+    )
+    first = sessions.get("a")
+    assert sessions.get("a") is first
+    assert sessions.get("b") is not first
+
+    clock.now = 59
+    assert sessions.get("a") is first
+    clock.now = 100
+    # Eviction is lazy: "b", idle since 0, goes on the next get of any session
+    assert evicted == []
+    assert sessions.get("a") is first
+    assert evicted == ["b"]
+    assert sessions.peek("b") is None
+    assert len(sessions) == 1
+
+    clock.now = 200
+    # A session used again before it is evicted is kept, however long it was idle
+    assert sessions.get("a") is first
+    clock.now = 300
+    sessions.get("c")
+    assert evicted == ["b", "a"]
+    assert sessions.get("a") is not first
+    assert created == ["a", "b", "c", "a"]
+
+    sessions.clear()
+    assert sorted(evicted[2:]) == ["a", "c"]
+    assert len(sessions) == 0
+
+
+def test_sessions_have_isolated_overlays() -> None:
+    sessions = BookingSessions()
+    first, second = sessions.get("a"), sessions.get("b")
+    assert isinstance(first, BookingSession)
+    assert first.overlay is not second.overlay
+    assert first.overlay.seat_occupancy("F9-1").reserve(0)
+    assert second.overlay.seat_occupancy("F9-1").is_free(0)
+
+
+def _book_in(tools: BookingTools, session_id: str, flight_id: str) -> str:
+    token = current_session_id.set(session_id)
+    try:
+        return tools.book_flights([flight_id]).booking_id
+    finally:
+        current_session_id.reset(token)
+
+
+def _bookings_of(tools: BookingTools, session_id: str) -> list[str]:
+    token = current_session_id.set(session_id)
+    try:
+        return [booking.booking_id for booking in tools.get_my_bookings()]
+    finally:
+        current_session_id.reset(token)
+
+
+def test_sessions_have_isolated_reservations() -> None:
+    tools = BookingTools()
+    flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+    first = _book_in(tools, "thread-a", flight_id)
+    second = _book_in(tools, "thread-b", flight_id)
+    assert first != second
+    assert _bookings_of(tools, "thread-a") == [first]
+    assert _bookings_of(tools, "thread-b") == [second]
+
+
+def test_eviction_drops_in_memory_bookings_only(tmp_path: Path) -> None:
+    # With no idle time allowed, using one session evicts every other
+    in_memory = BookingTools(session_idle_timeout=0)
+    store = SqliteReservationStore(tmp_path / "reservations.db")
+    durable = BookingTools(session_idle_timeout=0, reservation_store=store)
+    for tools in (in_memory, durable):
+        flight_id = tools.search_flights("SFO", "JFK", "2025-11-12").flights[0].id
+        booking_id = _book_in(tools, "thread-a", flight_id)
+        _book_in(tools, "thread-b", flight_id)
+        assert _bookings_of(tools, "thread-a") == ([] if tools is in_memory else [booking_id])
+    store.close()